@@ -37,6 +37,8 @@ class AATextRenderer:
         self._height_4x = ascent + descent
         self._height = max(1, round(self._height_4x / SCALE))
         self._cache: dict[str, Image.Image] = {}
+        # fit() results by (text, max_width); screens re-fit every frame
+        self._fit_cache: dict[tuple[str, int], str] = {}
 
     def render(self, text: str) -> Image.Image:
         """Grayscale ('L') image of text at 1x scale; cached per string"""
@@ -54,16 +56,27 @@ class AATextRenderer:
         return img
 
     def measure(self, text: str) -> int:
-        """Rendered width of text in 1x pixels"""
-        return self.render(text).width
+        """Rendered width of text in 1x pixels, from the font's advance
+        alone (no rasterizing or downsampling)"""
+        img = self._cache.get(text)
+        if img is not None:
+            return img.width
+        return max(1, round(max(1, int(self._font.getlength(text))) / SCALE))
 
     def fit(self, text: str, max_width: int) -> str:
         """Trim trailing characters until text fits in max_width pixels"""
         if max_width <= 0:
             return ''
-        while text and self.measure(text) > max_width:
-            text = text[:-1].rstrip()
-        return text
+        key = (text, max_width)
+        fitted = self._fit_cache.get(key)
+        if fitted is None:
+            fitted = text
+            while fitted and self.measure(fitted) > max_width:
+                fitted = fitted[:-1].rstrip()
+            if len(self._fit_cache) >= CACHE_MAX:
+                self._fit_cache.clear()
+            self._fit_cache[key] = fitted
+        return fitted
 
 
 class MonoAATextRenderer:
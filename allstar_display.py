@@ -7,7 +7,7 @@ import time
 import pendulum
 import requests
 import statsapi
-from PIL import Image
+from PIL import Image, ImageDraw
 from typing import TYPE_CHECKING, Any
 
 from scoreboard_config import (
@@ -81,6 +81,11 @@ class AllStarDisplay:
         self._derby_cached_at: float = 0.0
         self._derby_prev_hrs: dict[str, int] = {}
         self._derby_burst: tuple[float, int] | None = None
+        # Static live-screen layer (league tiles + stars), built once
+        self._league_tiles: Image.Image | None = None
+        # Live-screen backgrounds with out dots and bases drawn, keyed by
+        # (outs, occupied bases); at most 32 of them
+        self._diamond_frames: dict[tuple[int, tuple[bool, ...]], Image.Image] = {}
 
     # ------------------------------------------------------------ data
 
@@ -498,7 +503,6 @@ class AllStarDisplay:
         start = time.time()
 
         while time.time() - start < duration:
-            self.manager.clear_canvas()
             self.manager.set_image(background, 0, 0)
 
             tick = time.time() - start
@@ -568,7 +572,6 @@ class AllStarDisplay:
                         self._derby_burst = (time.time(), row_y - 2)
                     self._derby_prev_hrs[hitter['name']] = hitter['hrs']
 
-            m.clear_canvas()
             m.set_image(background, 0, 0)
 
             m.draw_text('tiny_bold', 2, 8, DARK_BG, 'HR DERBY')
@@ -640,18 +643,24 @@ class AllStarDisplay:
         scroll_x = float(DisplayConfig.MATRIX_COLS)
         background = self._derby_scene_background(baseballs=False)
         start = time.time()
+        # The bracket is only re-parsed when the poll returns a new payload
+        parsed_from: dict[str, Any] | None = None
+        m = self.manager
 
         while time.time() - start < duration:
             data = self.fetch_derby_data()
             if not data:
                 return
-            state = self._parse_derby(data)
-            champ = state['champion']
-            if not champ:
-                return
-            m = self.manager
+            if data is not parsed_from:
+                parsed_from = data
+                state = self._parse_derby(data)
+                champ = state['champion']
+                if not champ:
+                    return
+                hr_line = f"{champ['hrs']} HR"
+                ticker = '  *  '.join(state['results'])
+                ticker_width = len(ticker) * Fonts.CHAR_WIDTH_MICRO
 
-            m.clear_canvas()
             m.set_image(background, 0, 0)
 
             m.draw_text('tiny_bold', 2, 8, DARK_BG, 'HR DERBY')
@@ -670,14 +679,11 @@ class AllStarDisplay:
                 'tiny_bold',
                 self._center_x(champ['name'], Fonts.CHAR_WIDTH_TINY),
                 31, Colors.WHITE, champ['name'])
-            hr_line = f"{champ['hrs']} HR"
             m.draw_text(
                 'micro', self._center_x(hr_line, Fonts.CHAR_WIDTH_MICRO),
                 39, (150, 150, 150), hr_line)
 
-            if state['results']:
-                ticker = '  *  '.join(state['results'])
-                ticker_width = len(ticker) * Fonts.CHAR_WIDTH_MICRO
+            if ticker:
                 m.draw_text('micro', int(scroll_x), 47,
                             Colors.WHITE, ticker)
                 scroll_x -= 1
@@ -707,10 +713,8 @@ class AllStarDisplay:
         start = time.time()
 
         while time.time() - start < duration:
-            self.manager.clear_canvas()
             self.manager.fill_canvas(*DARK_BG)
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, 0, *GOLD)
+            self.manager.fill_rect(0, 0, DisplayConfig.MATRIX_COLS, 1, GOLD)
 
             title = 'ALL-STAR GAME'
             self.manager.draw_text(
@@ -769,46 +773,56 @@ class AllStarDisplay:
 
     def _draw_league_tiles(self) -> Image.Image:
         """Base image mirroring the live-game layout: league tiles in the
-        16px logo column, white score boxes, dark info panel."""
+        16px logo column, white score boxes, dark info panel. Built once;
+        callers get the cached image and must copy before drawing on it."""
+        if self._league_tiles is not None:
+            return self._league_tiles
         base = Image.new('RGB', (96, 48))
-        px = base.load()
-        for y in range(0, 15):
-            for x in range(0, 16):
-                px[x, y] = AL_RED
-        for y in range(16, 31):
-            for x in range(0, 16):
-                px[x, y] = NL_BLUE
-        for x in range(17, 32):
-            for y in range(0, 31):
-                px[x, y] = (255, 255, 255) if y != 15 else (0, 0, 0)
-        for x in range(32, 96):
-            for y in range(0, 31):
-                px[x, y] = PANEL_BG
+        base.paste(AL_RED, (0, 0, 16, 15))
+        base.paste(NL_BLUE, (0, 16, 16, 31))
+        base.paste((255, 255, 255), (17, 0, 32, 31))
+        base.paste((0, 0, 0), (17, 15, 32, 16))
+        base.paste(PANEL_BG, (32, 0, 96, 31))
+        draw = ImageDraw.Draw(base)
+        for x, y in ((13, 3), (13, 19)):
+            draw.point([(x, y), (x + 1, y), (x - 1, y), (x, y + 1),
+                        (x, y - 1)], fill=GOLD)
+        self._league_tiles = base
         return base
 
-    def _draw_star(self, x: int, y: int) -> None:
-        for dx, dy in ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)):
-            self.manager.draw_pixel(x + dx, y + dy, *GOLD)
-
-    def _draw_bases(self, cx: int, cy: int, bases: dict[str, bool]) -> None:
+    @staticmethod
+    def _draw_bases(draw: ImageDraw.ImageDraw, cx: int, cy: int,
+                    bases: dict[str, bool]) -> None:
         spots = {'second': (cx, cy - 7), 'first': (cx + 7, cy),
                  'third': (cx - 7, cy)}
         for name, (bx, by) in spots.items():
             color = Colors.YELLOW if bases[name] else (70, 70, 90)
-            for dy in range(-3, 4):
-                half = 3 - abs(dy)
-                for dx in range(-half, half + 1):
-                    self.manager.draw_pixel(bx + dx, by + dy, *color)
+            draw.polygon([(bx, by - 3), (bx + 3, by), (bx, by + 3),
+                          (bx - 3, by)], fill=color)
+
+    def _diamond_frame(self, outs: int, bases: dict[str, bool]) -> Image.Image:
+        """League tiles plus out dots and base diamonds, rasterized once
+        per outs/runners combination"""
+        key = (outs, tuple(bases[name] for name in ('first', 'second', 'third')))
+        frame = self._diamond_frames.get(key)
+        if frame is None:
+            frame = self._draw_league_tiles().copy()
+            draw = ImageDraw.Draw(frame)
+            for i in range(3):
+                color = (255, 60, 60) if i < outs else (70, 70, 90)
+                draw.rectangle((39 + i * 7, 22, 41 + i * 7, 24), fill=color)
+            self._draw_bases(draw, 80, 20, bases)
+            self._diamond_frames[key] = frame
+        return frame
 
     def _render_live_frame(self, state: dict) -> None:
         m = self.manager
-        m.clear_canvas()
-        m.set_image(self._draw_league_tiles(), 0, 0)
+        # Out dots and base diamonds go into the frame image so the whole
+        # static part of the screen is one blit
+        m.set_image(self._diamond_frame(state['outs'], state['bases']), 0, 0)
 
         m.draw_text('tiny_bold', 3, 11, Colors.WHITE, 'AL')
         m.draw_text('tiny_bold', 3, 27, Colors.WHITE, 'NL')
-        self._draw_star(13, 3)
-        self._draw_star(13, 19)
 
         for runs, y in ((state['away_runs'], 11), (state['home_runs'], 27)):
             text = str(runs)
@@ -825,19 +839,11 @@ class AllStarDisplay:
             inning_line = (
                 f"{state['inning_state'][:3].upper()} {state['inning']}")
             m.draw_text('tiny', 38, 18, Colors.WHITE, inning_line)
-        for i in range(3):
-            color = (255, 60, 60) if i < state['outs'] else (70, 70, 90)
-            for dx in range(3):
-                for dy in range(3):
-                    m.draw_pixel(39 + i * 7 + dx, 22 + dy, *color)
-        self._draw_bases(80, 20, state['bases'])
 
         name = state['batter_name'].upper()
         if name:
             if state['batter_is_cub'] and int(time.time()) % 4 < 2:
-                for y in range(33, 48):
-                    for x in range(0, 96):
-                        m.draw_pixel(x, y, *Colors.YELLOW)
+                m.fill_rect(0, 33, 96, 48, Colors.YELLOW)
                 banner = f"{self.team.short_name.upper()} STAR AT BAT"
                 m.draw_text(
                     'micro', self._center_x(banner, Fonts.CHAR_WIDTH_MICRO),
@@ -865,27 +871,24 @@ class AllStarDisplay:
         al_color = Colors.WHITE if away > home else DIM_GRAY
         nl_color = Colors.WHITE if home > away else DIM_GRAY
 
-        start = time.time()
-        while time.time() - start < duration:
-            self.manager.clear_canvas()
-            self.manager.fill_canvas(*DARK_BG)
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, 0, *GOLD)
-
-            title = 'ALL-STAR GAME'
-            self.manager.draw_text(
-                'tiny_bold', self._center_x(title, Fonts.CHAR_WIDTH_TINY),
-                10, GOLD, title)
-            self.manager.draw_text(
-                'tiny_bold', self._center_x('FINAL', Fonts.CHAR_WIDTH_TINY),
-                21, Colors.WHITE, 'FINAL')
-            self.manager.draw_text('tiny_bold', 18, 34, al_color,
-                                   f'AL {away}')
-            self.manager.draw_text('tiny_bold', 54, 34, nl_color,
-                                   f'NL {home}')
+        # Nothing on the final screen moves: draw it once and hold it
+        self.manager.fill_canvas(*DARK_BG)
+        self.manager.fill_rect(0, 0, DisplayConfig.MATRIX_COLS, 1, GOLD)
 
-            self.manager.swap_canvas()
-            time.sleep(0.1)
+        title = 'ALL-STAR GAME'
+        self.manager.draw_text(
+            'tiny_bold', self._center_x(title, Fonts.CHAR_WIDTH_TINY),
+            10, GOLD, title)
+        self.manager.draw_text(
+            'tiny_bold', self._center_x('FINAL', Fonts.CHAR_WIDTH_TINY),
+            21, Colors.WHITE, 'FINAL')
+        self.manager.draw_text('tiny_bold', 18, 34, al_color,
+                               f'AL {away}')
+        self.manager.draw_text('tiny_bold', 54, 34, nl_color,
+                               f'NL {home}')
+
+        self.manager.swap_canvas()
+        time.sleep(duration)
 
         # Force the next asg_is_live() to re-check the schedule so the
         # takeover loop exits promptly after the final screen.
@@ -493,7 +493,6 @@ class BearsDisplay:
                 win_gif_played = self._maybe_play_win_celebration(
                     score_data, win_gif_played)
 
-                self.manager.clear_canvas()
                 self._draw_sweater_header()
 
                 status = score_data['status']
@@ -588,7 +587,6 @@ class BearsDisplay:
             pass
         for _ in range(2):
             for frame, delay in zip(frames, durations):
-                self.manager.clear_canvas()
                 self.manager.set_image(frame, 0, 0)
                 self.manager.swap_canvas()
                 time.sleep(delay)
@@ -636,7 +634,6 @@ class BearsDisplay:
         x = max(0, (96 - len(message) * Fonts.CHAR_WIDTH_SMALL) // 2)
 
         for i in range(8):
-            self.manager.clear_canvas()
             self._draw_sweater_header()
             color = self.ACCENT if i % 2 == 0 else self.TEXT_WHITE
             self.manager.draw_text('small_bold', x, 32, color, message)
@@ -763,7 +760,6 @@ class BearsDisplay:
             week_line = ' '.join(parts)
 
             while time.time() - start_time < duration:
-                self.manager.clear_canvas()
                 self._draw_sweater_header()
 
                 if use_logos:
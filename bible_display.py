@@ -69,28 +69,20 @@ class BibleDisplay:
         return None
 
     def _create_bible_background(self) -> Image.Image:
-        """Pre-generate Bible background image for performance"""
+        """Pre-generate the Bible background with the icon and separator
+        line baked in, so each frame is one blit instead of a draw_pixel
+        call per icon pixel"""
         img = Image.new("RGB", (96, 48), self.BIBLE_NAVY)
+        if self.bible_icon:
+            # Only the solid part of the icon shows (alpha above half)
+            mask = self.bible_icon.getchannel('A').point(
+                lambda a: 255 if a > 128 else 0)
+            img.paste(self.bible_icon, (10, 2), mask)
+        # Subtle blue-gray separator line below the header area
+        img.paste((60, 60, 100), (0, 27, 96, 28))
         print("Bible background cached")
         return img
 
-    def _draw_icon(self, x: int, y: int, icon: Image.Image) -> None:
-        """Draw an icon at the specified position"""
-        try:
-            for py in range(icon.height):
-                for px in range(icon.width):
-                    pixel = icon.getpixel((px, py))
-                    if len(pixel) == 4:
-                        r, g, b, a = pixel
-                        if a > 128:
-                            self.manager.draw_pixel(x + px, y + py, r, g, b)
-                    else:
-                        r, g, b = pixel[:3]
-                        if (r, g, b) != (0, 0, 0):
-                            self.manager.draw_pixel(x + px, y + py, r, g, b)
-        except Exception as e:
-            print(f"Error drawing icon: {e}")
-
     def _load_bible_verses(self) -> list[dict[str, str]]:
         """Load Bible verses from JSON file"""
         verses_path = '/home/pi/bible_verses.json'
@@ -168,10 +160,9 @@ class BibleDisplay:
         # Use pre-generated cached background for performance
         self.manager.set_image(self._bible_bg, 0, 0)
 
-        # Draw Bible icon on the left if available (shifted right 8 pixels)
+        # Bible icon (baked into the background) sits on the left
         icon_width = 0
         if self.bible_icon:
-            self._draw_icon(10, 2, self.bible_icon)
             icon_width = self.bible_icon.width + 4
 
         # Calculate text positioning based on icon (shifted right 8 pixels)
@@ -183,10 +174,6 @@ class BibleDisplay:
         # Draw "THE DAY" on second line (shifted down 4, right 8)
         self.manager.draw_text('small_bold', text_start_x, 23, self.BIBLE_GOLD, 'THE DAY')
 
-        # Draw subtle separator line below header area (shifted down 3)
-        for x in range(96):
-            self.manager.draw_pixel(x, 27, 60, 60, 100)  # Subtle blue-gray line
-
     def _get_display_date(self) -> date:
         """Get the 'display date' for verse selection.
 
@@ -234,8 +221,6 @@ class BibleDisplay:
 
         while time.time() - start_time < duration:
             try:
-                self.manager.clear_canvas()
-
                 # Draw the Bible header
                 self._draw_bible_header()
 
@@ -269,8 +254,6 @@ class BibleDisplay:
 
     def display_bible_loading(self, message: str = "LOADING VERSES...") -> None:
         """Display loading message with Bible header"""
-        self.manager.clear_canvas()
-
         # Draw header
         self._draw_bible_header()
 
@@ -286,10 +269,9 @@ class BibleDisplay:
         # Use pre-generated cached background for performance
         self.manager.set_image(self._bible_bg, 0, 0)
 
-        # Draw Bible icon on the left if available (shifted right 8 pixels)
+        # Bible icon (baked into the background) sits on the left
         icon_width = 0
         if self.bible_icon:
-            self._draw_icon(10, 2, self.bible_icon)
             icon_width = self.bible_icon.width + 4
 
         # Calculate text positioning based on icon (shifted right 8 pixels)
@@ -301,10 +283,6 @@ class BibleDisplay:
         # Draw "FACTS" on second line
         self.manager.draw_text('small_bold', text_start_x, 23, self.BIBLE_GOLD, 'FACTS')
 
-        # Draw subtle separator line below header area
-        for x in range(96):
-            self.manager.draw_pixel(x, 27, 60, 60, 100)  # Subtle blue-gray line
-
     def display_bible_facts(self, duration: int = 120) -> None:
         """Display scrolling Bible facts with same header style as verse page"""
         start_time = time.time()
@@ -312,8 +290,6 @@ class BibleDisplay:
 
         while time.time() - start_time < duration:
             try:
-                self.manager.clear_canvas()
-
                 # Draw the Bible facts header
                 self._draw_bible_facts_header()
 
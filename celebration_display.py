@@ -62,7 +62,6 @@ class CelebrationDisplay:
     ) -> None:
         if tick is None:
             tick = time.time()
-        self.manager.clear_canvas()
         background = Image.new(
             'RGB', (DisplayConfig.MATRIX_COLS, DisplayConfig.MATRIX_ROWS),
             NIGHT_BLUE)
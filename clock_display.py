@@ -196,16 +196,14 @@ class WrigleyClockDisplay:
         """The green board mass with its white outline"""
         for y in range(BOARD_TOP, DisplayConfig.MATRIX_ROWS):
             x0, x1 = self._board_span(y)
-            for x in range(x0, x1 + 1):
-                self.manager.draw_pixel(x, y, *BOARD_GREEN)
+            self.manager.fill_rect(x0, y, x1 + 1, y + 1, BOARD_GREEN)
         for y in range(BOARD_TOP, DisplayConfig.MATRIX_ROWS):
             x0, x1 = self._board_span(y)
             self.manager.draw_pixel(x0, y, *OUTLINE_WHITE)
             self.manager.draw_pixel(x1, y, *OUTLINE_WHITE)
-        for x in range(5, 91):  # top edge
-            self.manager.draw_pixel(x, BOARD_TOP, *OUTLINE_WHITE)
-        for x in range(1, 95):  # bottom edge
-            self.manager.draw_pixel(x, 47, *OUTLINE_WHITE)
+        self.manager.fill_rect(  # top edge
+            5, BOARD_TOP, 91, BOARD_TOP + 1, OUTLINE_WHITE)
+        self.manager.fill_rect(1, 47, 95, 48, OUTLINE_WHITE)  # bottom edge
 
     def _draw_clock_housing(self, now: pendulum.DateTime) -> None:
         """The round clock rising from the top of the board"""
@@ -246,28 +244,23 @@ class WrigleyClockDisplay:
             'ultra_micro', 5, 25, OUTLINE_WHITE, 'NATIONAL')
         self.manager.draw_text(
             'ultra_micro', 60, 25, OUTLINE_WHITE, 'AMERICAN')
-        for x in range(4, 37):  # rules under the league headers
-            self.manager.draw_pixel(x, 27, *GRID_GREEN)
-        for x in range(60, 93):
-            self.manager.draw_pixel(x, 27, *GRID_GREEN)
+        # Rules under the league headers
+        self.manager.fill_rect(4, 27, 37, 28, GRID_GREEN)
+        self.manager.fill_rect(60, 27, 93, 28, GRID_GREEN)
 
         # Inning grid columns on the right of each panel
         for grid_x in (22, 26, 30, 34):
-            for y in range(28, 39):
-                self.manager.draw_pixel(grid_x, y, *GRID_GREEN)
+            self.manager.fill_rect(grid_x, 28, grid_x + 1, 39, GRID_GREEN)
         for grid_x in (78, 82, 86, 90):
-            for y in range(28, 47):
-                self.manager.draw_pixel(grid_x, y, *GRID_GREEN)
+            self.manager.fill_rect(grid_x, 28, grid_x + 1, 47, GRID_GREEN)
 
         # Team name rows as painted dashes
         for i, width in enumerate(NL_ROWS):
             y = 29 + i * 2
-            for x in range(4, 4 + width):
-                self.manager.draw_pixel(x, y, *NAME_WHITE)
+            self.manager.fill_rect(4, y, 4 + width, y + 1, NAME_WHITE)
         for i, width in enumerate(AL_ROWS):
             y = 29 + i * 2
-            for x in range(60, 60 + width):
-                self.manager.draw_pixel(x, y, *NAME_WHITE)
+            self.manager.fill_rect(60, y, 60 + width, y + 1, NAME_WHITE)
 
         for x, y in NL_SCORE_DOTS:
             self.manager.draw_pixel(x, y, *SCORE_WHITE)
@@ -275,8 +268,7 @@ class WrigleyClockDisplay:
             self.manager.draw_pixel(x, y, *SCORE_WHITE)
 
         # The red stripe over the Cubs line, then the Cubs themselves
-        for x in range(3, 38):
-            self.manager.draw_pixel(x, 40, *RED_LINE)
+        self.manager.fill_rect(3, 40, 38, 41, RED_LINE)
         self.manager.draw_text('ultra_micro', 4, 47, Colors.YELLOW, 'CUBS')
 
     def _draw_center_column(self, now: pendulum.DateTime) -> None:
@@ -290,8 +282,7 @@ class WrigleyClockDisplay:
 
         # The VIS / HITS / CUBS lamps as three yellow ticks
         for x0, x1 in ((39, 41), (44, 47), (50, 53)):
-            for x in range(x0, x1 + 1):
-                self.manager.draw_pixel(x, 45, *Colors.YELLOW)
+            self.manager.fill_rect(x0, 45, x1 + 1, 46, Colors.YELLOW)
 
     def _draw_scoreboard(self, now: pendulum.DateTime) -> None:
         """The full green board: shell, clock, league panels, center column"""
@@ -321,7 +312,6 @@ class WrigleyClockDisplay:
         condition, sunrise, sunset = self._current_weather()
         phase = self._sky_phase(now.timestamp(), sunrise, sunset)
 
-        self.manager.clear_canvas()
         self._draw_sky(phase, condition)
         self._draw_weather_effects(phase, condition, tick)
         self._draw_scoreboard(now)
@@ -61,20 +61,17 @@ class TeamHistoryDisplay:
 
     def _draw_entry_frame(self, entry: dict[str, Any], date_label: str = '') -> None:
         """Marquee-style card for one historical moment"""
-        self.manager.clear_canvas()
         background = Image.new(
             'RGB', (DisplayConfig.MATRIX_COLS, DisplayConfig.MATRIX_ROWS),
             contrast_background(self.team))
-        self.manager.set_image(background, 0, 0)
 
         # Marquee red band: beveled edges, gold trim, the screen title
         for y in range(0, 9):
             row_color = (MARQUEE_RED_LIGHT if y == 0
                          else MARQUEE_RED_DARK if y == 8 else MARQUEE_RED)
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, y, *row_color)
-        for x in range(DisplayConfig.MATRIX_COLS):
-            self.manager.draw_pixel(x, 9, *TRIM_GOLD)
+            background.paste(row_color, (0, y, DisplayConfig.MATRIX_COLS, y + 1))
+        background.paste(TRIM_GOLD, (0, 9, DisplayConfig.MATRIX_COLS, 10))
+        self.manager.set_image(background, 0, 0)
         title = f'{self.team.short_name.upper()} HISTORY'
         title_x = (DisplayConfig.MATRIX_COLS - len(title) * 4) // 2
         self.manager.draw_text('micro', title_x, 7, Colors.WHITE, title)
@@ -95,10 +92,10 @@ class TeamHistoryDisplay:
         header_x = (DisplayConfig.MATRIX_COLS - header_w) // 2
         self.manager.draw_text(
             font, header_x, header_baseline, Colors.YELLOW, header)
-        for x in range(6, header_x - 3):
-            self.manager.draw_pixel(x, rule_y, *TRIM_GOLD)
-        for x in range(header_x + header_w + 2, DisplayConfig.MATRIX_COLS - 6):
-            self.manager.draw_pixel(x, rule_y, *TRIM_GOLD)
+        self.manager.fill_rect(6, rule_y, header_x - 3, rule_y + 1, TRIM_GOLD)
+        self.manager.fill_rect(
+            header_x + header_w + 2, rule_y, DisplayConfig.MATRIX_COLS - 6,
+            rule_y + 1, TRIM_GOLD)
 
         for line, baseline in zip(lines, baselines):
             line_x = (DisplayConfig.MATRIX_COLS - len(line) * 4) // 2
@@ -20,6 +20,19 @@ from aa_text import find_ttf
 if TYPE_CHECKING:
     from scoreboard_manager import ScoreboardManager
 
+# Monogram badge fonts by pixel size; None when no TTF is installed
+_badge_fonts: dict[int, ImageFont.FreeTypeFont | None] = {}
+
+
+def _badge_font(size: int) -> ImageFont.FreeTypeFont | None:
+    """The badge TTF at size, located and parsed once rather than for
+    every new airline"""
+    if size not in _badge_fonts:
+        ttf_path = find_ttf(Fonts.AA_TTF_CANDIDATES)
+        _badge_fonts[size] = (
+            ImageFont.truetype(ttf_path, size) if ttf_path else None)
+    return _badge_fonts[size]
+
 
 class FlightDisplay:
     """Handles flight tracking information display"""
@@ -551,10 +564,10 @@ class FlightDisplay:
         code = self.ICAO_TO_IATA.get(prefix, prefix[:2])[:2]
         color = self.MONOGRAM_COLORS[
             sum(ord(c) for c in prefix) % len(self.MONOGRAM_COLORS)]
-        ttf_path = find_ttf(Fonts.AA_TTF_CANDIDATES)
-        if ttf_path:
+        edge = self.LOGO_SIZE * 4
+        font = _badge_font(int(edge * 0.55))
+        if font is not None:
             # Draw at 4x and downsample: smooth letters and corners
-            edge = self.LOGO_SIZE * 4
             big = Image.new('RGB', (edge, edge))
             draw = ImageDraw.Draw(big)
             try:
@@ -562,7 +575,6 @@ class FlightDisplay:
                                        radius=edge // 4, fill=color)
             except AttributeError:  # Pillow < 8.2
                 draw.rectangle((0, 0, edge - 1, edge - 1), fill=color)
-            font = ImageFont.truetype(ttf_path, int(edge * 0.55))
             draw.text((edge // 2, int(edge * 0.475)), code, font=font,
                       anchor='mm', fill=(255, 255, 255))
             return big.resize((self.LOGO_SIZE, self.LOGO_SIZE), Image.LANCZOS)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import statsapi
 from PIL import Image, ImageDraw
 from rgbmatrix import graphics
@@ -16,6 +17,12 @@ from teams import get_active_team
 if TYPE_CHECKING:
     from scoreboard_manager import ScoreboardManager
 
+# Statuses that end the next-game screen. Delays and postponements carry a
+# reason ('Delayed Start: Rain'), so those are matched by prefix
+_TRANSITION_STATUSES: frozenset[str] = frozenset(
+    ('Warmup', 'Pre-Game', 'In Progress'))
+_TRANSITION_PREFIXES: tuple[str, ...] = ('Delayed', 'Postpon')
+
 
 class GameStateHandler:
     """Handles display for different game states"""
@@ -26,7 +33,16 @@ class GameStateHandler:
         self.team = get_active_team()
         self.scroll_position: int = 96  # For scrolling text
         self.rain_drops: list[dict[str, Any]] = []  # Lazy-initialized
+        self._stormy_bg: Image.Image | None = None  # Lazy-initialized
+        # Division standings records, refetched every STANDINGS_CACHE_TTL
+        self._standings_cache: list[dict[str, Any]] | None = None
+        self._standings_cached_at: float = 0.0
+        # Rendered standings screen with the records it was drawn from
+        self._standings_frame: tuple[list[dict[str, Any]], Image.Image] | None = None
         self.playoff_race: PlayoffRaceDisplay = PlayoffRaceDisplay(scoreboard_manager)
+        # Single worker for lineup refreshes, started on first use, so the
+        # pregame scroll never stalls on the MLB API
+        self._lineup_pool: ThreadPoolExecutor | None = None
 
     def display_warmup(
         self,
@@ -77,14 +93,8 @@ class GameStateHandler:
     def _get_opponent_name(self, gameid: int) -> str:
         """Fetch the opposing team's name for a given game."""
         try:
-            game_info: dict[str, Any] = retry_api_call(
-                statsapi.get, 'game', {'gamePk': gameid}
-            )
-            home = game_info['gameData']['teams']['home']
-            away = game_info['gameData']['teams']['away']
-            if home['abbreviation'] == self.team.abbrev:
-                return away['name']
-            return home['name']
+            game_info: dict[str, Any] = self.manager.get_game_info(gameid)
+            return self.manager.get_opponent(game_info)['name']
         except Exception:
             return "OPPONENT"
 
@@ -124,27 +134,33 @@ class GameStateHandler:
                 'speed': random.uniform(1.8, 3.0)
             })
 
-    def _draw_stormy_background(self) -> None:
-        """Paint a dark stormy-blue gradient background across the matrix"""
-        for y in range(DisplayConfig.MATRIX_ROWS):
-            # Interpolate from (5, 15, 40) top to (10, 25, 60) bottom
-            t = y / float(DisplayConfig.MATRIX_ROWS - 1)
-            r = int(5 + t * 5)
-            g = int(15 + t * 10)
-            b = int(40 + t * 20)
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, y, r, g, b)
-
-    def _animate_rain_drops(self) -> None:
-        """Advance and draw rain drops (2-pixel streaks)"""
+    def _stormy_background(self) -> Image.Image:
+        """Dark stormy-blue gradient covering the matrix (built once)"""
+        if self._stormy_bg is None:
+            self._stormy_bg = Image.new(
+                'RGB', (DisplayConfig.MATRIX_COLS, DisplayConfig.MATRIX_ROWS))
+            draw = ImageDraw.Draw(self._stormy_bg)
+            for y in range(DisplayConfig.MATRIX_ROWS):
+                # Interpolate from (5, 15, 40) top to (10, 25, 60) bottom
+                t = y / float(DisplayConfig.MATRIX_ROWS - 1)
+                r = int(5 + t * 5)
+                g = int(15 + t * 10)
+                b = int(40 + t * 20)
+                draw.line((0, y, DisplayConfig.MATRIX_COLS - 1, y), fill=(r, g, b))
+        return self._stormy_bg
+
+    def _animate_rain_drops(self, frame: Image.Image) -> None:
+        """Advance the rain drops and draw them (2-pixel streaks) into
+        the frame image"""
         import random
+        pixels = frame.load()
         for drop in self.rain_drops:
             y = int(drop['y'])
             x = int(drop['x'])
             if 0 <= y < DisplayConfig.MATRIX_ROWS:
-                self.manager.draw_pixel(x, y, 180, 200, 220)
+                pixels[x, y] = (180, 200, 220)
             if 0 <= y + 1 < DisplayConfig.MATRIX_ROWS:
-                self.manager.draw_pixel(x, y + 1, 160, 180, 200)
+                pixels[x, y + 1] = (160, 180, 200)
             drop['y'] += drop['speed']
             if drop['y'] > DisplayConfig.MATRIX_ROWS:
                 drop['y'] = random.randint(-8, -1)
@@ -176,56 +192,76 @@ class GameStateHandler:
         # Terminal statuses — exit the loop when status transitions to these
         resume_statuses = {'In Progress', 'Warmup', 'Pre-Game', 'Final', 'Game Over'}
 
-        refresh_counter: int = 0
-        refresh_interval: int = 200  # Re-check status every ~200 frames
+        # Re-check status on a clock, independent of the frame rate
+        next_status_check: float = (
+            time.monotonic() + GameConfig.PREGAME_STATUS_CHECK_INTERVAL)
         passes_completed: int = 0
+        # Scroll text width; recomputed only when the lineup is refetched
+        text_length: int = len(scroll_text) * 7
+        pending_lineup: Future[str] | None = None
 
         # Precompute centered X for label (use medium_bold: ~9px per char)
         label_x: int = max(0, (DisplayConfig.MATRIX_COLS - len(label) * 9) // 2)
 
-        while True:
-            self.manager.clear_canvas()
-            self._draw_stormy_background()
-            self._animate_rain_drops()
-
-            # Divider line above label
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, 14, 255, 255, 255)
+        # Status label and start time (classic bitmap fonts on this screen)
+        labels = [
+            ('medium_bold', label_x, 12, Colors.BRIGHT_YELLOW, label),
+            ('small', 17, 24, Colors.WHITE, 'START TIME'),
+            ('small', 36, 32, Colors.WHITE, start_time),
+        ]
+        # The divider and labels never change: render them once and
+        # composite the layer over each rain frame (the drops pass behind)
+        overlay: Image.Image | None = self.manager.text_layer(labels)
+        if overlay is not None:
+            ImageDraw.Draw(overlay).line(
+                (0, 14, DisplayConfig.MATRIX_COLS - 1, 14),
+                fill=(*Colors.WHITE, 255))
+
+        # One framebuffer for the whole screen, refilled from the gradient
+        # each frame instead of copying it into a new image
+        background: Image.Image = self._stormy_background()
+        frame: Image.Image = Image.new('RGB', background.size)
 
-            # Status label (classic bitmap fonts on this screen)
-            self.manager.draw_text(
-                'medium_bold', label_x, 12, Colors.BRIGHT_YELLOW, label,
-                smooth=False)
-
-            # Start time info
-            self.manager.draw_text('small', 17, 24, Colors.WHITE,
-                                   'START TIME', smooth=False)
-            self.manager.draw_text('small', 36, 32, Colors.WHITE,
-                                   start_time, smooth=False)
+        while True:
+            # The stormy gradient covers the whole panel: no clear first
+            frame.paste(background, (0, 0))
+            self._animate_rain_drops(frame)
+            if overlay is not None:
+                frame.paste(overlay, (0, 0), overlay)
+            self.manager.set_image(frame, 0, 0)
+
+            if overlay is None:
+                # No PIL fonts: draw the divider and labels directly
+                self.manager.fill_rect(
+                    0, 14, DisplayConfig.MATRIX_COLS, 15, Colors.WHITE)
+                for font_name, x, y, color, text in labels:
+                    self.manager.draw_text(
+                        font_name, x, y, color, text, smooth=False)
 
             # Scroll text at bottom (lineup or custom override)
             self.scroll_position -= 1
-            text_length: int = len(scroll_text) * 7
             if self.scroll_position + text_length < 0:
                 self.scroll_position = 96
                 passes_completed += 1
                 # Refresh lineup on loop (only when not using override text)
                 if not use_override and scroll_text:
-                    scroll_text = self.manager.get_lineup(gameid)
+                    scroll_text, pending_lineup = self._next_lineup(
+                        gameid, scroll_text, pending_lineup)
+                    text_length = len(scroll_text) * 7
                 # Bail after one scroll pass when requested (cancelled, postponed)
                 if single_pass and passes_completed >= 1:
                     break
 
-            self.manager.draw_text(
-                'lineup', self.scroll_position, 45, Colors.WHITE, scroll_text,
-                smooth=False)
+            # Glyphs rasterized once per text; each frame blits the slice
+            self.manager.draw_text_strip(
+                'lineup', self.scroll_position, 45, Colors.WHITE, scroll_text)
 
             # Split-squad indicator
             if self.manager.split_squad_indicator:
                 self._draw_split_squad_indicator()
 
             self.manager.swap_canvas()
-            time.sleep(0.03)
+            self.manager.pace_frame(GameConfig.PREGAME_FRAME_TIME)
 
             # Split-squad rotation timeout
             if self.manager.split_squad_indicator:
@@ -233,9 +269,9 @@ class GameStateHandler:
                     break
 
             # Periodically check if the delay is over
-            refresh_counter += 1
-            if refresh_counter >= refresh_interval:
-                refresh_counter = 0
+            if time.monotonic() >= next_status_check:
+                next_status_check = (
+                    time.monotonic() + GameConfig.PREGAME_STATUS_CHECK_INTERVAL)
                 try:
                     game_data = self.manager.get_schedule()
                     current_status: str = game_data[game_index].get('status', '')
@@ -245,6 +281,11 @@ class GameStateHandler:
                     # If status check fails, keep showing the delay screen
                     pass
 
+        # A refresh that hasn't started has no screen left to land on; one
+        # already running finishes under get_lineup's lock
+        if pending_lineup is not None:
+            pending_lineup.cancel()
+
     def _display_pregame_base(
         self,
         status_text: str,
@@ -260,39 +301,38 @@ class GameStateHandler:
         # main router can pick the right screen
         entry_status: str = game_data[game_index]['status']
 
-        # Counter for when to refresh data (every 100 iterations instead of constantly)
-        refresh_counter: int = 0
-        refresh_interval: int = 1000  # Refresh data every 100 scroll iterations
+        # Check the status on a clock rather than every frame; the lineup
+        # refreshes separately, once per scroll pass
+        next_status_check: float = (
+            time.monotonic() + GameConfig.PREGAME_STATUS_CHECK_INTERVAL)
+
+        # Only the lineup moves; blit a snapshot of everything else each
+        # frame instead of re-filling and re-rasterizing the static text
+        static_layer, loose_labels = self._render_pregame_static(
+            status_text, bg_color, start_time)
+        text_length: int = len(lineup) * 7  # Approximate character width
+        pending_lineup: Future[str] | None = None
 
         while True:
-            self.manager.clear_canvas()
-            self.manager.fill_canvas(*bg_color)
-
-            # Draw divider line
-            for x in range(96):
-                self.manager.draw_pixel(x, 14, 255, 255, 255)
-
-            # Draw status text (classic bitmap fonts on this screen)
-            x_offset: int = 17 if status_text != "POSTPONED" else 8
-            self.manager.draw_text('medium_bold', x_offset,
-                                   12, Colors.WHITE, status_text, smooth=False)
-            self.manager.draw_text('small', 17, 24, Colors.WHITE,
-                                   'START TIME', smooth=False)
-            self.manager.draw_text('small', 36, 32, Colors.WHITE,
-                                   start_time, smooth=False)
+            self.manager.set_image(static_layer, 0, 0)
+            if loose_labels is not None:
+                # No PIL fonts: the snapshot has no text, draw it directly
+                for font_name, x, y, color, text in loose_labels:
+                    self.manager.draw_text(
+                        font_name, x, y, color, text, smooth=False)
 
             # Scroll lineup
             self.scroll_position -= 1
-            text_length: int = len(lineup) * 7  # Approximate character width
-
             if self.scroll_position + text_length < 0:
                 self.scroll_position = 96
                 # Only refresh lineup when text loops, not every frame
-                lineup = self.manager.get_lineup(gameid)
+                lineup, pending_lineup = self._next_lineup(
+                    gameid, lineup, pending_lineup)
+                text_length = len(lineup) * 7
 
-            self.manager.draw_text(
+            self.manager.draw_text_strip(
                 'lineup', self.scroll_position, 45, Colors.WHITE, lineup,
-                smooth=False)
+                bg_color)
 
             # Draw split-squad indicator if active
             if self.manager.split_squad_indicator:
@@ -301,19 +341,17 @@ class GameStateHandler:
             self.manager.swap_canvas()
 
             # Use slower scroll speed for warmup readability
-            time.sleep(0.03)
+            self.manager.pace_frame(GameConfig.PREGAME_FRAME_TIME)
 
             # Exit if in split-squad mode and it's time to switch games
             if self.manager.split_squad_indicator:
                 if time.time() >= self.manager.split_squad_switch_time:
                     break
 
-            # Increment refresh counter
-            refresh_counter += 1
-
             # Only check for status changes periodically, not every frame
-            if refresh_counter >= refresh_interval:
-                refresh_counter = 0
+            if time.monotonic() >= next_status_check:
+                next_status_check = (
+                    time.monotonic() + GameConfig.PREGAME_STATUS_CHECK_INTERVAL)
                 try:
                     game_data = self.manager.get_schedule()
                     if game_data[game_index]['status'] != entry_status:
@@ -322,6 +360,61 @@ class GameStateHandler:
                     # If status check fails, keep showing the pregame screen
                     pass
 
+        # A refresh that hasn't started has no screen left to land on; one
+        # already running finishes under get_lineup's lock
+        if pending_lineup is not None:
+            pending_lineup.cancel()
+
+    def _next_lineup(
+        self, gameid: int, lineup: str, pending: Future[str] | None
+    ) -> tuple[str, Future[str] | None]:
+        """Lineup text for the next scroll pass, and the refresh in flight.
+
+        The lineup is fetched on a worker thread during a pass and swapped
+        in at the following wrap, so the scroll keeps its frame rate while
+        the feed or people lookups are slow. The text shown is at most one
+        pass behind; a failed fetch keeps the current text.
+        """
+        if pending is not None:
+            if not pending.done():
+                return lineup, pending
+            try:
+                lineup = pending.result()
+            except Exception as e:
+                print(f"Lineup refresh failed: {e}")
+        if self._lineup_pool is None:
+            self._lineup_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='lineup')
+        return lineup, self._lineup_pool.submit(self.manager.get_lineup, gameid)
+
+    def _render_pregame_static(
+        self, status_text: str, bg_color: RGBColor, start_time: str
+    ) -> tuple[Image.Image, list[tuple[str, int, int, RGBColor, str]] | None]:
+        """Draw the fixed part of the pregame screen once and snapshot it.
+
+        Also returns the labels the loop must still draw every frame: all
+        of them when the fonts have no PIL conversion (the snapshot then
+        holds only the background and divider), else None.
+        """
+        self.manager.fill_canvas(*bg_color)
+
+        # Draw divider line
+        self.manager.fill_rect(0, 14, 96, 15, Colors.WHITE)
+
+        # Status text and start time (classic bitmap fonts on this screen)
+        x_offset: int = 17 if status_text != "POSTPONED" else 8
+        labels = [
+            ('medium_bold', x_offset, 12, Colors.WHITE, status_text),
+            ('small', 17, 24, Colors.WHITE, 'START TIME'),
+            ('small', 36, 32, Colors.WHITE, start_time),
+        ]
+        static_layer: Image.Image = self.manager.get_frame_copy()
+        overlay: Image.Image | None = self.manager.text_layer(labels)
+        if overlay is None:
+            return static_layer, labels
+        static_layer.paste(overlay, (0, 0), overlay)
+        return static_layer, None
+
     def _draw_split_squad_indicator(self) -> None:
         """
         Draw split-squad game indicator in top-right corner.
@@ -336,56 +429,51 @@ class GameStateHandler:
         box_y = 0
 
         # Dark background for visibility
-        for y in range(box_y, box_y + 8):
-            for x in range(box_x, DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, y, 40, 40, 40)
+        self.manager.fill_rect(
+            box_x, box_y, DisplayConfig.MATRIX_COLS, box_y + 8, (40, 40, 40))
 
         # Draw the indicator text (e.g., "1/2") in yellow
         self.manager.draw_text('micro', box_x + 1, 6, Colors.YELLOW, indicator)
 
-    def display_no_game(
-        self, game_data: list[dict[str, Any]], game_index: int,
-        cycle_content: bool = False
-    ) -> None:
-        """Display when no game is currently playing"""
+    def _next_game_text(
+        self, game_data: list[dict[str, Any]], game_index: int
+    ) -> str:
+        """Scrolling 'NEXT GAME ... vs ...  pitchers' marquee text"""
         gameid: int = game_data[game_index]['game_id']
         game_date: str = game_data[game_index]['game_date']
         game_time: str = self.manager.format_game_time(game_data, game_index)
         game_type: str = game_data[game_index].get('game_type', 'R')
 
         # Get opponent info
-        game_info: dict[str, Any] = retry_api_call(
-            statsapi.get, 'game', {'gamePk': gameid}
-        )
-        if game_info['gameData']['teams']['home']['abbreviation'] == self.team.abbrev:
-            away: str = 'away'
-        else:
-            away = 'home'
-        away_team: str = game_info['gameData']['teams'][away]['name']
+        game_info: dict[str, Any] = self.manager.get_game_info(gameid)
+        away_team: str = self.manager.get_opponent(game_info)['name']
 
-        # Create next game text
         pitchers: str = self.manager.get_pitchers(game_data, game_index, gameid)
-        if game_type in ('S', 'E'):
-            next_game_text: str = f'SPRING TRAINING {game_date[5:]} at {game_time} vs {away_team}     {pitchers}'
-        else:
-            next_game_text: str = f'NEXT GAME {game_date[5:]} at {game_time} vs {away_team}     {pitchers}'
+        label: str = 'SPRING TRAINING' if game_type in ('S', 'E') else 'NEXT GAME'
+        return f'{label} {game_date[5:]} at {game_time} vs {away_team}     {pitchers}'
 
-        # Pre-generate team gradient background (matches team Facts screen)
-        gradient_bg: Image.Image = create_team_gradient_background(
+    def display_no_game(
+        self, game_data: list[dict[str, Any]], game_index: int,
+        cycle_content: bool = False
+    ) -> None:
+        """Display when no game is currently playing"""
+        game_type: str = game_data[game_index].get('game_type', 'R')
+        next_game_text: str = self._next_game_text(game_data, game_index)
+
+        # Pre-compose the team gradient background with the marquee image
+        # (matches team Facts screen) once, as RGB, instead of every frame
+        background: Image.Image = create_team_gradient_background(
             self.team.primary_color)
+        background.paste(self.manager.game_images['marquee'], (0, 0))
+        # 9x18B is monospaced, so the width is exact without measuring
+        text_length: int = len(next_game_text) * 9
 
         # Main display loop
         while True:
-            self.manager.clear_canvas()
-
-            # Display team gradient background with marquee image (matches team Facts screen)
-            output_image: Image.Image = gradient_bg.copy()
-            output_image.paste(self.manager.game_images['marquee'], (0, 0))
-            self.manager.set_image(output_image.convert("RGB"), 0, 0)
+            self.manager.set_image(background, 0, 0)
 
             # Scroll next game text
             self.scroll_position -= 1
-            text_length: int = len(next_game_text) * 9
             if self.scroll_position + text_length < 0:
                 self.scroll_position = 96
 
@@ -411,29 +499,24 @@ class GameStateHandler:
                 game_data = self.manager.get_schedule()
                 if self._should_transition_state(game_data, game_index):
                     break
+                # Probable pitchers can be announced while we wait
+                next_game_text = self._next_game_text(game_data, game_index)
+                text_length = len(next_game_text) * 9
 
-            self.manager.draw_text(
+            self.manager.draw_text_strip(
                 'medium_bold', int(self.scroll_position),
                 self.team.marquee_scroll_baseline, Colors.YELLOW,
-                next_game_text, smooth=False)
+                next_game_text)
 
             # Draw split-squad indicator if active
             if self.manager.split_squad_indicator:
                 self._draw_split_squad_indicator()
 
             self.manager.swap_canvas()
-            # Match Cubs Facts scroll speed from config
-            try:
-                import json, os
-                _cfg_path = '/home/pi/config.json'
-                if os.path.exists(_cfg_path):
-                    with open(_cfg_path, 'r') as _f:
-                        _cfg = json.load(_f)
-                else:
-                    _cfg = {}
-            except Exception:
-                _cfg = {}
-            time.sleep(get_scroll_delay(_cfg.get('scroll_speed_cubs_facts', 5)))
+            # Match Cubs Facts scroll speed from config (mtime-cached, so
+            # a speed change from the admin page applies mid-scroll)
+            self.manager.pace_frame(get_scroll_delay(
+                load_user_config().get('scroll_speed_cubs_facts', 5)))
 
             # Exit if in split-squad mode and it's time to switch games
             if self.manager.split_squad_indicator:
@@ -453,26 +536,40 @@ class GameStateHandler:
 
     def _display_standings(self) -> None:
         """Display division standings"""
-        self.manager.clear_canvas()
-        self.manager.fill_canvas(*Colors.GREEN)
-
         # Get standings
-        standings: list[dict[str, Any]] = retry_api_call(
-            statsapi.get, 'standings', {'leagueId': TeamConfig.NL_LEAGUE_ID}
-        )['records'][1]['teamRecords']
+        standings: list[dict[str, Any]] = self._division_standings()
+
+        # The table only changes when the records are refetched; between
+        # refreshes blit the screen drawn last time
+        if self._standings_frame is None or self._standings_frame[0] is not standings:
+            self._render_standings(standings)
+            self._standings_frame = (standings, self.manager.get_frame_copy())
+        else:
+            self.manager.set_image(self._standings_frame[1], 0, 0)
+
+        self.manager.swap_canvas()
+        time.sleep(GameConfig.NO_GAME_STANDINGS_DISPLAY_TIME)
+
+    def _render_standings(self, standings: list[dict[str, Any]]) -> None:
+        """Draw the division standings table onto the canvas"""
+        self.manager.fill_canvas(*Colors.GREEN)
 
         # Draw title
         self.manager.draw_text(
             'tiny_bold', 3, 8, Colors.YELLOW, 'DIVISION STANDINGS')
 
         # Draw each team
+        abbrevs: dict[int, str] = self.manager.get_team_abbreviations()
         y_position: int = 15
         for team_record in standings:
             team_id: int = team_record['team']['id']
-            team_info: dict[str, Any] = retry_api_call(
-                statsapi.get, 'team', {'teamId': team_id}
-            )['teams'][0]
-            team_abv: str = team_info['abbreviation']
+            team_abv: str | None = abbrevs.get(team_id)
+            if team_abv is None:
+                # Store it in the cached map so later passes (until the
+                # daily refresh) don't repeat the lookup
+                team_abv = abbrevs[team_id] = retry_api_call(
+                    statsapi.get, 'team', {'teamId': team_id}
+                )['teams'][0]['abbreviation']
 
             games_back: str = team_record['gamesBack']
             if games_back == '-':
@@ -489,14 +586,33 @@ class GameStateHandler:
 
             y_position += 8
 
-        self.manager.swap_canvas()
-        time.sleep(GameConfig.NO_GAME_STANDINGS_DISPLAY_TIME)
+    def _division_standings(self) -> list[dict[str, Any]]:
+        """Division team records, cached since the standings screen shows
+        after every marquee pass; keeps the last good records if the API
+        fails"""
+        now = time.time()
+        if (self._standings_cache is not None
+                and now - self._standings_cached_at < GameConfig.STANDINGS_CACHE_TTL):
+            return self._standings_cache
+
+        try:
+            standings: list[dict[str, Any]] = retry_api_call(
+                statsapi.get, 'standings', {'leagueId': TeamConfig.NL_LEAGUE_ID}
+            )['records'][1]['teamRecords']
+        except Exception as e:
+            if self._standings_cache is None:
+                raise
+            print(f"Standings fetch failed ({e}); using cached data")
+            return self._standings_cache
+
+        self._standings_cache = standings
+        self._standings_cached_at = now
+        return standings
 
     def _display_playoff_info(
         self, game_data: list[dict[str, Any]], game_index: int
     ) -> None:
         """Display playoff series information"""
-        self.manager.clear_canvas()
         self.manager.fill_canvas(*self.team.primary_color)
 
         # Get game data
@@ -505,15 +621,10 @@ class GameStateHandler:
         series_status: str = game_data[game_index].get('series_status', '')
 
         # Get full game info
-        game_info: dict[str, Any] = retry_api_call(
-            statsapi.get, 'game', {'gamePk': gameid}
-        )
+        game_info: dict[str, Any] = self.manager.get_game_info(gameid)
 
         # Determine opponent
-        if game_info['gameData']['teams']['home']['abbreviation'] == self.team.abbrev:
-            opp_team: dict[str, Any] = game_info['gameData']['teams']['away']
-        else:
-            opp_team = game_info['gameData']['teams']['home']
+        opp_team: dict[str, Any] = self.manager.get_opponent(game_info)
 
         opp_name: str = opp_team['name']
         opp_abbr: str = opp_team['abbreviation']
@@ -591,4 +702,5 @@ class GameStateHandler:
     ) -> bool:
         """Check if we should transition to a different game state"""
         status: str = game_data[game_index]['status']
-        return status in ['Warmup', 'Pre-Game', 'In Progress', 'Delayed', 'Postponed']
+        return (status in _TRANSITION_STATUSES
+                or status.startswith(_TRANSITION_PREFIXES))
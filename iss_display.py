@@ -225,7 +225,6 @@ class ISSDisplay:
             tick = time.time()
         if self._globe_bg is None:
             self._globe_bg = self._build_globe_bg()
-        self.manager.clear_canvas()
         img = self._globe_bg.copy()
         pixels = img.load()
 
@@ -285,8 +284,6 @@ class ISSDisplay:
         """The station artwork over a starfield with its vitals alongside"""
         if tick is None:
             tick = time.time()
-        self.manager.clear_canvas()
-
         img = Image.new(
             'RGB', (DisplayConfig.MATRIX_COLS, DisplayConfig.MATRIX_ROWS))
         pixels = img.load()
@@ -3,15 +3,13 @@
 from __future__ import annotations
 
 import time
-import pendulum
-import statsapi
-from PIL import Image
+from datetime import datetime
+from PIL import Image, ImageChops
 from typing import TYPE_CHECKING, Any
 
 from scoreboard_config import (
-    Colors, Fonts, Positions, GameConfig, DisplayConfig,
+    Colors, Fonts, Positions, GameConfig, DisplayConfig, RGBColor,
     get_scroll_delay)
-from retry import retry_api_call
 from logger import get_logger
 from flight_display import FlightDisplay
 from teams import get_active_team, contrast_background
@@ -31,6 +29,51 @@ def _is_shutdown_requested() -> bool:
         return False
 
 
+def _ball_flight_path() -> tuple[tuple[int, int], ...]:
+    """Baseball positions for the run-scored flight: left to right
+    across the panel, rising a row every 5 columns after the first 5"""
+    path = []
+    run_y = 15
+    next_x = 25
+    for x in range(25, 97):
+        if x > next_x + 5:
+            next_x += 5
+            run_y -= 1
+        path.append((x, run_y))
+    return tuple(path)
+
+
+# Opponent-run storm assets (sky by lightning flash, storm cloud); they
+# don't depend on the team, so they're drawn once per process
+_storm_scene: tuple[dict[bool, Image.Image], Image.Image] | None = None
+
+
+def _storm_scene_images() -> tuple[dict[bool, Image.Image], Image.Image]:
+    """({bolt_on: sky}, cloud) for the opponent-run animation"""
+    global _storm_scene
+    if _storm_scene is None:
+        from PIL import ImageDraw
+
+        # Stormy sky gradient, darkest at the top
+        sky = Image.new("RGB", (96, 48))
+        for y in range(48):
+            shade = 10 + y // 4
+            sky.paste((shade, shade, shade + 8), (0, y, 96, y + 1))
+
+        # Puffy storm cloud built from overlapping gray lobes
+        cloud = Image.new("RGBA", (56, 14), (0, 0, 0, 0))
+        cloud_draw = ImageDraw.Draw(cloud)
+        for cx, cy, w, h, shade in ((2, 5, 20, 8, 70), (14, 1, 26, 11, 85),
+                                    (30, 4, 22, 9, 75), (10, 7, 38, 6, 60)):
+            cloud_draw.ellipse((cx, cy, cx + w, cy + h),
+                               fill=(shade, shade, shade + 10, 255))
+
+        # Lightning flash brightens the whole sky for the strike frames
+        skies = {False: sky, True: Image.eval(sky, lambda v: min(255, v + 45))}
+        _storm_scene = (skies, cloud)
+    return _storm_scene
+
+
 class LiveGameHandler:
     """Handles live game display and updates"""
 
@@ -41,9 +84,31 @@ class LiveGameHandler:
         self.cubs_score: int = 0
         self.opp_score: int = 0
         self.is_cubs_home: bool = False
+        # Schedule keys for (our score, opponent score); set once per game
+        self._score_keys: tuple[str, str] = ('away_score', 'home_score')
         self._flight_display: FlightDisplay | None = None
         self._last_inning_state: str = ''
         self._last_scrolled_description: str | None = None
+        self._base_tiles: dict[bool, Image.Image] = {}
+        # All three bases composited, by (first, second, third) occupied
+        self._base_layers: dict[tuple[bool, ...], Image.Image] = {}
+        self._batting_sprite_cache: tuple[
+            Image.Image, Image.Image, Image.Image] | None = None
+        # Logos resized for a screen, by (game_images key, size), with the
+        # source image they came from so a new game's logos invalidate them
+        self._sized_logos: dict[
+            tuple[str, tuple[int, int], int],
+            tuple[Image.Image, Image.Image]] = {}
+        # Run-scored animation backdrop and baseball, loaded on the first
+        # run and keyed by the pack's sprite path
+        self._run_scene: tuple[str, Image.Image, Image.Image] | None = None
+        # Run animation AA caption layers (and the flattened RUN SCORED
+        # banner) by name; None when there are no PIL fonts
+        self._caption_layers: dict[str, Image.Image | None] = {}
+        # Win-flag GIF frames and frame time, keyed by the pack's GIF path
+        self._celebration: tuple[str, list[Image.Image], float] | None = None
+        # Live scoreboard framebuffer, refilled from the background each frame
+        self._live_frame: Image.Image | None = None
 
     def display_game_on(
         self, game_data: list[dict[str, Any]], game_index: int, gameid: int
@@ -51,14 +116,23 @@ class LiveGameHandler:
         """Main game display loop"""
         self.is_cubs_home = (
             game_data[game_index]['home_id'] == self.team.mlb_team_id)
+        self._score_keys = (('home_score', 'away_score') if self.is_cubs_home
+                            else ('away_score', 'home_score'))
 
         # Initialize scores
-        if self.is_cubs_home:
-            self.cubs_score = game_data[game_index]['home_score']
-            self.opp_score = game_data[game_index]['away_score']
-        else:
-            self.cubs_score = game_data[game_index]['away_score']
-            self.opp_score = game_data[game_index]['home_score']
+        self.cubs_score, self.opp_score = self._team_scores(
+            game_data[game_index])
+
+        # Logos and the box layout don't change during the game: paint the
+        # static background once and only add the moving parts per frame
+        background = self._live_background(self._scoreboard_logo_rows())
+
+        # Poll slower while nothing is happening (mound visits, pitching
+        # changes, commercial breaks); any change drops back to the base rate
+        last_play_state: tuple | None = None
+        last_frame_state: tuple | None = None
+        unchanged_polls: int = 0
+        poll_delay: float = GameConfig.GAME_CHECK_DELAY
 
         while True:
             game_data = self.manager.get_schedule()
@@ -72,138 +146,57 @@ class LiveGameHandler:
             # Exit live display when the game is no longer actively being played
             # (delay/suspension/postponement/cancellation). Returning lets the
             # main loop route to the appropriate handler on the next cycle.
-            if (current_status.startswith('Delayed')
-                    or current_status.startswith('Suspend')
-                    or current_status.startswith('Postpon')
+            if (current_status.startswith(('Delayed', 'Suspend', 'Postpon'))
                     or current_status == 'Cancelled'):
                 return
 
-            # Get current game data
-            game_info = retry_api_call(statsapi.get, 'game', {'gamePk': gameid})
-            play_data = retry_api_call(statsapi.get, 'game_playByPlay', {'gamePk': gameid})
-
-            # Clear canvas
-            self.manager.clear_canvas()
+            # Get current game data. The full game feed already carries the
+            # play-by-play (liveData.plays), so one request serves both
+            game_info = self.manager.get_game_info(gameid)
+            play_data = game_info['liveData'].get('plays', {})
 
-            # Get inning state for batting indicator logic
             inning_state = game_info['liveData']['linescore']['inningState'][:3]
-
-            # Create base composite image with all background regions pre-painted
-            base_image = Image.new("RGB", (96, 48))
-            pixels = base_image.load()
-
-            # Paint black divider between logos and scores (x=16, y=0-30)
-            for y in range(0, 31):
-                pixels[16, y] = (0, 0, 0)
-
-            # Paint score boxes white (x=17-31, y=0-30) with black divider at y=15
-            for x in range(17, 32):
-                for y in range(0, 31):
-                    if y == 15:
-                        pixels[x, y] = (0, 0, 0)
-                    else:
-                        pixels[x, y] = (255, 255, 255)
-
-            # Paint right side team primary color (x=32-95, y=0-30)
-            for x in range(32, 96):
-                for y in range(0, 31):
-                    pixels[x, y] = self.team.primary_color
-
-            # Paint black divider line between logos (y=15, x=0-15)
-            for x in range(0, 16):
-                pixels[x, 15] = (0, 0, 0)
-
-            # Paint white base line (y=22, x=32-95)
-            for x in range(32, 96):
-                pixels[x, 22] = (255, 255, 255)
-
-            # Paint white vertical line at x=70 (y=0-30)
-            for y in range(0, 31):
-                pixels[70, y] = (255, 255, 255)
-
-            # Add team logos (resized to 16x15 to fill logo area edge-to-edge)
-            cubs_logo = self.manager.game_images['team'].resize((16, 15)).convert('RGBA')
-            opp_logo = self.manager.game_images['opponent'].resize((16, 15)).convert('RGBA')
-
-            # Away team on top, home team on bottom (matches Top/Bot inning)
-            if self.is_cubs_home:
-                logo_rows = [(opp_logo, (0, 0)), (cubs_logo, (0, 16))]
-            else:
-                logo_rows = [(cubs_logo, (0, 0)), (opp_logo, (0, 16))]
-
-            # Composite logos onto white background so dark logos remain visible
-            for logo, pos in logo_rows:
-                logo_bg = Image.new("RGB", logo.size, (255, 255, 255))
-                logo_bg.paste(logo, (0, 0), logo)
-                base_image.paste(logo_bg, pos)
-
-            # Set the full composite image to the canvas in one call
-            self.manager.set_image(base_image.convert("RGB"), 0, 0)
-
-            # Draw pitcher info area with gradient
-            m = 0
-            for pitcher_line in range(31, 39):
-                for pitcher_line_v in range(0, 96):
-                    self.manager.draw_pixel(
-                        pitcher_line_v, pitcher_line, 255 + m, 255 + m, 255 + m)
-                m -= 20
-
-            # Draw batter info area with gradient
-            m = 0
-            for batter_line in range(39, 47):
-                for batter_line_v in range(0, 96):
-                    self.manager.draw_pixel(
-                        batter_line_v, batter_line, 255 + m, 255 + m, 255 + m)
-                m -= 20
-
-            # Draw batting indicator box (red box): away team on top bats in
-            # Top/End states, home team on bottom bats in Bot/Mid states
-            if inning_state in ['Top', 'End']:
-                for ht_h in range(6, 8):
-                    for ht_v in range(30, 34):
-                        self.manager.draw_pixel(ht_v, ht_h, 255, 0, 0)
-            else:
-                for at_h in range(22, 24):
-                    for at_v in range(30, 34):
-                        self.manager.draw_pixel(at_v, at_h, 255, 0, 0)
-
-            # Draw bases
-            self._draw_bases_original(game_info)
-
-            # Draw scores
-            self._draw_scores(game_data, game_index)
-
-            # Draw game info (inning, count, outs, pitcher, batter)
-            self._draw_game_info_improved(game_info, play_data)
-
-            # NOW draw batting indicator by pasting image on pixel-drawn canvas
-            self._draw_batting_indicator_overlay(inning_state)
-
-            # Check for score changes
-            self._check_score_changes(game_data, game_index)
-
-            # Draw split-squad indicator if active (top-right corner)
-            if self.manager.split_squad_indicator:
-                self._draw_split_squad_indicator()
-
-            # Show replay challenge / umpire review over the batter strip
             banner = self._get_review_banner(current_status)
-            if banner:
-                self._draw_review_banner(banner)
-
-            self.manager.swap_canvas()
+            play_state = self._play_state(game_info, play_data)
+
+            # Between pitches most polls return the same game state; the
+            # frame would be pixel-identical, so skip the redraw and swap
+            frame_state = (
+                play_state,
+                self._matchup_ids(play_data),
+                game_data[game_index]['home_score'],
+                game_data[game_index]['away_score'],
+                current_status, self.manager.split_squad_indicator,
+            )
+            if frame_state != last_frame_state or self.manager.keep_alive():
+                animated = self._render_live_frame(
+                    game_data, game_index, game_info, play_data, background,
+                    inning_state, banner)
+                # A run animation took over the canvas mid-draw; leave the
+                # state unset so the next poll redraws the full scoreboard
+                last_frame_state = None if animated else frame_state
 
             # Show brief flight summary on inning transitions (Mid/End states)
             if inning_state in ('Mid', 'End') and inning_state != self._last_inning_state:
                 self._show_between_innings_flights()
+                last_frame_state = None  # the overlay replaced the frame
             self._last_inning_state = inning_state
 
+            poll_delay, unchanged_polls = self._next_poll_delay(
+                play_state != last_play_state, unchanged_polls, poll_delay,
+                inning_state)
+            last_play_state = play_state
+
             # Scroll each new completed play's description across the batter
             # strip once; the static batter line shows until the next play.
             # A scroll pass already outlasts the cycle delay, so skip the
             # sleep afterwards to refresh game data right away.
             if not self._maybe_scroll_last_play(play_data, banner is not None):
-                time.sleep(GameConfig.GAME_CHECK_DELAY)
+                if self.manager.split_squad_indicator:
+                    # Don't sleep past the split-squad game switch
+                    poll_delay = min(poll_delay, max(
+                        0.0, self.manager.split_squad_switch_time - time.time()))
+                time.sleep(poll_delay)
 
             # Exit loop if in split-squad mode and it's time to switch games
             if self.manager.split_squad_indicator:
@@ -211,6 +204,167 @@ class LiveGameHandler:
                     # Return to main loop to switch to next game
                     break
 
+    def _live_background(
+        self, logo_rows: list[tuple[Image.Image, tuple[int, int]]]
+    ) -> Image.Image:
+        """The parts of the live scoreboard that stay put for a whole game:
+        score boxes, dividers, team-color panel and logos"""
+        # Covers the whole panel, so the canvas needs no clear first
+        background = Image.new("RGB", (96, 48))
+        white, black = Colors.WHITE, Colors.BLACK
+
+        # Paint score boxes white (x=17-31, y=0-30) with black divider at y=15;
+        # the black column at x=16 between logos and scores is already black
+        background.paste(white, (17, 0, 32, 31))
+        background.paste(black, (17, 15, 32, 16))
+
+        # Paint right side team primary color (x=32-95, y=0-30)
+        background.paste(self.team.primary_color, (32, 0, 96, 31))
+
+        # Paint black divider line between logos (y=15, x=0-15)
+        background.paste(black, (0, 15, 16, 16))
+
+        # Paint white base line (y=22, x=32-95)
+        background.paste(white, (32, 22, 96, 23))
+
+        # Paint white vertical line at x=70 (y=0-30)
+        background.paste(white, (70, 0, 71, 31))
+
+        # Pitcher (y=31-38) and batter (y=39-46) info strips
+        self._paint_info_strip(background, 31)
+        self._paint_info_strip(background, 39)
+
+        # Add team logos
+        for logo, pos in logo_rows:
+            background.paste(logo, pos)
+        return background
+
+    @staticmethod
+    def _paint_info_strip(image: Image.Image, top: int) -> None:
+        """Paint an 8-row info strip: full-width rows fading from white
+        down by 20 per row"""
+        for row in range(8):
+            shade = 255 - 20 * row
+            image.paste((shade, shade, shade), (0, top + row, 96, top + row + 1))
+
+    def _render_live_frame(
+        self, game_data: list[dict[str, Any]], game_index: int,
+        game_info, play_data, background: Image.Image, inning_state: str,
+        banner: str | None
+    ) -> bool:
+        """Draw and show one frame of the live scoreboard on top of the
+        per-game background; True if a run animation played while drawing"""
+        # Reuse one framebuffer rather than copying the background each frame
+        base_image = self._live_frame
+        if base_image is None:
+            base_image = self._live_frame = Image.new("RGB", background.size)
+        base_image.paste(background)
+
+        # Batting indicator box (red box) on the batting team's row
+        box_y = 6 + self._batting_row(inning_state)
+        base_image.paste(Colors.RED, (30, box_y, 34, box_y + 2))
+
+        # Bases go into the composite too
+        self._paste_bases(base_image, game_info)
+
+        # Set the full composite image to the canvas in one call
+        self.manager.set_image(base_image, 0, 0)
+
+        # Draw scores
+        self._draw_scores(game_data, game_index)
+
+        # Draw game info (inning, count, outs, pitcher, batter)
+        self._draw_game_info_improved(game_info, play_data)
+
+        # NOW draw batting indicator by pasting image on pixel-drawn canvas
+        self._draw_batting_indicator_overlay(inning_state)
+
+        # Check for score changes
+        animated = self._check_score_changes(game_data, game_index)
+
+        # Draw split-squad indicator if active (top-right corner)
+        if self.manager.split_squad_indicator:
+            self._draw_split_squad_indicator()
+
+        # Show replay challenge / umpire review over the batter strip
+        if banner:
+            self._draw_review_banner(banner)
+
+        self.manager.swap_canvas()
+        return animated
+
+    @staticmethod
+    def _play_state(game_info, play_data) -> tuple:
+        """Everything a new pitch, run, out or runner move changes"""
+        linescore = game_info['liveData']['linescore']
+        offense = linescore.get('offense', {})
+        current = play_data.get('currentPlay', {})
+        return (
+            linescore.get('inningState'), linescore.get('currentInning'),
+            linescore.get('balls'), linescore.get('strikes'),
+            linescore.get('outs'),
+            linescore.get('teams', {}).get('home', {}).get('runs'),
+            linescore.get('teams', {}).get('away', {}).get('runs'),
+            tuple(bool(offense.get(b)) for b in ('first', 'second', 'third')),
+            current.get('about', {}).get('atBatIndex'),
+            len(current.get('playEvents', [])),
+        )
+
+    @staticmethod
+    def _matchup_ids(play_data) -> tuple:
+        """Current batter and pitcher (a pitching change alone moves
+        nothing in the linescore)"""
+        matchup = play_data.get('currentPlay', {}).get('matchup', {})
+        return (matchup.get('batter', {}).get('id'),
+                matchup.get('pitcher', {}).get('id'))
+
+    @staticmethod
+    def _next_poll_delay(
+        changed: bool, unchanged_polls: int, delay: float, inning_state: str
+    ) -> tuple[float, int]:
+        """Seconds until the next live poll and the updated unchanged count:
+        back to the base rate on any change, doubling after every few
+        quiet polls up to a cap (longer between half-innings)"""
+        if changed:
+            return float(GameConfig.GAME_CHECK_DELAY), 0
+        unchanged_polls += 1
+        if unchanged_polls < GameConfig.LIVE_POLL_BACKOFF_AFTER:
+            return delay, unchanged_polls
+        cap = (GameConfig.LIVE_POLL_BREAK_MAX_DELAY
+               if inning_state in ('Mid', 'End')
+               else GameConfig.LIVE_POLL_MAX_DELAY)
+        return min(delay * 2, float(cap)), 0
+
+    def _sized_logo(
+        self, key: str, size: tuple[int, int],
+        resample: int = Image.BICUBIC
+    ) -> Image.Image:
+        """A game logo resized to size as RGBA, resized once per game
+        instead of on every draw"""
+        source = self.manager.game_images[key]
+        cached = self._sized_logos.get((key, size, resample))
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        logo = source.resize(size, resample).convert('RGBA')
+        self._sized_logos[(key, size, resample)] = (source, logo)
+        return logo
+
+    def _scoreboard_logo_rows(self) -> list[tuple[Image.Image, tuple[int, int]]]:
+        """Team logos for the live scoreboard, resized to 16x15 to fill the
+        logo area edge-to-edge and flattened onto white (so dark logos stay
+        visible) as RGB, with their paste positions"""
+        flattened: dict[str, Image.Image] = {}
+        for key in ('team', 'opponent'):
+            logo = self._sized_logo(key, (16, 15))
+            logo_bg = Image.new("RGB", logo.size, (255, 255, 255))
+            logo_bg.paste(logo, (0, 0), logo)
+            flattened[key] = logo_bg
+
+        # Away team on top, home team on bottom (matches Top/Bot inning)
+        if self.is_cubs_home:
+            return [(flattened['opponent'], (0, 0)), (flattened['team'], (0, 16))]
+        return [(flattened['team'], (0, 0)), (flattened['opponent'], (0, 16))]
+
     def _get_last_play_description(self, play_data) -> str | None:
         """Full description sentence for the latest finished play"""
         try:
@@ -244,13 +398,8 @@ class LiveGameHandler:
         snapshot = original.copy()
 
         # Erase the static batter line from the snapshot by repainting the
-        # batter strip gradient (same ramp as the frame draw in
-        # display_game_on), so the description scrolls over a clean strip
-        pixels = snapshot.load()
-        for y in range(39, 47):
-            shade = 255 - 20 * (y - 39)
-            for x in range(0, 96):
-                pixels[x, y] = (shade, shade, shade)
+        # batter strip gradient, so the description scrolls over a clean strip
+        self._paint_info_strip(snapshot, 39)
 
         text_width = len(text) * Fonts.CHAR_WIDTH_MICRO
         scroll_delay = get_scroll_delay(5)
@@ -266,7 +415,7 @@ class LiveGameHandler:
             self.manager.draw_text('micro', scroll_x, 45,
                                    self.team.primary_color, text)
             self.manager.swap_canvas()
-            time.sleep(scroll_delay)
+            self.manager.pace_frame(scroll_delay)
             scroll_x -= 1
 
         # Put the static frame (batter line included) back up immediately
@@ -283,55 +432,48 @@ class LiveGameHandler:
 
     def _draw_review_banner(self, text: str) -> None:
         """Overlay a red challenge/review banner on the batter info strip"""
-        for y in range(39, 48):
-            for x in range(0, 96):
-                self.manager.draw_pixel(x, y, 180, 0, 0)
+        self.manager.fill_rect(0, 39, 96, 48, (180, 0, 0))
 
         # Center in tiny_bold (5px per char)
         text_x = max(0, (96 - len(text) * Fonts.CHAR_WIDTH_TINY) // 2)
         self.manager.draw_text('tiny_bold', text_x, 46, Colors.WHITE, text)
 
+    # Score-box row offset of the batting team by inning state: the away
+    # team (top row) bats in Top/End, the home team (bottom row) in Bot/Mid
+    BATTING_ROW_OFFSETS: dict[str, int] = {
+        'Top': 0, 'End': 0, 'Bot': 16, 'Mid': 16,
+    }
+
+    @classmethod
+    def _batting_row(cls, inning_state: str) -> int:
+        """Y offset of the batting team's score row (home row if the
+        state is unknown)"""
+        return cls.BATTING_ROW_OFFSETS.get(inning_state, 16)
+
     def _draw_batting_indicator_overlay(self, inning_state):
         """Draw batting indicator by overlaying on the current pixel buffer"""
-        # Away team row on top, home team row on bottom
-        batting_away_pos = (30, 5)
-        batting_home_pos = (30, 21)
-
-        # Get the appropriate position
-        if inning_state in ['Top', 'End']:
-            pos = batting_away_pos
+        # Blit the indicator sprite over the score box in one call
+        sprite, mask = self._batting_sprite()
+        self.manager.overlay_image(
+            sprite, 30, 5 + self._batting_row(inning_state), mask)
+
+    def _batting_sprite(self) -> tuple[Image.Image, Image.Image]:
+        """Batting indicator as (RGB image, mask), built once per loaded
+        image. The mask keeps every pixel the old per-pixel draw lit: any
+        non-zero alpha for RGBA sprites, any non-black pixel otherwise."""
+        source = self.manager.game_images['batting']
+        cached = self._batting_sprite_cache
+        if cached is not None and cached[0] is source:
+            return cached[1], cached[2]
+
+        rgb = source.convert('RGB')
+        if source.mode == 'RGBA':
+            mask = source.getchannel('A').point(lambda a: 255 if a else 0)
         else:
-            pos = batting_home_pos
-
-        # Get the batting indicator image
-        batting_img = self.manager.game_images['batting']
-
-        # Paste it directly using PIL by converting current canvas to image,
-        # adding the batting indicator, and setting it back
-        # Create a new composite with the batting indicator
-        final_image = Image.new("RGB", (96, 48))
-
-        # We need to draw everything again on this image, or use a stored version
-        # Since we can't get the current canvas easily, let's just paste the indicator
-        # over a specific region by drawing pixels
-
-        # Convert batting image to pixel array and draw it
-        batting_pixels = batting_img.load()
-        bat_width, bat_height = batting_img.size
-
-        for y in range(bat_height):
-            for x in range(bat_width):
-                pixel = batting_pixels[x, y]
-                # Only draw non-transparent pixels (if RGBA) or non-black pixels
-                if len(pixel) == 4:  # RGBA
-                    if pixel[3] > 0:  # Check alpha
-                        self.manager.draw_pixel(
-                            pos[0] + x, pos[1] + y, pixel[0], pixel[1], pixel[2])
-                else:  # RGB
-                    # Skip if pixel is pure black (assumed transparent)
-                    if pixel != (0, 0, 0):
-                        self.manager.draw_pixel(
-                            pos[0] + x, pos[1] + y, pixel[0], pixel[1], pixel[2])
+            r, g, b = rgb.point(lambda v: 255 if v else 0).split()
+            mask = ImageChops.lighter(ImageChops.lighter(r, g), b)
+        self._batting_sprite_cache = (source, rgb, mask)
+        return rgb, mask
 
     def _draw_split_squad_indicator(self) -> None:
         """
@@ -348,9 +490,8 @@ class LiveGameHandler:
         box_y = 0
 
         # Dark background for visibility
-        for y in range(box_y, box_y + 8):
-            for x in range(box_x, DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, y, 40, 40, 40)
+        self.manager.fill_rect(
+            box_x, box_y, DisplayConfig.MATRIX_COLS, box_y + 8, (40, 40, 40))
 
         # Draw the indicator text (e.g., "1/2") in yellow
         self.manager.draw_text('micro', box_x + 1, 6, Colors.YELLOW, indicator)
@@ -382,13 +523,9 @@ class LiveGameHandler:
             distance = summary['closest_distance']
 
             # Show for 5 seconds - simple overlay on dark background
+            bg = Image.new("RGB", (96, 48), (15, 40, 80))
             start_time = time.time()
             while time.time() - start_time < 5:
-                self.manager.clear_canvas()
-
-                # Dark blue background
-                from PIL import Image
-                bg = Image.new("RGB", (96, 48), (15, 40, 80))
                 self.manager.set_image(bg, 0, 0)
 
                 # "OVERHEAD" centered at top
@@ -413,79 +550,76 @@ class LiveGameHandler:
         except Exception as e:
             logger.debug(f"Between-innings flight display error: {e}")
 
-    def _draw_bases_original(self, game_info):
-        """Draw bases exactly like original"""
-        # Base positions from original
-        second_base_x, second_base_y = 46, 7
-        first_base_x, first_base_y = second_base_x + 7, second_base_y + 7
-        third_base_x, third_base_y = second_base_x - 7, second_base_y + 7
-
-        base_positions = {
-            'first': (first_base_x, first_base_y),
-            'second': (second_base_x, second_base_y),
-            'third': (third_base_x, third_base_y)
-        }
-
-        # Draw base outlines
-        for base_name, (bag_x, bag_y) in base_positions.items():
-            original_y = bag_y
-            for a in range(0, 5):
-                self.manager.draw_pixel(bag_x + a, bag_y, 255, 255, 255)
-                bag_y -= 1
-                if a == 4:
-                    for b in range(5, 10):
-                        self.manager.draw_pixel(
-                            bag_x + b, bag_y, 255, 255, 255)
-                        bag_y += 1
-                        if b == 9:
-                            for c in range(10, 5, -1):
-                                self.manager.draw_pixel(
-                                    bag_x + c, bag_y, 255, 255, 255)
-                                bag_y += 1
-                                if c == 6:
-                                    for d in range(5, 0, -1):
-                                        self.manager.draw_pixel(
-                                            bag_x + d, bag_y, 255, 255, 255)
-                                        bag_y -= 1
-            bag_y = original_y
-
-        # Fill bases based on runners
-        offense = game_info['liveData']['linescore']['offense']
-
-        # First base
-        if offense.get('first'):
-            self._fill_base_original(first_base_x, first_base_y, 1)
-        else:
-            self._fill_base_original(first_base_x, first_base_y, 0)
-
-        # Second base
-        if offense.get('second'):
-            self._fill_base_original(second_base_x, second_base_y, 1)
-        else:
-            self._fill_base_original(second_base_x, second_base_y, 0)
-
-        # Third base
-        if offense.get('third'):
-            self._fill_base_original(third_base_x, third_base_y, 1)
-        else:
-            self._fill_base_original(third_base_x, third_base_y, 0)
-
-    def _fill_base_original(self, hit_x, hit_y, filled):
-        """Fill base like original"""
-        next_y = 0
-        if filled == 1:
-            for fill in range(1, 6):
-                for i in range(5):
-                    self.manager.draw_pixel(
-                        hit_x + i + fill, hit_y + i - next_y, 255, 255, 255)
-                next_y += 1
-        else:
-            for fill in range(1, 6):
-                for i in range(5):
-                    self.manager.draw_pixel(
-                        hit_x + i + fill, hit_y + i - next_y,
-                        *self.team.primary_color)
-                next_y += 1
+    # Left corner of each bag's diamond (second base sits 7px up and
+    # between the other two)
+    BASE_POSITIONS: tuple[tuple[str, int, int], ...] = (
+        ('first', 53, 14),
+        ('second', 46, 7),
+        ('third', 39, 14),
+    )
+
+    # Top-left of the layer holding all three bases (third base's left
+    # corner column, second base's top row)
+    BASE_LAYER_ORIGIN: tuple[int, int] = (39, 2)
+
+    def _paste_bases(self, image: Image.Image, game_info) -> None:
+        """Composite the three bases, filled where a runner stands, onto
+        the frame image in one paste (replaces ~135 per-pixel draws per
+        refresh)"""
+        # The feed can omit offense between half-innings: empty bases
+        offense = game_info['liveData']['linescore'].get('offense', {})
+        layer = self._bases_layer(tuple(
+            bool(offense.get(name)) for name, _, _ in self.BASE_POSITIONS))
+        image.paste(layer, self.BASE_LAYER_ORIGIN, layer)
+
+    def _bases_layer(self, occupied: tuple[bool, ...]) -> Image.Image:
+        """RGBA layer with every base drawn for one runner combination,
+        built once per combination (there are only eight)"""
+        layer = self._base_layers.get(occupied)
+        if layer is not None:
+            return layer
+
+        origin_x, origin_y = self.BASE_LAYER_ORIGIN
+        layer = Image.new('RGBA', (25, 18), (0, 0, 0, 0))
+        for (_, bag_x, bag_y), filled in zip(self.BASE_POSITIONS, occupied):
+            tile = self._base_tile(filled)
+            # Tiles are 11x11 with the left corner on their middle row
+            layer.paste(tile, (bag_x - origin_x, bag_y - 5 - origin_y), tile)
+        self._base_layers[occupied] = layer
+        return layer
+
+    def _base_tile(self, filled: bool) -> Image.Image:
+        """RGBA sprite of one base: white diamond outline plus a white
+        checkerboard fill when occupied (team color when empty). Built
+        once from the original pixel walk; corners stay transparent so
+        neighboring bases can overlap."""
+        tile = self._base_tiles.get(filled)
+        if tile is not None:
+            return tile
+
+        tile = Image.new('RGBA', (11, 11), (0, 0, 0, 0))
+        pixels = tile.load()
+        white = (255, 255, 255, 255)
+        fill_color = white if filled else (*self.team.primary_color, 255)
+
+        # Outline: up-right, down-right, down-left, up-left edges
+        bag_x, bag_y = 0, 5
+        for a in range(0, 5):
+            pixels[bag_x + a, bag_y - a] = white
+        for b in range(0, 5):
+            pixels[bag_x + 5 + b, bag_y - 5 + b] = white
+        for c in range(0, 5):
+            pixels[bag_x + 10 - c, bag_y + c] = white
+        for d in range(0, 5):
+            pixels[bag_x + 5 - d, bag_y + 5 - d] = white
+
+        # Fill: five diagonal rows stepping up one pixel each
+        for row in range(1, 6):
+            for i in range(5):
+                pixels[bag_x + i + row, bag_y + i - (row - 1)] = fill_color
+
+        self._base_tiles[filled] = tile
+        return tile
 
     def _draw_scores(self, game_data, game_index):
         """Draw team scores (away on top, home on bottom)"""
@@ -584,55 +718,107 @@ class LiveGameHandler:
         """Final-screen background (see teams.contrast_background)"""
         return contrast_background(self.team)
 
-    def _check_score_changes(self, game_data, game_index):
-        """Check for score changes and trigger animations"""
-        if self.is_cubs_home:
-            new_cubs_score = game_data[game_index]['home_score']
-            new_opp_score = game_data[game_index]['away_score']
-        else:
-            new_cubs_score = game_data[game_index]['away_score']
-            new_opp_score = game_data[game_index]['home_score']
+    def _team_scores(self, game: dict[str, Any]) -> tuple[int, int]:
+        """(our score, opponent score) from a schedule entry"""
+        ours, theirs = self._score_keys
+        return game[ours], game[theirs]
 
+    def _check_score_changes(self, game_data, game_index) -> bool:
+        """Check for score changes and trigger animations; True if any ran"""
+        new_cubs_score, new_opp_score = self._team_scores(game_data[game_index])
+
+        animated = False
         if new_cubs_score > self.cubs_score:
             self.animate_cubs_run()
             self.cubs_score = new_cubs_score
+            animated = True
 
         if new_opp_score > self.opp_score:
             self.animate_opponent_run()
             self.opp_score = new_opp_score
+            animated = True
+        return animated
+
+    # Every run animates the same flight, so its positions are fixed
+    RUN_BALL_PATH: tuple[tuple[int, int], ...] = _ball_flight_path()
+
+    def _run_scene_images(self) -> tuple[Image.Image, Image.Image]:
+        """(backdrop with the runner sprite, baseball) for the run-scored
+        animation, decoded once instead of on every run"""
+        path = self.team.run_scored_path
+        if self._run_scene is None or self._run_scene[0] != path:
+            run_image = Image.open(path)
+            backdrop = Image.new("RGB", (96, 48))
+            backdrop.paste(run_image.transpose(Image.FLIP_LEFT_RIGHT), (0, 12))
+            # Pasted without a mask, so converting up front gives the same
+            # pixels as the per-frame RGBA->RGB conversion paste would do
+            baseball_image = Image.open('./logos/baseball.png').convert('RGB')
+            self._run_scene = (path, backdrop, baseball_image)
+        return self._run_scene[1], self._run_scene[2]
+
+    def _caption_layer(
+        self, name: str, labels: list[tuple[str, int, int, RGBColor, str]]
+    ) -> Image.Image | None:
+        """AA text_layer for a fixed run-animation caption, rasterized on
+        the first run instead of every time one scores"""
+        if name not in self._caption_layers:
+            self._caption_layers[name] = self.manager.text_layer(
+                labels, smooth=True)
+        return self._caption_layers[name]
+
+    def _run_banner(
+        self, labels: list[tuple[str, int, int, RGBColor, str]]
+    ) -> Image.Image | None:
+        """The RUN SCORED flash flattened onto black, built on the first
+        run. Labels go on one at a time, in draw order, so the shadow and
+        text overlap blends exactly as sequential draw_text calls would."""
+        if 'run_scored' not in self._caption_layers:
+            banner: Image.Image | None = Image.new("RGB", (96, 48))
+            for label in labels:
+                layer = self.manager.text_layer([label], smooth=True)
+                if layer is None:
+                    banner = None
+                    break
+                banner.paste(layer, (0, 0), layer)
+            self._caption_layers['run_scored'] = banner
+        return self._caption_layers['run_scored']
 
     def animate_cubs_run(self):
         """Animate Cubs scoring a run"""
         # Baseball flying animation
-        baseball_image = Image.open('./logos/baseball.png')
-        run_image = Image.open(self.team.run_scored_path)
-        run_image_flipped = run_image.transpose(Image.FLIP_LEFT_RIGHT)
-
-        run_y = 15
-        next_x = 25
-
-        for x in range(25, 97):
-            self.manager.clear_canvas()
-            if x > next_x + 5:
-                next_x += 5
-                run_y -= 1
-
-            output_image = Image.new("RGB", (96, 48))
-            output_image.paste(run_image_flipped, (0, 12))
-            output_image.paste(baseball_image, (x, run_y))
-            self.manager.set_image(output_image.convert("RGB"), 0, 0)
+        backdrop, baseball_image = self._run_scene_images()
+
+        # One framebuffer for the whole flight; set_image copies it out.
+        # Each frame only restores the backdrop where the ball just was
+        output_image = backdrop.copy()
+        ball_box: tuple[int, int, int, int] | None = None
+        for x, y in self.RUN_BALL_PATH:
+            if ball_box is not None:
+                output_image.paste(backdrop.crop(ball_box), ball_box[:2])
+                ball_box = None
+            if x < DisplayConfig.MATRIX_COLS:
+                output_image.paste(baseball_image, (x, y))
+                ball_box = (x, y, x + baseball_image.width,
+                            y + baseball_image.height)
+            self.manager.set_image(output_image, 0, 0)
             self.manager.swap_canvas()
 
-        # Flash "RUN SCORED"
+        # Flash "RUN SCORED": white shadow under the yellow text
+        labels = [
+            ('medium_bold', 35, 19, Colors.WHITE, 'RUN'),
+            ('medium_bold', 21, 35, Colors.WHITE, 'SCORED'),
+            ('medium_bold', 36, 20, Colors.BRIGHT_YELLOW, 'RUN'),
+            ('medium_bold', 22, 36, Colors.BRIGHT_YELLOW, 'SCORED'),
+        ]
+        banner = self._run_banner(labels)
+
         for _ in range(3):
-            self.manager.clear_canvas()
-            self.manager.draw_text('medium_bold', 35, 19, Colors.WHITE, 'RUN')
-            self.manager.draw_text('medium_bold', 21, 35,
-                                   Colors.WHITE, 'SCORED')
-            self.manager.draw_text('medium_bold', 36, 20,
-                                   Colors.BRIGHT_YELLOW, 'RUN')
-            self.manager.draw_text('medium_bold', 22, 36,
-                                   Colors.BRIGHT_YELLOW, 'SCORED')
+            if banner is not None:
+                self.manager.set_image(banner, 0, 0)
+            else:
+                self.manager.clear_canvas()
+                for font_name, x, y, color, text in labels:
+                    self.manager.draw_text(font_name, x, y, color, text)
             self.manager.swap_canvas()
             time.sleep(0.5)
             self.manager.clear_canvas()
@@ -645,69 +831,107 @@ class LiveGameHandler:
         import random
         from PIL import ImageDraw
 
-        opp_image = self.manager.game_images['opponent'].resize((20, 20)).convert('RGBA')
-
-        # Stormy sky gradient, darkest at the top
-        sky = Image.new("RGB", (96, 48))
-        sky_px = sky.load()
-        for y in range(48):
-            shade = 10 + y // 4
-            for x in range(96):
-                sky_px[x, y] = (shade, shade, shade + 8)
-
-        # Puffy storm cloud built from overlapping gray lobes
-        cloud = Image.new("RGBA", (56, 14), (0, 0, 0, 0))
-        cloud_draw = ImageDraw.Draw(cloud)
-        for cx, cy, w, h, shade in ((2, 5, 20, 8, 70), (14, 1, 26, 11, 85),
-                                    (30, 4, 22, 9, 75), (10, 7, 38, 6, 60)):
-            cloud_draw.ellipse((cx, cy, cx + w, cy + h),
-                               fill=(shade, shade, shade + 10, 255))
+        opp_image = self._sized_logo('opponent', (20, 20))
+        skies, cloud = _storm_scene_images()
 
         cloud_final_x = 20
         bolt_frames = {36, 37, 56, 57}
 
-        for frame in range(72):
-            frame_img = sky.copy()
-
-            # Lightning flash brightens the whole sky for the strike frames
-            bolt_on = frame in bolt_frames
-            if bolt_on:
-                frame_img = Image.eval(frame_img, lambda v: min(255, v + 45))
+        # "SCORES" in its two colors, rasterized once for all 72 frames
+        captions = {
+            bolt_on: self._caption_layer(
+                f'scores_{bolt_on}', [('medium_bold', 21, 42, color, 'SCORES')])
+            for bolt_on, color in ((False, (185, 185, 195)),
+                                   (True, Colors.BRIGHT_YELLOW))
+        }
 
-            draw = ImageDraw.Draw(frame_img)
+        # Once the cloud parks, every frame without a bolt is the same
+        # scene: compose it once instead of re-pasting cloud and logo
+        parked = skies[False].copy()
+        parked.paste(cloud, (cloud_final_x, 0), cloud)
+        parked.paste(opp_image, (38, 14), opp_image)
 
-            # Cloud drifts in from the left over the first 20 frames,
-            # then parks above the logo
-            if frame < 20:
-                cloud_x = -56 + int((cloud_final_x + 56) * frame / 20)
+        # One framebuffer for all 72 frames, refilled from the sky each time
+        frame_img = Image.new("RGB", (96, 48))
+        draw = ImageDraw.Draw(frame_img)
+        for frame in range(72):
+            bolt_on = frame in bolt_frames
+            if frame >= 20 and not bolt_on:
+                frame_img.paste(parked, (0, 0))
             else:
-                cloud_x = cloud_final_x
-            frame_img.paste(cloud, (cloud_x, 0), cloud)
-
-            # Jagged bolt cracking down from the cloud beside the logo
-            if bolt_on:
-                x = 30 if frame < 50 else 63
-                y = 11
-                for _ in range(5):
-                    nx = x + random.choice((-3, -2, 2, 3))
-                    ny = y + 5
-                    draw.line((x, y, nx, ny), fill=(255, 245, 180), width=1)
-                    x, y = nx, ny
-
-            # Opponent logo under the cloud
-            frame_img.paste(opp_image, (38, 14), opp_image)
-
-            self.manager.clear_canvas()
+                frame_img.paste(skies[bolt_on], (0, 0))
+
+                # Cloud drifts in from the left over the first 20 frames,
+                # then parks above the logo; skip it while fully off-panel
+                if frame < 20:
+                    cloud_x = -56 + int((cloud_final_x + 56) * frame / 20)
+                else:
+                    cloud_x = cloud_final_x
+                if cloud_x + cloud.width > 0:
+                    frame_img.paste(cloud, (cloud_x, 0), cloud)
+
+                # Jagged bolt cracking down from the cloud beside the logo
+                if bolt_on:
+                    x = 30 if frame < 50 else 63
+                    y = 11
+                    for _ in range(5):
+                        nx = x + random.choice((-3, -2, 2, 3))
+                        ny = y + 5
+                        draw.line((x, y, nx, ny), fill=(255, 245, 180), width=1)
+                        x, y = nx, ny
+
+                # Opponent logo under the cloud
+                frame_img.paste(opp_image, (38, 14), opp_image)
+
+            caption = captions[bolt_on]
+            if caption is not None:
+                frame_img.paste(caption, (0, 0), caption)
             self.manager.set_image(frame_img, 0, 0)
-            text_color = Colors.BRIGHT_YELLOW if bolt_on else (185, 185, 195)
-            self.manager.draw_text('medium_bold', 21, 42, text_color, 'SCORES')
+            if caption is None:
+                text_color = Colors.BRIGHT_YELLOW if bolt_on else (185, 185, 195)
+                self.manager.draw_text('medium_bold', 21, 42, text_color, 'SCORES')
             self.manager.swap_canvas()
             time.sleep(0.04)
 
+    # Game-over final score x by side, as (one digit, two digits)
+    GAME_OVER_SCORE_X: dict[str, tuple[int, int]] = {
+        'team': (9, 5), 'opponent': (75, 70),
+    }
+
+    def _celebration_frames(self) -> tuple[list[Image.Image], float]:
+        """(frames resized to the panel, seconds per frame) of the win
+        GIF, decoded once instead of at every game-over interlude"""
+        path = self.team.celebration_path
+        if self._celebration is None or self._celebration[0] != path:
+            w_flag = Image.open(path)
+
+            # Get all frames from the GIF
+            frames = []
+            try:
+                while True:
+                    # Resize frame to fit display and convert to RGB
+                    frame = w_flag.copy().convert('RGB')
+                    frame = frame.resize((96, 48), Image.LANCZOS)
+                    frames.append(frame)
+                    w_flag.seek(w_flag.tell() + 1)
+            except EOFError:
+                pass  # End of frames
+
+            # Frame duration in milliseconds, default to 100ms
+            duration = w_flag.info.get('duration', 100) / 1000.0
+            self._celebration = (path, frames, duration)
+        return self._celebration[1], self._celebration[2]
+
     def display_game_over(self, game_data, game_index, gameid):
         """Display game over screen - Cubs always on left, opponent always on right.
         Cycles between game-over display and off-season content rotation."""
-        game_info = retry_api_call(statsapi.get, 'game', {'gamePk': gameid})
+        # The next schedule read must see the Final status (and a possible
+        # doubleheader game 2), not a copy cached while the game was live
+        self.manager.invalidate_schedule()
+
+        # Fresh feed: a copy cached during the last live refresh could miss
+        # the final play
+        game_info = self.manager.get_game_info(gameid, max_age=0)
         boxscore = game_info['liveData']['boxscore']['teams']
         linescore = game_info['liveData']['linescore']
 
@@ -738,21 +962,31 @@ class LiveGameHandler:
         result = "WIN" if cubs_won else "LOSS"
 
         # Function to draw the game over screen
-        def draw_game_over_screen():
-            self.manager.clear_canvas()
-
-            # Create team-color background image
-            output_image = Image.new("RGB", (96, 48),
-                                     self._game_over_bg_color())
-
-            # Resize and paste team logos onto blue background (use alpha mask for transparency)
-            cubs_resized = self.manager.game_images['team'].resize((26, 26)).convert('RGBA')
-            opp_resized = self.manager.game_images['opponent'].resize((26, 26)).convert('RGBA')
-            output_image.paste(cubs_resized, Positions.CUBS_IMAGE_GAMEOVER, cubs_resized)
-            output_image.paste(opp_resized, Positions.OPP_IMAGE_GAMEOVER, opp_resized)
+        # Team-color background with both logos (alpha-masked), composed
+        # once: the screen is redrawn every half second until 4 AM
+        background = Image.new("RGB", (96, 48), self._game_over_bg_color())
+        # 28px pixel-art logos shrunk by two pixels: nearest keeps their
+        # flat colors instead of a faint filtered halo on the LEDs
+        cubs_resized = self._sized_logo('team', (26, 26), Image.NEAREST)
+        opp_resized = self._sized_logo('opponent', (26, 26), Image.NEAREST)
+        background.paste(cubs_resized, Positions.CUBS_IMAGE_GAMEOVER, cubs_resized)
+        background.paste(opp_resized, Positions.OPP_IMAGE_GAMEOVER, opp_resized)
+
+        # Cubs box-score lines under the result
+        stat_lines = (f'INNINGS:{innings}', f'HITS:   {hits}',
+                      f'RUNS:   {cubs_final_score}', f'ERRORS: {errors}')
+
+        # (x, text) of each big final score: Cubs always on the left,
+        # opponent always on the right
+        final_scores = [
+            (self.GAME_OVER_SCORE_X[side][score >= 10], str(score))
+            for side, score in (('team', cubs_final_score),
+                                ('opponent', opp_final_score))
+        ]
 
+        def draw_game_over_screen():
             # Set the image with blue background
-            self.manager.set_image(output_image.convert("RGB"), 0, 0)
+            self.manager.set_image(background, 0, 0)
 
             # Draw "FINAL" text - centered and lowered to be fully visible
             self.manager.draw_text('small_bold', 33, 11,
@@ -764,73 +998,30 @@ class LiveGameHandler:
             self.manager.draw_text('small_bold', result_x, 21,
                                 result_color, result)
 
-            # Draw stats
-            self.manager.draw_text(
-                'micro', 29, 29, Colors.WHITE, f'INNINGS:{innings}')
-            self.manager.draw_text(
-                'micro', 29, 35, Colors.WHITE, f'HITS:   {hits}')
-            self.manager.draw_text(
-                'micro', 29, 41, Colors.WHITE, f'RUNS:   {cubs_final_score}')
-            self.manager.draw_text(
-                'micro', 29, 47, Colors.WHITE, f'ERRORS: {errors}')
-
-            # Cubs score always on LEFT side
-            if cubs_final_score >= 10:
-                cubs_x = 5
-            else:
-                cubs_x = 9
-
-            # Opponent score always on RIGHT side
-            if opp_final_score >= 10:
-                opp_x = 70
-            else:
-                opp_x = 75
-
-            # Draw Cubs score on LEFT
-            self.manager.draw_text('large_bold', cubs_x,
-                                45, Colors.WHITE, str(cubs_final_score))
+            # Draw stats, one 6px row each
+            for i, line in enumerate(stat_lines):
+                self.manager.draw_text('micro', 29, 29 + 6 * i,
+                                       Colors.WHITE, line)
 
-            # Draw opponent score on RIGHT
-            self.manager.draw_text('large_bold', opp_x,
-                                45, Colors.WHITE, str(opp_final_score))
+            # Final scores under the logos
+            for x, text in final_scores:
+                self.manager.draw_text('large_bold', x, 45, Colors.WHITE, text)
 
             self.manager.swap_canvas()
 
         # Function to display animated W flag for 15 seconds
         def display_w_flag_cycle():
             try:
-                # Load the W flag GIF
-                w_flag = Image.open(self.team.celebration_path)
-
-                # Get all frames from the GIF
-                frames = []
-                try:
-                    while True:
-                        # Resize frame to fit display and convert to RGB
-                        frame = w_flag.copy().convert('RGB')
-                        frame = frame.resize((96, 48), Image.LANCZOS)
-                        frames.append(frame)
-                        w_flag.seek(w_flag.tell() + 1)
-                except EOFError:
-                    pass  # End of frames
-
+                frames, duration = self._celebration_frames()
                 if not frames:
                     print(f"No frames found in {self.team.celebration_path}")
                     return False
 
-                # Get frame duration (in milliseconds, default to 100ms if not specified)
-                try:
-                    duration = w_flag.info.get(
-                        'duration', 100) / 1000.0  # Convert to seconds
-                except:
-                    duration = 0.1  # Default to 100ms per frame
-
                 # Display animation for 15 seconds
                 start_time = time.time()
                 frame_index = 0
 
                 while time.time() - start_time < 15:
-                    self.manager.clear_canvas()
                     self.manager.set_image(frames[frame_index], 0, 0)
                     self.manager.swap_canvas()
 
@@ -846,25 +1037,35 @@ class LiveGameHandler:
                 print(f"Error displaying W flag: {e}")
                 return False
 
-        # Main loop - final score interleaved between rotation segments
-        current_date = pendulum.now().format('YYYY-MM-DD')
+        # Game 1 of a doubleheader: hold the final briefly, then hand
+        # back so game 2 is picked up
+        if game_data[game_index]['doubleheader'] == 'S':
+            draw_game_over_screen()
+            time.sleep(GameConfig.GAME_OVER_WAIT_TIME)
+            return
+
+        # Main loop - final score interleaved between rotation segments,
+        # until the date rolls over (or 4 AM, for a game that ended after
+        # midnight)
+        started = datetime.now()
+        current_date = started.strftime('%Y-%m-%d')
+        after_midnight = started.strftime('%H:%M') < '04:00'
+
+        def past_exit_time() -> bool:
+            now = datetime.now()
+            return (now.strftime('%Y-%m-%d') != current_date
+                    or (after_midnight and now.strftime('%H:%M') >= '04:00'))
 
         def show_game_over_interlude():
             """Show the game over screen (and W flag on wins) for the
             interlude period. Returns True when the loop should exit."""
             nonlocal cubs_won
-            screen_start = time.time()
-            while time.time() - screen_start < GameConfig.GAME_OVER_INTERLUDE_TIME:
-                draw_game_over_screen()
-                time.sleep(0.5)
-
-                # Check exit conditions during game over screen display
-                if pendulum.now().format('YYYY-MM-DD') != current_date:
-                    return True
-                if pendulum.now().format('HH:MM') == '04:00':
-                    return True
-                if game_data[game_index]['doubleheader'] == 'S':
-                    return True
+            # The screen is static: draw it once and sleep through the
+            # interlude instead of polling the clock every half second
+            draw_game_over_screen()
+            time.sleep(GameConfig.GAME_OVER_INTERLUDE_TIME)
+            if past_exit_time():
+                return True
 
             # If Cubs won, show W flag for 15 seconds
             if cubs_won:
@@ -879,16 +1080,9 @@ class LiveGameHandler:
         show_game_over_interlude()
 
         while True:
-            # Check if it's time to exit
-            over_date = pendulum.now().format('YYYY-MM-DD')
-            current_time = pendulum.now().format('HH:MM')
-
-            # Exit conditions
-            if over_date != current_date or current_time == '04:00':
-                break
-
-            if game_data[game_index]['doubleheader'] == 'S':
-                time.sleep(GameConfig.GAME_OVER_WAIT_TIME)
+            # A rotation cycle can outlast a minute, so compare against
+            # the exit time rather than matching 04:00 exactly
+            if past_exit_time():
                 break
 
             # Cycle through off-season content (weather, Bears, PGA, etc.)
@@ -18,6 +18,7 @@ from off_season_handler import OffSeasonHandler
 from allstar_display import AllStarDisplay
 from scoreboard_config import GameConfig
 from setup_display import SetupDisplay, needs_setup
+import statsapi_session
 from logger import setup_logging, get_logger
 from config_validator import validate_config_on_startup
 
@@ -43,6 +44,45 @@ def is_shutdown_requested() -> bool:
     return _shutdown_requested
 
 
+# Exact game statuses and the display route each one takes
+_STATUS_ROUTES: dict[str, str] = {
+    'Scheduled': 'scheduled',
+    'Warmup': 'warmup',
+    'Pre-Game': 'warmup',
+    'In Progress': 'live',
+    'Final': 'final',
+    'Game Over': 'final',
+}
+
+# Status prefixes (e.g. 'Delayed: Rain'), checked when there is no exact match
+_STATUS_PREFIX_ROUTES: tuple[tuple[str, str], ...] = (
+    ('Delayed', 'delayed'),
+    ('Postpon', 'postponed'),
+    ('Completed Early', 'final'),
+    ('Suspend', 'suspended'),
+    ('Cancel', 'cancelled'),
+)
+
+# Routes that keep the game display even in hybrid 'offseason' mode
+_GAME_DAY_ROUTES: frozenset[str] = frozenset(
+    ('warmup', 'delayed', 'postponed', 'live', 'final'))
+
+
+def route_for_status(status: str) -> str | None:
+    """Map an MLB game status to its display route, or None if unknown"""
+    route = _STATUS_ROUTES.get(status)
+    if route is not None:
+        return route
+    for prefix, route in _STATUS_PREFIX_ROUTES:
+        if status.startswith(prefix):
+            return route
+    # Replay challenges / umpire reviews are mid-game states
+    lowered = status.lower()
+    if 'challenge' in lowered or 'review' in lowered:
+        return 'live'
+    return None
+
+
 class CubsScoreboard:
     """Main Cubs Scoreboard Application"""
 
@@ -77,6 +117,9 @@ class CubsScoreboard:
             self.split_squad_display_index: int = 0  # Which split-squad game we're showing
             self.split_squad_last_switch: float = 0.0  # Timestamp of last game switch
 
+            # Consecutive failed cycles, for the error backoff
+            self._error_streak: int = 0
+
             logger.info("All components initialized successfully")
 
         except Exception as e:
@@ -139,7 +182,11 @@ class CubsScoreboard:
                         if is_shutdown_requested():
                             break
 
-                    self.process_game_cycle()
+                    cycle_start = time.monotonic()
+                    # A failed cycle already slept its backoff; padding it
+                    # to the cycle floor would flatten the 1s, 2s, 4s steps
+                    if self.process_game_cycle():
+                        self._finish_cycle(cycle_start)
 
                 except KeyboardInterrupt:
                     raise  # Re-raise to exit cleanly
@@ -200,8 +247,9 @@ class CubsScoreboard:
         except Exception:
             return 'auto'
 
-    def process_game_cycle(self) -> None:
-        """Process one complete game cycle"""
+    def process_game_cycle(self) -> bool:
+        """Process one complete game cycle. Returns False when the cycle
+        failed and handle_error has already backed off for it"""
         try:
             # All-Star Game takes over the display while it's live (it is
             # not in the Cubs schedule, so normal routing never sees it).
@@ -211,7 +259,7 @@ class CubsScoreboard:
                 self.manager.set_status('All-Star Game')
                 if self.allstar_display.display_live_game(120):
                     self.allstar_display.display_final(60)
-                return
+                return True
 
             # The Home Run Derby likewise holds the display while it's
             # underway, re-entered until a champion is crowned.
@@ -220,7 +268,7 @@ class CubsScoreboard:
                 self.manager.set_status('Home Run Derby')
                 if self.allstar_display.display_live_derby(120):
                     self.allstar_display.display_derby_final(60)
-                return
+                return True
 
             # Get current schedule
             game_data: list[dict[str, Any]] = self.manager.get_schedule()
@@ -229,7 +277,7 @@ class CubsScoreboard:
                 logger.info("No games found in schedule - entering off-season mode")
                 # Enter off-season display
                 self.off_season_handler.display_off_season_content()
-                return
+                return True
 
             # Check for split-squad games (spring training simultaneous games)
             is_split_squad, split_indices = self.detect_split_squad_games(game_data)
@@ -274,11 +322,14 @@ class CubsScoreboard:
 
             # Route to appropriate handler based on status
             self.route_by_status(game_data, gameid, status)
+            self._error_streak = 0
+            return True
 
         except Exception as e:
             logger.error(f"Error in game cycle: {e}")
             logger.debug(traceback.format_exc())
             self.handle_error()
+            return False
 
     def determine_game_index(self, game_data: list[dict[str, Any]]) -> int:
         """Determine which game to display (handles doubleheaders)"""
@@ -301,7 +352,7 @@ class CubsScoreboard:
             return False, []
 
         # Get games that are currently active (not finished, not far in future)
-        now = pendulum.now('America/Chicago')
+        now = time.time()
         simultaneous_indices: list[int] = []
 
         for i, game in enumerate(game_data):
@@ -312,11 +363,10 @@ class CubsScoreboard:
                 simultaneous_indices.append(i)
             elif status == 'Scheduled':
                 # Check if game starts within 2 hours (could overlap with another game)
-                game_time_str = game.get('game_datetime', '')
-                if game_time_str:
+                if game.get('game_datetime'):
                     try:
-                        game_time = pendulum.parse(game_time_str)
-                        hours_until = (game_time - now).total_hours()
+                        start = self.manager.get_start_datetime(game)
+                        hours_until = (start.timestamp() - now) / 3600
                         if -0.5 <= hours_until <= 2:
                             simultaneous_indices.append(i)
                     except Exception:
@@ -385,14 +435,9 @@ class CubsScoreboard:
         # challenges/reviews) go to the normal live display, and finished
         # games go to the game-over screen, which alternates the result with
         # off-season content on its own.
+        route: str | None = route_for_status(status)
         display_mode = self._get_display_mode()
-        if (display_mode == 'offseason'
-                and status not in ('In Progress', 'Warmup', 'Pre-Game',
-                                   'Postponed', 'Final', 'Game Over')
-                and not status.startswith('Delayed')
-                and not status.startswith('Completed Early')
-                and 'challenge' not in status.lower()
-                and 'review' not in status.lower()):
+        if display_mode == 'offseason' and route not in _GAME_DAY_ROUTES:
             logger.info(f"display_mode=offseason, status={status} - hybrid cycling")
             self.state_handler.display_no_game(
                 game_data, self.current_game_index, cycle_content=True)
@@ -406,14 +451,12 @@ class CubsScoreboard:
                         or self.allstar_display.derby_is_live()))
             return
 
-        # Get lineup only for statuses whose displays actually scroll it
-        # (In Progress / Postponed fetched it before but never used it)
-        lineup: str | None = None
-        if status in ['Warmup', 'Pre-Game'] or status.startswith('Delayed'):
-            lineup = self.manager.get_lineup(gameid)
+        if route is None:
+            logger.warning(f"Unknown game status: {status}")
+            time.sleep(GameConfig.ERROR_RETRY_DELAY)
+            return
 
-        # Route based on status
-        if status == 'Scheduled':
+        if route == 'scheduled':
             self.state_handler.display_no_game(
                 game_data, self.current_game_index)
             # For spring training, cycle through off-season content between game displays
@@ -421,75 +464,49 @@ class CubsScoreboard:
             if game_type in ('S', 'E'):
                 logger.info("Spring training scheduled game - cycling through off-season content")
                 self.off_season_handler._display_rotation_cycle()
+            return
 
-        elif status in ['Warmup', 'Pre-Game']:
-            self.state_handler.display_warmup(
-                game_data, self.current_game_index, lineup, gameid
-            )
-            # After warmup, transition to game
-            self.process_game_cycle()
-
-        elif status.startswith('Delayed'):
-            self.state_handler.display_delayed(
-                game_data, self.current_game_index, lineup, gameid
-            )
-            # After delay, transition to game
-            self.process_game_cycle()
-
-        elif status.startswith('Postpon'):
-            self.state_handler.display_postponed(
-                game_data, self.current_game_index, lineup, gameid
-            )
-            # After postponement, check for rescheduling
-            self.process_game_cycle()
-
-        elif (status == 'In Progress'
-              or 'challenge' in status.lower()
-              or 'review' in status.lower()):
-            # Replay challenges / umpire reviews are mid-game states
-            self.live_handler.display_game_on(
-                game_data, self.current_game_index, gameid
-            )
-            # After game ends, cycle continues
-            self.process_game_cycle()
-
-        elif status in ['Final', 'Game Over'] or status.startswith('Completed Early'):
-            self.live_handler.display_game_over(
-                game_data, self.current_game_index, gameid
-            )
-            # After game over display, start new cycle
-            self.process_game_cycle()
-
-        elif status.startswith('Suspend'):
-            self.state_handler.display_suspended(
-                game_data, self.current_game_index, lineup, gameid
-            )
-            # After suspension display, check for resumption
-            self.process_game_cycle()
-
-        elif status.startswith('Cancel'):
-            self.state_handler.display_cancelled(
-                game_data, self.current_game_index, lineup, gameid
-            )
-            # After cancellation display, start new cycle
-            self.process_game_cycle()
-
+        if route in ('live', 'final'):
+            display = (self.live_handler.display_game_on if route == 'live'
+                       else self.live_handler.display_game_over)
+            display(game_data, self.current_game_index, gameid)
         else:
-            logger.warning(f"Unknown game status: {status}")
-            time.sleep(GameConfig.ERROR_RETRY_DELAY)
+            # Get lineup only for statuses whose displays actually scroll it
+            # (In Progress / Postponed fetched it before but never used it)
+            lineup: str | None = None
+            if route in ('warmup', 'delayed'):
+                lineup = self.manager.get_lineup(gameid)
+            display = getattr(self.state_handler, f'display_{route}')
+            display(game_data, self.current_game_index, lineup, gameid)
+
+        # Every game-day display hands back to run()'s loop, whose next
+        # cycle picks up the new status (game on, rescheduled, resumed,
+        # ...). Re-entering process_game_cycle from here would nest a
+        # stack frame per display for as long as the process runs.
+
+    def _finish_cycle(self, started: float) -> None:
+        """Sleep out the rest of MIN_GAME_CYCLE_TIME when a cycle came
+        back early (a display bailing on bad data, an empty route), so
+        the loop can't spin re-polling the schedule"""
+        remaining = GameConfig.MIN_GAME_CYCLE_TIME - (time.monotonic() - started)
+        if remaining > 0 and not is_shutdown_requested():
+            time.sleep(remaining)
 
     def handle_error(self) -> None:
-        """Handle errors gracefully"""
-        logger.info("Attempting to recover from error...")
-        time.sleep(GameConfig.ERROR_RETRY_DELAY)
-
-        # Clear canvas and restart
+        """Handle errors gracefully, backing off 1s, 2s, 4s, ... up to
+        ERROR_RETRY_DELAY while failures keep coming back to back"""
+        delay = min(GameConfig.ERROR_RETRY_DELAY, 2 ** self._error_streak)
+        if delay < GameConfig.ERROR_RETRY_DELAY:
+            self._error_streak += 1
+        logger.info(f"Attempting to recover from error in {delay}s...")
+
+        # Clear canvas, then wait out the backoff on the blank display
         try:
             self.manager.clear_canvas()
             self.manager.swap_canvas()
-            time.sleep(1)
         except Exception as e:
             logger.warning(f"Could not clear canvas during error recovery: {e}")
+        time.sleep(delay)
 
         # Don't call run() here - just let the main loop continue
 
@@ -511,6 +528,9 @@ def main() -> None:
     else:
         logger.warning("Configuration has issues - some features may be disabled")
 
+    # Reuse HTTPS connections for every MLB Stats API call
+    statsapi_session.install()
+
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGTERM, _signal_handler)
     signal.signal(signal.SIGINT, _signal_handler)
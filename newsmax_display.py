@@ -207,16 +207,16 @@ class NewsmaxDisplay:
 
             # Draw blue separator line below the logo (2 pixels wide)
             separator_y = logo_y + logo_height + 2
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, separator_y, *self.NEWSMAX_BLUE)
-                self.manager.draw_pixel(x, separator_y + 1, *self.NEWSMAX_BLUE)
+            self.manager.fill_rect(
+                0, separator_y, DisplayConfig.MATRIX_COLS, separator_y + 2,
+                self.NEWSMAX_BLUE)
         else:
             # No logo - draw text header instead
             self.manager.draw_text('small_bold', 20, 16, self.NEWSMAX_BLUE, 'NEWSMAX')
 
             # Draw a thin blue separator line
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, 20, *self.NEWSMAX_BLUE)
+            self.manager.fill_rect(
+                0, 20, DisplayConfig.MATRIX_COLS, 21, self.NEWSMAX_BLUE)
 
     def _draw_logo(self, x: int, y: int, logo: Image.Image) -> None:
         """Draw the logo at the specified position"""
@@ -255,8 +255,6 @@ class NewsmaxDisplay:
 
         while time.time() - start_time < duration:
             try:
-                self.manager.clear_canvas()
-
                 # Draw the Newsmax header with white background
                 self._draw_newsmax_header()
 
@@ -120,6 +120,9 @@ class OffSeasonHandler:
 
         # Pre-generate cached background images for performance
         self._cubs_gradient_bg: Image.Image = self._create_cubs_gradient_background()
+        # Gradient + marquee composed once, as RGB, for the scrolling
+        # news/message screens that redraw it every frame
+        self._marquee_bg: Image.Image = self._compose_marquee_background()
         self._bears_sweater_bg: Image.Image = self._create_bears_sweater_background()
 
     def _load_marquee_image(self) -> Image.Image | None:
@@ -135,6 +138,13 @@ class OffSeasonHandler:
             print(f"Error loading marquee image: {e}")
             return None
 
+    def _compose_marquee_background(self) -> Image.Image:
+        """Team gradient with the marquee image at the top, ready to blit"""
+        output_image = self._cubs_gradient_bg.copy()
+        if self._marquee_image is not None:
+            output_image.paste(self._marquee_image, (0, 0))
+        return output_image.convert("RGB")
+
     def _create_cubs_gradient_background(self) -> Image.Image:
         """Pre-generate team gradient background image for performance"""
         img = create_team_gradient_background(self.team.primary_color)
@@ -966,8 +976,6 @@ class OffSeasonHandler:
 
     def _display_bears_loading(self, message="FETCHING NEWS..."):
         """Display loading message with Bears sweater header using cached image"""
-        self.manager.clear_canvas()
-
         self._draw_sweater_header()
 
         # Display loading message centered in the content area
@@ -980,16 +988,8 @@ class OffSeasonHandler:
 
     def _display_cubs_loading(self, message="FETCHING NEWS..."):
         """Display loading message with Cubs logo using cached background"""
-        self.manager.clear_canvas()
-
-        # Use pre-generated cached gradient for performance
-        output_image = self._cubs_gradient_bg.copy()
-
-        # Paste cached marquee image (Cubs logo) at the top if available
-        if self._marquee_image is not None:
-            output_image.paste(self._marquee_image, (0, 0))
-
-        self.manager.set_image(output_image.convert("RGB"), 0, 0)
+        # Pre-composed gradient + marquee covers the whole panel
+        self.manager.set_image(self._marquee_bg, 0, 0)
 
         # Display loading message centered at bottom (or in the sign's
         # message board when the pack's marquee art has one)
@@ -1032,8 +1032,6 @@ class OffSeasonHandler:
 
         while time.time() - start_time < duration:
             try:
-                self.manager.clear_canvas()
-
                 # Draw the classic Bears sweater header
                 self._draw_sweater_header()
 
@@ -1093,16 +1091,8 @@ class OffSeasonHandler:
 
         while time.time() - start_time < duration:
             try:
-                self.manager.clear_canvas()
-
-                # Use pre-generated cached gradient for performance
-                output_image = self._cubs_gradient_bg.copy()
-
-                # Paste cached marquee image (Cubs logo) at the top if available
-                if self._marquee_image is not None:
-                    output_image.paste(self._marquee_image, (0, 0))
-
-                self.manager.set_image(output_image.convert("RGB"), 0, 0)
+                # Pre-composed gradient + marquee covers the whole panel
+                self.manager.set_image(self._marquee_bg, 0, 0)
 
                 # Get current news headline
                 current_headline = live_news[message_index]
@@ -1125,10 +1115,10 @@ class OffSeasonHandler:
                             live_news = fresh_news
 
                 # Draw scrolling text
-                self.manager.draw_text(
+                self.manager.draw_text_strip(
                     'medium_bold', int(self.scroll_position),
                     self.team.marquee_scroll_baseline,
-                    Colors.YELLOW, current_headline, smooth=False
+                    Colors.YELLOW, current_headline
                 )
 
                 self.manager.swap_canvas()
@@ -1160,16 +1150,8 @@ class OffSeasonHandler:
 
         while time.time() - start_time < duration:
             try:
-                self.manager.clear_canvas()
-
-                # Use pre-generated cached gradient for performance
-                output_image = self._cubs_gradient_bg.copy()
-
-                # Paste cached marquee image at the top if available
-                if self._marquee_image is not None:
-                    output_image.paste(self._marquee_image, (0, 0))
-
-                self.manager.set_image(output_image.convert("RGB"), 0, 0)
+                # Pre-composed gradient + marquee covers the whole panel
+                self.manager.set_image(self._marquee_bg, 0, 0)
 
                 # Get current message - custom message once, then facts continuously
                 if showing_custom and not custom_shown:
@@ -1202,10 +1184,10 @@ class OffSeasonHandler:
                             self.cubs_facts_index = 0
 
                 # Draw scrolling text
-                self.manager.draw_text(
+                self.manager.draw_text_strip(
                     'medium_bold', int(self.scroll_position),
                     self.team.marquee_scroll_baseline,
-                    Colors.YELLOW, current_message, smooth=False
+                    Colors.YELLOW, current_message
                 )
 
                 self.manager.swap_canvas()
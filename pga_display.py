@@ -82,6 +82,8 @@ class PGADisplay:
         for y in range(3):
             for x in range(DisplayConfig.MATRIX_COLS):
                 pixels[x, y] = self.PGA_GOLD
+        # Thin separator line below the header
+        img.paste((100, 100, 100), (0, 11, DisplayConfig.MATRIX_COLS, 12))
         print("PGA header background cached")
         return img
 
@@ -741,12 +743,9 @@ class PGADisplay:
     def _draw_pga_header(self):
         """Draw unique PGA Tour header with golf course/leaderboard theme using cached background"""
         # Use pre-generated cached background for performance
+        # (includes the thin separator line below the header)
         self.manager.set_image(self._pga_header_bg, 0, 0)
 
-        # Draw thin white separator line below header
-        for x in range(DisplayConfig.MATRIX_COLS):
-            self.manager.draw_pixel(x, 11, 100, 100, 100)
-
         # Draw PGA logo if available (positioned at left edge)
         if self.pga_logo:
             self._draw_logo(2, 3, self.pga_logo)
@@ -848,8 +847,6 @@ class PGADisplay:
                                 print("PGA scores updated")
                     last_update = current_time
 
-                self.manager.clear_canvas()
-
                 # Draw full background first
                 self._draw_pga_header()
 
@@ -980,7 +977,6 @@ class PGADisplay:
             message = "CHECK BACK FOR TOURNAMENT UPDATES"
 
             while time.time() - start_time < duration:
-                self.manager.clear_canvas()
                 self._draw_pga_header()
 
                 # Scroll smoothly 1 pixel at a time (like Spring Training)
@@ -1023,7 +1019,6 @@ class PGADisplay:
         days_until = (tournament_day - today).days
 
         while time.time() - start_time < duration:
-            self.manager.clear_canvas()
             self._draw_pga_header()
 
             # "UP NEXT" label in small text (shifted left 2 pixels)
@@ -1073,7 +1068,6 @@ class PGADisplay:
         start_time = time.time()
 
         while time.time() - start_time < duration:
-            self.manager.clear_canvas()
             self._draw_pga_header()
 
             # Error message centered in content area
@@ -1128,8 +1122,6 @@ class PGADisplay:
 
         while time.time() - start_time < duration:
             try:
-                self.manager.clear_canvas()
-
                 # Draw the PGA news header
                 self._draw_pga_content_header("BREAKING NEWS")
 
@@ -1179,8 +1171,6 @@ class PGADisplay:
 
         while time.time() - start_time < duration:
             try:
-                self.manager.clear_canvas()
-
                 # Draw the PGA facts header
                 self._draw_pga_content_header("GOLF FACTS")
 
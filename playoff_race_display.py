@@ -36,7 +36,6 @@ class PlayoffRaceDisplay:
         self.team = get_active_team()
         self._race_cache: dict[str, Any] | None = None
         self._race_cached_at: float = 0.0
-        self._abbr_cache: dict[int, str] = {}
         self._logo_cache: dict[tuple[str, int], Image.Image | None] = {}
 
     @staticmethod
@@ -109,16 +108,12 @@ class PlayoffRaceDisplay:
         return race['wc_rank'] is not None and race['wc_rank'] <= 3
 
     def _leader_abbr(self, team_id: int | None) -> str | None:
-        """Abbreviation for a team id (cached; None when unavailable)"""
+        """Abbreviation for a team id from the manager's shared team map
+        (one batched request a day; None when unavailable)"""
         if not team_id:
             return None
-        if team_id in self._abbr_cache:
-            return self._abbr_cache[team_id]
         try:
-            team = retry_api_call(
-                statsapi.get, 'team', {'teamId': team_id})['teams'][0]
-            self._abbr_cache[team_id] = team['abbreviation']
-            return self._abbr_cache[team_id]
+            return self.manager.get_team_abbreviations().get(team_id)
         except Exception as e:
             logger.warning("Could not fetch team %s: %s", team_id, e)
             return None
@@ -179,16 +174,13 @@ class PlayoffRaceDisplay:
         self, race: dict[str, Any], tick: float | None = None
     ) -> None:
         """Team logo, color-coded standings rows, and a playoff status strip"""
-        self.manager.clear_canvas()
         background = Image.new(
             'RGB', (DisplayConfig.MATRIX_COLS, DisplayConfig.MATRIX_ROWS),
             contrast_background(self.team))
+        # Wrigley marquee-style header: white letters on a red band
+        background.paste(MARQUEE_RED, (0, 0, DisplayConfig.MATRIX_COLS, 11))
         self.manager.set_image(background, 0, 0)
 
-        # Wrigley marquee-style header: white letters on a red band
-        for y in range(0, 11):
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, y, *MARQUEE_RED)
         title = 'PLAYOFF RACE'
         title_x = max(0, (DisplayConfig.MATRIX_COLS - len(title) * 6) // 2)
         self.manager.draw_text('small_bold', title_x, 9, Colors.WHITE, title)
@@ -253,9 +245,7 @@ class PlayoffRaceDisplay:
         return True
 
     def _fill_strip(self, color: tuple[int, int, int]) -> None:
-        for y in range(38, 48):
-            for x in range(28, DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, y, *color)
+        self.manager.fill_rect(28, 38, DisplayConfig.MATRIX_COLS, 48, color)
 
     def _paste_logo(self, logo: Image.Image, x: int, y: int) -> None:
         """Paste a transparent logo over the current frame background"""
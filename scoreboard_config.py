@@ -3,6 +3,7 @@
 from __future__ import annotations
 import json
 import os
+import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -170,19 +171,34 @@ PREVIEW_FILE_PATH = (
 
 _user_config_cache: dict = {}
 _user_config_stamp: tuple[str, float] | None = None
+# The file is stat()ed at most this often; admin-panel edits still land
+# within a second
+USER_CONFIG_CHECK_INTERVAL: float = 1.0
+_user_config_checked: tuple[str, float] | None = None  # (path, monotonic)
 
 
 def load_user_config() -> dict:
     """Load the user config JSON, re-parsing only when the file changes.
 
-    Cheap enough to call every animation frame: a stat() per call instead
-    of an open+parse, which matters for SD-card wear on a 24/7 display.
+    Cheap enough to call every animation frame: at most one stat() per
+    USER_CONFIG_CHECK_INTERVAL instead of an open+parse, which matters for
+    SD-card wear on a 24/7 display.
     """
-    global _user_config_cache, _user_config_stamp
+    global _user_config_cache, _user_config_stamp, _user_config_checked
+
+    now = time.monotonic()
+    if (_user_config_checked is not None
+            and _user_config_checked[0] == CONFIG_FILE_PATH
+            and now - _user_config_checked[1] < USER_CONFIG_CHECK_INTERVAL):
+        if _user_config_stamp is None or _user_config_stamp[0] != CONFIG_FILE_PATH:
+            return {}
+        return dict(_user_config_cache)
+    _user_config_checked = (CONFIG_FILE_PATH, now)
 
     try:
         mtime = os.path.getmtime(CONFIG_FILE_PATH)
     except OSError:
+        _user_config_stamp = None
         return {}
 
     if _user_config_stamp != (CONFIG_FILE_PATH, mtime):
@@ -290,13 +306,19 @@ class GameConfig:
     """Game-related configuration"""
     MAX_DAYS_TO_CHECK: int = 14
     GAME_CHECK_DELAY: int = 5  # seconds between game status checks
+    LIVE_POLL_BACKOFF_AFTER: int = 3  # unchanged live polls before backing off
+    LIVE_POLL_MAX_DELAY: int = 15  # seconds, backoff cap while the ball is in play
+    LIVE_POLL_BREAK_MAX_DELAY: int = 30  # seconds, backoff cap between half-innings
     NO_GAME_STANDINGS_DISPLAY_TIME: int = 15  # seconds
     PLAYOFF_RACE_DISPLAY_TIME: int = 15  # seconds, shown right after standings
     SCROLL_SPEED: float = 0.002  # seconds between scroll updates (default)
     SCROLL_PIXELS: int = 1  # pixels to move per frame
+    PREGAME_FRAME_TIME: float = 0.03  # seconds per frame, warmup/delay screens
+    PREGAME_STATUS_CHECK_INTERVAL: int = 10  # seconds between status checks on those screens
     GAME_OVER_WAIT_TIME: int = 360  # seconds for doubleheader wait
     GAME_OVER_INTERLUDE_TIME: int = 45  # seconds of FINAL screen between rotation segments
     ERROR_RETRY_DELAY: int = 10  # seconds
+    MIN_GAME_CYCLE_TIME: int = 5  # seconds, floor per main-loop game cycle
 
     # Animation timing
     ANIMATION_FRAME_DELAY: float = 0.3  # seconds between animation frames
@@ -306,6 +328,13 @@ class GameConfig:
     WEATHER_UPDATE_INTERVAL: int = 1800  # 30 minutes
     NEWS_UPDATE_INTERVAL: int = 1800  # 30 minutes
     SCHEDULE_UPDATE_INTERVAL: int = 3600  # 1 hour
+    SCHEDULE_CACHE_TTL: int = 30  # today's schedule, no game live
+    SCHEDULE_CACHE_TTL_LIVE: int = 5  # today's schedule during a live game
+    GAME_INFO_CACHE_TTL: int = 5  # full game feed shared across helpers
+    LINEUP_FEED_MAX_AGE: int = 60  # feed age the scrolling lineup accepts (refetched on each wrap)
+    STALE_DATA_MAX_AGE: int = 600  # serve cached MLB data this long if the API is down
+    TEAM_LIST_CACHE_TTL: int = 86400  # team abbreviations change about once a year
+    STANDINGS_CACHE_TTL: int = 900  # division standings, shown after every marquee pass
     LIVE_SCORE_UPDATE_INTERVAL: int = 60  # 1 minute
     SEASON_CHECK_INTERVAL: int = 86400  # 24 hours
 
@@ -380,19 +409,13 @@ class DisplayHandler(ABC):
             header_text: Text to display between stripes
         """
         # Fill background
-        for y in range(DisplayConfig.MATRIX_ROWS):
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, y, *background_color)
-
-        # Top stripe
-        for y in range(Positions.HEADER_TOP_STRIPE[0], Positions.HEADER_TOP_STRIPE[1]):
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, y, *stripe_color)
-
-        # Bottom stripe
-        for y in range(Positions.HEADER_BOTTOM_STRIPE[0], Positions.HEADER_BOTTOM_STRIPE[1]):
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, y, *stripe_color)
+        self.manager.fill_canvas(*background_color)
+
+        # Top and bottom stripes
+        for top, bottom in (Positions.HEADER_TOP_STRIPE,
+                            Positions.HEADER_BOTTOM_STRIPE):
+            self.manager.fill_rect(
+                0, top, DisplayConfig.MATRIX_COLS, bottom, stripe_color)
 
         # Header text centered
         text_width = len(header_text) * Fonts.CHAR_WIDTH_SMALL
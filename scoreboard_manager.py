@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import os
 import pendulum
+import threading
 import time
 import statsapi
+from datetime import datetime
+from zoneinfo import ZoneInfo
 from PIL import BdfFontFile, Image, ImageDraw, ImageFont
 from rgbmatrix import RGBMatrix, RGBMatrixOptions, graphics
 from scoreboard_config import (
@@ -26,6 +29,39 @@ USER_CONFIG_PATH = '/home/pi/config.json'
 # Where BDF fonts converted for the PIL preview mirror are cached
 PIL_FONT_DIR = '/var/tmp/pil_fonts'
 
+# Runs for months between reboots; cap the player cache so it can't grow
+# unbounded across a season of opponents
+PLAYER_CACHE_MAX = 512
+
+# Only what the lineup shows; the rest of a person record is bio data
+LINEUP_PEOPLE_FIELDS = 'people,id,lastName,primaryPosition,abbreviation'
+
+# Prerendered scrolling-text strips kept at once (a handful of lineups)
+TEXT_STRIP_CACHE_MAX = 16
+
+# AA text alpha below 8 lights LEDs as a faint speckle halo; this point()
+# table drops it (built once rather than from a lambda on every draw)
+AA_SPECKLE_LUT: list[int] = [0] * 8 + list(range(8, 256))
+
+# Solid fill_rect blocks kept at once (rules, bars and boxes that are
+# redrawn every frame)
+SOLID_BLOCK_CACHE_MAX = 64
+
+# rgbmatrix Color objects kept for draw_text (fixed palettes plus the odd
+# animated shade)
+GRAPHICS_COLOR_CACHE_MAX = 64
+
+# Game times are shown in the team's home (Chicago) time zone
+CHICAGO_TZ = ZoneInfo('America/Chicago')
+
+# The pregame lineup refresh fetches the game feed on a worker thread;
+# serialize feed fetches so it and the render loop never both hit the API
+# for the same game at once
+_game_fetch_lock = threading.Lock()
+# get_lineup runs on that worker and on the main thread; both rebuild the
+# shared player and lineup caches, so they take turns
+_lineup_lock = threading.Lock()
+
 _logger = get_logger("scoreboard")
 
 
@@ -47,16 +83,49 @@ class ScoreboardManager:
         self._mono_ttf_regular: str | None = find_ttf(
             Fonts.AA_MONO_REGULAR_CANDIDATES)
         self._mono_renderers: dict[str, MonoAATextRenderer] = {}
+        # Bitmap-font DrawText colors, built once per RGB tuple
+        self._graphics_colors: dict[RGBColor, Any] = {}
+        # Bitmap fonts are loaded above; build their AA replacements now
+        # too so the first frame of a screen doesn't stall parsing TTFs
+        for font_name in self.AA_MONO_FONTS:
+            self._mono_renderer(font_name)
         self.images: dict[str, Image.Image] = {}
         self.current_game: dict[str, Any] | None = None
         self.current_game_id: int | None = None
         self.current_lineup: str | None = None
         self.game_images: dict[str, Image.Image] = {}
+        # (team logo, opponent abbreviation, marquee) game_images came from
+        self._game_images_key: tuple[str, str, str] | None = None
 
         # Split-squad indicator (set by main.py when multiple games are active)
         self.split_squad_indicator: str = ""  # e.g., "1/2" or "2/2"
         self.split_squad_switch_time: float = 0.0  # When to switch to next game
 
+        # Short-lived cache of today's schedule: every handler polls
+        # get_schedule, but the data only changes every few seconds
+        self._schedule_cache: list[dict[str, Any]] | None = None
+        self._schedule_cached_at: float = 0.0
+        self._schedule_date: str | None = None
+
+        # Full game feeds by gamePk with fetch time; the screens and the
+        # pitcher/lineup helpers all read the same payload
+        self._game_cache: dict[int, tuple[float, dict[str, Any]]] = {}
+
+        # Local start datetimes and their formatted form, by
+        # game_datetime string
+        self._start_time_cache: dict[str, datetime] = {}
+        self._game_time_cache: dict[str, str] = {}
+
+        # Lineup players by person id (names/positions don't change
+        # mid-game, so each lineup rescroll only fetches new batters)
+        self._player_cache: dict[int, dict[str, Any]] = {}
+        # (game feed, lineup text built from it)
+        self._lineup_cache: tuple[dict[str, Any], str] | None = None
+
+        # MLB team id -> abbreviation, from one all-teams request
+        self._team_abbrevs: dict[int, str] = {}
+        self._team_abbrevs_at: float = 0.0
+
         # Cache for the no-game-today schedule lookahead
         self._lookahead_cache: list[dict[str, Any]] | None = None
         self._lookahead_cached_at: float = 0.0
@@ -65,6 +134,9 @@ class ScoreboardManager:
         self._last_brightness_check: float = 0.0
         self._applied_brightness: int | None = None
 
+        # Deadline of the last paced frame (see pace_frame)
+        self._frame_deadline: float = 0.0
+
         # Heartbeat: refreshed while frames render, so staleness means hung
         self.current_status: tuple[str, str] = ('Starting up', '')
         self._last_heartbeat: float = 0.0
@@ -152,6 +224,13 @@ class ScoreboardManager:
         self._frame_draw = ImageDraw.Draw(self._frame)
         self._pil_fonts = self._load_pil_fonts()
         self._last_preview_save: float = 0.0
+        # Scrolling text prerendered with the same PIL fonts, by
+        # (font, text, color, background)
+        self._text_strips: dict[
+            tuple[str, str, RGBColor, RGBColor], Image.Image] = {}
+        # Solid fill_rect blocks by (width, height, color)
+        self._solid_blocks: dict[
+            tuple[int, int, RGBColor], Image.Image] = {}
 
     def _load_pil_fonts(self) -> dict[str, tuple[Any, int]]:
         """Convert the BDF fonts to PIL fonts so text can be mirrored"""
@@ -215,25 +294,26 @@ class ScoreboardManager:
         """
         try:
             gameid: int = game_data[game_index]['game_id']
-            game_info: dict[str, Any] = retry_api_call(
-                statsapi.get, 'game', {'gamePk': gameid}
-            )
+            game_info: dict[str, Any] = self.get_game_info(gameid)
 
             # Determine opponent abbreviation
-            opp_abv: str = 'UNK'
-            for team_type in game_info['gameData']['teams']:
-                team_data = game_info['gameData']['teams'][team_type]
-                if team_data['abbreviation'] != self.team.abbrev:
-                    opp_abv = team_data['abbreviation']
-                    break
-
-            # Load images with individual error handling
+            opp_abv: str = self.get_opponent(game_info).get('abbreviation', 'UNK')
+
+            # Every main-loop cycle lands here, but the logos only change
+            # with the opponent or the team pack: keep the decoded set
+            images_key = (self.team.logo_path, opp_abv, self.team.marquee_path)
+            if self.game_images and images_key == self._game_images_key:
+                return self.game_images
+
+            # Load images with individual error handling. Decode and convert
+            # once here so per-frame drawing never touches the files or
+            # re-converts palette/greyscale assets.
             self.game_images = {}
 
             # Load team logo (required)
             team_logo_path = self.team.logo_path
             try:
-                self.game_images['team'] = Image.open(team_logo_path)
+                self.game_images['team'] = Image.open(team_logo_path).convert('RGBA')
             except FileNotFoundError:
                 print(f"Warning: Team logo not found at {team_logo_path}")
                 self.game_images['team'] = self._create_placeholder_image()
@@ -241,7 +321,7 @@ class ScoreboardManager:
             # Load opponent logo (fall back to placeholder)
             opp_logo_path = f'./logos/{opp_abv}.png'
             try:
-                self.game_images['opponent'] = Image.open(opp_logo_path)
+                self.game_images['opponent'] = Image.open(opp_logo_path).convert('RGBA')
             except FileNotFoundError:
                 print(f"Warning: Opponent logo not found at {opp_logo_path}, using placeholder")
                 self.game_images['opponent'] = self._create_placeholder_image()
@@ -249,7 +329,7 @@ class ScoreboardManager:
             # Load batting indicator (optional)
             batting_path = './baseball.png'
             try:
-                self.game_images['batting'] = Image.open(batting_path)
+                self.game_images['batting'] = Image.open(batting_path).convert('RGBA')
             except FileNotFoundError:
                 print(f"Warning: Batting image not found at {batting_path}")
                 self.game_images['batting'] = self._create_placeholder_image(size=(8, 8))
@@ -257,11 +337,12 @@ class ScoreboardManager:
             # Load marquee image (optional)
             marquee_path = self.team.marquee_path
             try:
-                self.game_images['marquee'] = Image.open(marquee_path)
+                self.game_images['marquee'] = Image.open(marquee_path).convert('RGBA')
             except FileNotFoundError:
                 print(f"Warning: Marquee image not found at {marquee_path}")
                 self.game_images['marquee'] = self._create_placeholder_image()
 
+            self._game_images_key = images_key
             return self.game_images
 
         except Exception as e:
@@ -287,14 +368,51 @@ class ScoreboardManager:
             'marquee': self._create_placeholder_image(size=(96, 32))
         }
 
+    def _schedule_ttl(self) -> int:
+        """Seconds today's cached schedule stays fresh (short while live)"""
+        if self._schedule_cache and any(
+                g.get('status') == 'In Progress' for g in self._schedule_cache):
+            return GameConfig.SCHEDULE_CACHE_TTL_LIVE
+        return GameConfig.SCHEDULE_CACHE_TTL
+
+    def invalidate_schedule(self) -> None:
+        """Force the next get_schedule call to hit the API"""
+        self._schedule_cached_at = 0.0
+
+    def _get_today_schedule(self) -> list[dict[str, Any]]:
+        """Today's games, cached briefly; serves the last good result if
+        the MLB API fails so a hiccup doesn't blank the display. The cache
+        is per date, so yesterday's games are never served after midnight."""
+        now = time.time()
+        # Called on every scroll wrap: a plain strftime rather than
+        # building a tz-aware pendulum DateTime just for the date
+        today = time.strftime('%m/%d/%Y')
+        cached = (self._schedule_cache
+                  if self._schedule_date == today else None)
+        if (cached is not None
+                and now - self._schedule_cached_at < self._schedule_ttl()):
+            return cached
+
+        try:
+            sched: list[dict[str, Any]] = retry_api_call(
+                statsapi.schedule,
+                start_date=today,
+                team=self.team.mlb_team_id
+            )
+        except Exception as e:
+            if cached is None:
+                raise
+            _logger.warning("Schedule fetch failed (%s); using cached data", e)
+            return cached
+
+        self._schedule_cache = sched
+        self._schedule_cached_at = now
+        self._schedule_date = today
+        return sched
+
     def get_schedule(self) -> list[dict[str, Any]]:
         """Get the Cubs game schedule"""
-        current_date = pendulum.now()
-        date_string: str = current_date.format('MM/DD/YYYY')
-        sched: list[dict[str, Any]] = retry_api_call(
-            statsapi.schedule,
-            start_date=date_string, team=self.team.mlb_team_id
-        )
+        sched = self._get_today_schedule()
         if sched:
             return sched
 
@@ -306,13 +424,21 @@ class ScoreboardManager:
                 and now - self._lookahead_cached_at < GameConfig.SCHEDULE_UPDATE_INTERVAL):
             return self._lookahead_cache
 
-        future: list[dict[str, Any]] = retry_api_call(
-            statsapi.schedule,
-            start_date=current_date.add(days=1).format('MM/DD/YYYY'),
-            end_date=current_date.add(
-                days=GameConfig.MAX_DAYS_TO_CHECK).format('MM/DD/YYYY'),
-            team=self.team.mlb_team_id
-        )
+        current_date = pendulum.now()
+        try:
+            future: list[dict[str, Any]] = retry_api_call(
+                statsapi.schedule,
+                start_date=current_date.add(days=1).format('MM/DD/YYYY'),
+                end_date=current_date.add(
+                    days=GameConfig.MAX_DAYS_TO_CHECK).format('MM/DD/YYYY'),
+                team=self.team.mlb_team_id
+            )
+        except Exception as e:
+            if self._lookahead_cache is None:
+                raise
+            _logger.warning(
+                "Schedule lookahead failed (%s); using cached data", e)
+            return self._lookahead_cache
 
         if future:
             # Keep only the next game day (matches the old day-by-day scan)
@@ -325,6 +451,77 @@ class ScoreboardManager:
         self._lookahead_cached_at = now
         return future
 
+    def get_game_info(
+        self, gameid: int, max_age: float = GameConfig.GAME_INFO_CACHE_TTL
+    ) -> dict[str, Any]:
+        """Full game feed (gameData + liveData), cached for a few seconds
+        so the screens and helpers that each need it share one request.
+        Pass max_age=0 to force a fresh fetch. If the MLB API is down, a
+        feed up to STALE_DATA_MAX_AGE old is served instead of raising."""
+        now = time.time()
+        cached = self._game_cache.get(gameid)
+        if cached is not None and now - cached[0] < max_age:
+            return cached[1]
+
+        with _game_fetch_lock:
+            # Another thread may have fetched it while we waited
+            now = time.time()
+            cached = self._game_cache.get(gameid)
+            if cached is not None and now - cached[0] < max_age:
+                return cached[1]
+
+            try:
+                game_info: dict[str, Any] = retry_api_call(
+                    statsapi.get, 'game', {'gamePk': gameid}
+                )
+            except Exception as e:
+                if (cached is None
+                        or now - cached[0] >= GameConfig.STALE_DATA_MAX_AGE):
+                    raise
+                _logger.warning(
+                    "Game %s fetch failed (%s); using %.0fs old data",
+                    gameid, e, now - cached[0])
+                return cached[1]
+
+            # Drop feeds too old to serve even as a fallback so a season
+            # of games doesn't pile up in memory
+            self._game_cache = {
+                pk: entry for pk, entry in self._game_cache.items()
+                if now - entry[0] < GameConfig.STALE_DATA_MAX_AGE
+            }
+            self._game_cache[gameid] = (now, game_info)
+            return game_info
+
+    def get_team_abbreviations(self) -> dict[int, str]:
+        """Abbreviations of every MLB team by id, fetched in one request
+        and refreshed daily; keeps the last good map if the API fails"""
+        now = time.time()
+        if (self._team_abbrevs
+                and now - self._team_abbrevs_at < GameConfig.TEAM_LIST_CACHE_TTL):
+            return self._team_abbrevs
+
+        try:
+            teams: list[dict[str, Any]] = retry_api_call(
+                statsapi.get, 'teams',
+                {'sportId': 1, 'fields': 'teams,id,abbreviation'}
+            )['teams']
+        except Exception as e:
+            if not self._team_abbrevs:
+                raise
+            _logger.warning("Team list fetch failed (%s); using cached data", e)
+            return self._team_abbrevs
+
+        self._team_abbrevs = {t['id']: t['abbreviation'] for t in teams}
+        self._team_abbrevs_at = now
+        return self._team_abbrevs
+
+    def get_opponent(self, game_info: dict[str, Any]) -> dict[str, Any]:
+        """The opposing team's gameData entry from a game feed"""
+        teams = game_info['gameData']['teams']
+        if teams['home']['abbreviation'] == self.team.abbrev:
+            return teams['away']
+        return teams['home']
+
     def get_pitchers(
         self, game_data: list[dict[str, Any]], game_index: int, gameid: int
     ) -> str:
@@ -332,9 +529,7 @@ class ScoreboardManager:
         home_pitcher: str = game_data[game_index]['home_probable_pitcher'] or 'TBD'
         away_pitcher: str = game_data[game_index]['away_probable_pitcher'] or 'TBD'
 
-        game_info: dict[str, Any] = retry_api_call(
-            statsapi.get, 'game', {'gamePk': gameid}
-        )
+        game_info: dict[str, Any] = self.get_game_info(gameid)
 
         if game_data[game_index]['home_id'] == self.team.mlb_team_id:
             away_team: str = game_info['gameData']['teams']['away']['teamName']
@@ -344,90 +539,142 @@ class ScoreboardManager:
             return f'{self.team.short_name} Pitcher: {away_pitcher}    {home_team} Pitcher: {home_pitcher}'
 
     def get_lineup(self, gameid: int) -> str:
-        """Get the lineup for both teams"""
+        """Get the lineup for both teams. The pregame screens call this
+        on every scroll wrap, mid-animation, so it accepts a feed up to
+        LINEUP_FEED_MAX_AGE old rather than fetching each time."""
         try:
-            game_info: dict[str, Any] = retry_api_call(
-                statsapi.get, 'game', {'gamePk': gameid}
-            )
-            boxscore: dict[str, Any] = game_info['liveData']['boxscore']
-
-            lineup: list[str] = []
-
-            home_team: str = boxscore['teams']['home']['team']['name']
-            home_batters: list[int] = boxscore['teams']['home']['batters']
-            away_team: str = boxscore['teams']['away']['team']['name']
-            away_batters: list[int] = boxscore['teams']['away']['batters']
-
-            # Fetch every batter in one batched call instead of one call
-            # per player (the people endpoint accepts comma-separated IDs)
-            players_by_id: dict[int, dict[str, Any]] = {}
-            all_batters = home_batters + away_batters
-            if all_batters:
-                people = retry_api_call(
-                    statsapi.get, 'people',
-                    {'personIds': ','.join(str(pid) for pid in all_batters)}
-                )['people']
-                players_by_id = {p['id']: p for p in people}
-
-            # Process home team
-            home_lineup: str = f"{home_team} - "
-            for player_id in home_batters:
-                player_info = players_by_id.get(player_id)
-                if not player_info:
-                    continue
-                last_name: str = player_info['lastName']
-                position: str = player_info['primaryPosition']['abbreviation']
-                home_lineup += f"{position}:{last_name} "
-
-            lineup.append(home_lineup)
-
-            # Process away team
-            away_lineup: str = f"  {away_team} - "
-            for player_id in away_batters:
-                player_info = players_by_id.get(player_id)
-                if not player_info:
-                    continue
-                last_name = player_info['lastName']
-                position = player_info['primaryPosition']['abbreviation']
-                away_lineup += f"{position}:{last_name} "
-
-            lineup.append(away_lineup)
-
-            return ''.join(lineup)
+            game_info: dict[str, Any] = self.get_game_info(
+                gameid, max_age=GameConfig.LINEUP_FEED_MAX_AGE)
+            # The pregame refresh worker and the router can both land here;
+            # one at a time, so neither reads the player cache mid-clear
+            with _lineup_lock:
+                return self._lineup_text(game_info)
 
         except Exception as e:
             print(f"Error getting lineup: {e}")
             return "Lineup not available"
 
+    def _lineup_text(self, game_info: dict[str, Any]) -> str:
+        """Lineup text for a game feed; callers hold _lineup_lock"""
+        # Same feed object as the last call: the text can't differ
+        if (self._lineup_cache is not None
+                and self._lineup_cache[0] is game_info):
+            return self._lineup_cache[1]
+        boxscore: dict[str, Any] = game_info['liveData']['boxscore']
+
+        lineup: list[str] = []
+
+        home_team: str = boxscore['teams']['home']['team']['name']
+        home_batters: list[int] = boxscore['teams']['home']['batters']
+        away_team: str = boxscore['teams']['away']['team']['name']
+        away_batters: list[int] = boxscore['teams']['away']['batters']
+
+        # The feed's gameData.players already carries each player's name
+        # and position; only batters missing from it fall back to one
+        # batched people call (the endpoint accepts comma-separated IDs),
+        # trimmed to the fields the lineup shows
+        players_by_id = self._player_cache
+        feed_players: dict[str, Any] = (
+            game_info.get('gameData', {}).get('players', {}))
+        batters = list(dict.fromkeys(home_batters + away_batters))
+        uncached = [pid for pid in batters if pid not in players_by_id]
+        # Check the cap once, before any insert: clearing midway would
+        # drop players this same call had already cached
+        if len(players_by_id) + len(uncached) > PLAYER_CACHE_MAX:
+            players_by_id.clear()
+            uncached = batters
+        missing: list[int] = []
+        for pid in uncached:
+            player = feed_players.get(f'ID{pid}') or {}
+            position = player.get('primaryPosition', {}).get('abbreviation')
+            if 'lastName' in player and position:
+                # Keep only what the lineup shows, not the whole entry
+                players_by_id[pid] = {
+                    'id': pid, 'lastName': player['lastName'],
+                    'primaryPosition': {'abbreviation': position}}
+            else:
+                missing.append(pid)
+        if missing:
+            people = retry_api_call(
+                statsapi.get, 'people',
+                {'personIds': ','.join(str(pid) for pid in missing),
+                 'fields': LINEUP_PEOPLE_FIELDS}
+            )['people']
+            players_by_id.update((p['id'], p) for p in people)
+
+        # Process home team
+        home_lineup: str = f"{home_team} - "
+        for player_id in home_batters:
+            player_info = players_by_id.get(player_id)
+            if not player_info:
+                continue
+            last_name: str = player_info['lastName']
+            position: str = player_info['primaryPosition']['abbreviation']
+            home_lineup += f"{position}:{last_name} "
+
+        lineup.append(home_lineup)
+
+        # Process away team
+        away_lineup: str = f"  {away_team} - "
+        for player_id in away_batters:
+            player_info = players_by_id.get(player_id)
+            if not player_info:
+                continue
+            last_name = player_info['lastName']
+            position = player_info['primaryPosition']['abbreviation']
+            away_lineup += f"{position}:{last_name} "
+
+        lineup.append(away_lineup)
+
+        text = ''.join(lineup)
+        self._lineup_cache = (game_info, text)
+        return text
+
+    def get_start_datetime(self, game: dict[str, Any]) -> datetime:
+        """
+        Get a game's start as an aware Chicago datetime.
+
+        Parsed once per game_datetime string; raises KeyError/ValueError
+        if the schedule entry has no usable start time.
+        """
+        game_datetime_str: str = game['game_datetime']
+        cached = self._start_time_cache.get(game_datetime_str)
+        if cached is None:
+            # fromisoformat only accepts a trailing 'Z' from Python 3.11
+            cached = datetime.fromisoformat(
+                game_datetime_str.replace('Z', '+00:00')).astimezone(CHICAGO_TZ)
+            self._start_time_cache[game_datetime_str] = cached
+        return cached
+
     def format_game_time(
         self, game_data: list[dict[str, Any]], game_index: int
     ) -> str:
         """
         Format the game time for display in local Chicago time.
 
-        Uses pendulum for proper timezone handling including DST.
+        Uses zoneinfo for proper timezone handling including DST. Results
+        are cached by start time since every pregame screen asks for it.
         """
-        try:
-            # Get the full datetime string from game data
-            game_datetime_str: str = game_data[game_index]['game_datetime']
-
-            # Parse the ISO datetime string (UTC) using pendulum
-            game_datetime = pendulum.parse(game_datetime_str)
-
-            # Convert to Chicago timezone (handles CST/CDT automatically)
-            chicago_time = game_datetime.in_timezone('America/Chicago')
+        game: dict[str, Any] = game_data[game_index]
+        game_datetime_str: str | None = game.get('game_datetime')
+        cached = self._game_time_cache.get(game_datetime_str)
+        if cached is not None:
+            return cached
 
-            # Format as 12-hour time (e.g., "7:05")
-            return chicago_time.format('h:mm')
-
-        except Exception as e:
+        try:
+            # Chicago time (handles CST/CDT automatically)
+            chicago_time = self.get_start_datetime(game)
+        except (KeyError, AttributeError, TypeError, ValueError) as e:
             print(f"Error formatting game time: {e}")
-            # Fallback to raw time extraction if parsing fails
-            try:
-                game_time: str = game_data[game_index]['game_datetime'][11:16]
-                return game_time
-            except Exception:
-                return "TBD"
+            # Fall back to the raw HH:MM when the timestamp won't parse
+            if isinstance(game_datetime_str, str) and len(game_datetime_str) >= 16:
+                return game_datetime_str[11:16]
+            return "TBD"
+
+        # Format as 12-hour time (e.g., "7:05")
+        formatted = f"{chicago_time.hour % 12 or 12}:{chicago_time.minute:02d}"
+        self._game_time_cache[game_datetime_str] = formatted
+        return formatted
 
     def clear_canvas(self) -> None:
         """Clear the canvas"""
@@ -502,6 +749,15 @@ class ScoreboardManager:
         self._last_heartbeat = now
         write_status_heartbeat(*self.current_status)
 
+    def keep_alive(self) -> bool:
+        """The per-frame housekeeping of swap_canvas, for loops that skip
+        swapping an unchanged frame. True if the brightness changed, in
+        which case the frame should be redrawn after all."""
+        applied = self._applied_brightness
+        self.update_brightness()
+        self._refresh_heartbeat()
+        return self._applied_brightness != applied
+
     def swap_canvas(self) -> None:
         """Swap the canvas buffer"""
         self.update_brightness()
@@ -509,6 +765,23 @@ class ScoreboardManager:
         self._refresh_heartbeat()
         self.canvas = self.matrix.SwapOnVSync(self.canvas)
 
+    def pace_frame(self, interval: float) -> None:
+        """Sleep out the rest of a fixed frame interval since the last call.
+
+        Unlike a plain sleep after swap_canvas, time spent drawing and
+        waiting for vsync counts toward the interval, so scroll speed
+        stays steady when a frame is expensive.
+        """
+        now = time.monotonic()
+        deadline = self._frame_deadline + interval
+        if deadline > now:
+            time.sleep(deadline - now)
+            self._frame_deadline = deadline
+        else:
+            # Fell behind (or first frame after a pause): don't try to
+            # catch up with a burst of unslept frames
+            self._frame_deadline = now
+
     def _mono_renderer(self, font_name: str) -> MonoAATextRenderer | None:
         """Fixed-advance AA renderer for a bitmap font name, or None when
         the font stays bitmap or no monospaced TTF is available"""
@@ -538,10 +811,9 @@ class ScoreboardManager:
             return
         mask = alpha_img.crop(
             (left - x, upper - top, right - x, lower - top))
-        # Sub-8 alpha would light LEDs as a faint speckle halo; drop it
-        mask = mask.point(lambda a: 0 if a < 8 else a)
+        mask = mask.point(AA_SPECKLE_LUT)
         region = self._frame.crop((left, upper, right, lower))
-        region.paste(Image.new('RGB', region.size, color_tuple), (0, 0), mask)
+        region.paste(color_tuple, (0, 0), mask)
         self.set_image(region, left, upper)
 
     def draw_text(
@@ -562,7 +834,12 @@ class ScoreboardManager:
             print(f"Font {font_name} not found")
             return
 
-        color = graphics.Color(*color_tuple)
+        color = self._graphics_colors.get(color_tuple)
+        if color is None:
+            if len(self._graphics_colors) >= GRAPHICS_COLOR_CACHE_MAX:
+                self._graphics_colors.clear()
+            color = self._graphics_colors[color_tuple] = graphics.Color(
+                *color_tuple)
         graphics.DrawText(self.canvas, font, x, y, color, text)
 
         # Mirror for the preview: DrawText's y is the baseline, PIL's is
@@ -574,6 +851,114 @@ class ScoreboardManager:
                 (int(x), int(y) - ascent), text,
                 font=pil_font, fill=color_tuple)
 
+    def _text_strip(
+        self, font_name: str, text: str, color_tuple: RGBColor,
+        bg_tuple: RGBColor | None
+    ) -> Image.Image | None:
+        """Bitmap-font text prerendered onto a solid background (or as an
+        'L' glyph mask when bg_tuple is None), or None when the font has
+        no PIL conversion"""
+        key = (font_name, text, color_tuple, bg_tuple)
+        strip = self._text_strips.get(key)
+        if strip is not None:
+            return strip
+        pil_entry = self._pil_fonts.get(font_name)
+        if not pil_entry:
+            return None
+        pil_font, _ = pil_entry
+        _, _, width, height = pil_font.getbbox(text)
+        size = (max(1, width), max(1, height))
+        if bg_tuple is None:
+            strip = Image.new('L', size, 0)
+            ImageDraw.Draw(strip).text((0, 0), text, font=pil_font, fill=255)
+        else:
+            strip = Image.new('RGB', size, bg_tuple)
+            ImageDraw.Draw(strip).text(
+                (0, 0), text, font=pil_font, fill=color_tuple)
+        if len(self._text_strips) >= TEXT_STRIP_CACHE_MAX:
+            self._text_strips.clear()
+        self._text_strips[key] = strip
+        return strip
+
+    def text_layer(
+        self, items: list[tuple[str, int, int, RGBColor, str]],
+        smooth: bool = False
+    ) -> Image.Image | None:
+        """Fixed bitmap-font labels, given as (font, x, baseline y, color,
+        text), rendered once onto a transparent full-panel RGBA layer.
+
+        For screens that redraw the same labels over an animation every
+        frame: compositing the layer replaces a DrawText glyph walk per
+        label. smooth=True matches draw_text's default instead, using the
+        AA glyphs for fonts that have them. None when a font has no PIL
+        conversion.
+        """
+        layer = Image.new(
+            'RGBA', (DisplayConfig.MATRIX_COLS, DisplayConfig.MATRIX_ROWS),
+            (0, 0, 0, 0))
+        draw = ImageDraw.Draw(layer)
+        for font_name, x, y, color_tuple, text in items:
+            renderer = self._mono_renderer(font_name) if smooth else None
+            if renderer is not None:
+                self._layer_aa(
+                    layer, int(x), int(y) - renderer.ascent,
+                    renderer.render(text), color_tuple)
+                continue
+            pil_entry = self._pil_fonts.get(font_name)
+            if not pil_entry:
+                return None
+            pil_font, ascent = pil_entry
+            draw.text((int(x), int(y) - ascent), text,
+                      font=pil_font, fill=(*color_tuple, 255))
+        return layer
+
+    @staticmethod
+    def _layer_aa(
+        layer: Image.Image, x: int, top: int, alpha_img: Image.Image,
+        color_tuple: RGBColor
+    ) -> None:
+        """Composite AA glyphs into an RGBA layer, clipped and speckle-cut
+        the same way _blit_aa draws them onto the frame"""
+        left, upper = max(0, x), max(0, top)
+        right = min(layer.width, x + alpha_img.width)
+        lower = min(layer.height, top + alpha_img.height)
+        if left >= right or upper >= lower:
+            return
+        mask = alpha_img.crop(
+            (left - x, upper - top, right - x, lower - top))
+        glyphs = Image.new('RGBA', mask.size, (*color_tuple, 0))
+        glyphs.putalpha(mask.point(AA_SPECKLE_LUT))
+        layer.alpha_composite(glyphs, (left, upper))
+
+    def draw_text_strip(
+        self, font_name: str, x: int, y: int, color_tuple: RGBColor,
+        text: str, bg_tuple: RGBColor | None = None
+    ) -> None:
+        """Draw bitmap text over a solid background as one image blit.
+
+        For long scrolling text: the glyphs are rasterized once and each
+        frame only pastes the visible slice, instead of DrawText walking
+        every glyph of the string. Without bg_tuple the slice is a glyph
+        mask composited over whatever is already drawn (gradients,
+        animations). Falls back to draw_text.
+        """
+        strip = self._text_strip(font_name, text, color_tuple, bg_tuple)
+        if strip is None:
+            self.draw_text(font_name, x, y, color_tuple, text, smooth=False)
+            return
+        x, top = int(x), int(y) - self._pil_fonts[font_name][1]
+        left, upper = max(0, x), max(0, top)
+        right = min(DisplayConfig.MATRIX_COLS, x + strip.width)
+        lower = min(DisplayConfig.MATRIX_ROWS, top + strip.height)
+        if left >= right or upper >= lower:
+            return
+        window = strip.crop((left - x, upper - top, right - x, lower - top))
+        if bg_tuple is None:
+            region = self._frame.crop((left, upper, right, lower))
+            region.paste(color_tuple, (0, 0), window)
+            window = region
+        self.set_image(window, left, upper)
+
     def _aa_renderer(self, size: int) -> AATextRenderer | None:
         """Renderer for a font size, or None when no TTF is available"""
         if self._aa_ttf is None:
@@ -634,6 +1019,34 @@ class ScoreboardManager:
         self.canvas.SetImage(rgb, x, y)
         self._frame.paste(rgb, (x, y))
 
+    def fill_rect(
+        self, x0: int, y0: int, x1: int, y1: int, color_tuple: RGBColor
+    ) -> None:
+        """Fill the rectangle [x0, x1) x [y0, y1) with a solid color in one
+        blit instead of a draw_pixel call per pixel"""
+        if x1 <= x0 or y1 <= y0:
+            return
+        # SetImage reads the block straight from Pillow's pixel buffer, so
+        # a cached block makes repeat fills allocation-free
+        key = (x1 - x0, y1 - y0, color_tuple)
+        block = self._solid_blocks.get(key)
+        if block is None:
+            if len(self._solid_blocks) >= SOLID_BLOCK_CACHE_MAX:
+                self._solid_blocks.clear()
+            block = self._solid_blocks[key] = Image.new(
+                'RGB', key[:2], color_tuple)
+        self.set_image(block, x0, y0)
+
+    def overlay_image(
+        self, image: Image.Image, x: int, y: int, mask: Image.Image
+    ) -> None:
+        """Composite a small sprite through its mask over the current
+        frame and blit just that region, instead of drawing it a pixel
+        at a time over whatever text is already there"""
+        region = self._frame.crop((x, y, x + image.width, y + image.height))
+        region.paste(image, (0, 0), mask)
+        self.set_image(region, x, y)
+
     def get_frame_copy(self) -> Image.Image:
         """Copy of the current composed frame (for animation overlays)"""
         return self._frame.copy()
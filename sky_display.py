@@ -149,7 +149,6 @@ class SkyDisplay:
         """Sun climbing its arc between today's sunrise and sunset"""
         if tick is None:
             tick = time.time()
-        self.manager.clear_canvas()
 
         # Sky warms toward golden hour near sunrise and sunset
         low_sun = 1.0 - min(1.0, min(fraction, 1.0 - fraction) / 0.18)
@@ -161,10 +160,8 @@ class SkyDisplay:
         for y in range(40, DisplayConfig.MATRIX_ROWS):
             t = (y - 40) / (DisplayConfig.MATRIX_ROWS - 1 - 40)
             color = self._blend(GRASS_TOP, GRASS_BOTTOM, t)
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, y, *color)
-        for x in range(DisplayConfig.MATRIX_COLS):
-            self.manager.draw_pixel(x, 39, 95, 150, 85)
+            self.manager.fill_rect(0, y, DisplayConfig.MATRIX_COLS, y + 1, color)
+        self.manager.fill_rect(0, 39, DisplayConfig.MATRIX_COLS, 40, (95, 150, 85))
 
         # Drifting clouds behind the sun
         for cloud in self.clouds:
@@ -246,7 +243,6 @@ class SkyDisplay:
         """Tonight's moon over a starfield"""
         if tick is None:
             tick = time.time()
-        self.manager.clear_canvas()
         self._draw_gradient(NIGHT_SKY_TOP, NIGHT_SKY_BOTTOM)
 
         # Deterministic starfield, each star twinkling at its own pace
@@ -316,21 +312,25 @@ class SkyDisplay:
         print("Displaying sun & sky...")
         if not self.clouds:
             self._init_clouds()
+        # Sunrise/sunset and the moon phase hold for the whole display, so
+        # build their DateTimes once; each frame only needs the clock
+        sunrise = sunset = None
+        if times:
+            sunrise = pendulum.from_timestamp(times[0], tz='America/Chicago')
+            sunset = pendulum.from_timestamp(times[1], tz='America/Chicago')
+        moon: tuple[float, str] | None = None
         start = time.time()
-        while time.time() - start < duration:
-            now = pendulum.now('America/Chicago')
-            fraction = (self._sun_fraction(
-                now.timestamp(), times[0], times[1]) if times else None)
+        while True:
+            now = time.time()
+            if now - start >= duration:
+                break
+            fraction = (self._sun_fraction(now, times[0], times[1])
+                        if times else None)
             if fraction is not None:
-                self._draw_day_frame(
-                    fraction,
-                    pendulum.from_timestamp(times[0], tz='America/Chicago'),
-                    pendulum.from_timestamp(times[1], tz='America/Chicago'))
+                self._draw_day_frame(fraction, sunrise, sunset)
             else:
-                phase_fraction, phase_name = self._moon_phase(now)
-                sunrise = None
-                if times:
-                    sunrise = pendulum.from_timestamp(
-                        times[0], tz='America/Chicago')
-                self._draw_night_frame(phase_fraction, phase_name, sunrise)
+                if moon is None:
+                    moon = self._moon_phase(
+                        pendulum.from_timestamp(now, tz='America/Chicago'))
+                self._draw_night_frame(moon[0], moon[1], sunrise)
             time.sleep(0.12)
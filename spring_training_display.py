@@ -33,6 +33,8 @@ class SpringTrainingDisplay:
 
         # Load and cache Spring Training header image
         self._header_image: Image.Image | None = self._load_header_image()
+        # Header composited onto the team color, built on first draw
+        self._header_background: Image.Image | None = None
 
         # Daily cache for the Opening Day lookup
         self._opening_day_cache: pendulum.DateTime | None = None
@@ -104,6 +106,10 @@ class SpringTrainingDisplay:
                         game['game_datetime']).in_timezone('America/Chicago')
                     self._opening_day_cached_on = today
                     return self._opening_day_cache
+            # Schedule not published yet: remember that for the day too,
+            # rather than refetching on every countdown refresh
+            self._opening_day_cache = None
+            self._opening_day_cached_on = today
         except Exception as e:
             print(f"Could not fetch Opening Day: {e}")
         return None
@@ -173,20 +179,23 @@ class SpringTrainingDisplay:
 
     def _draw_header(self) -> None:
         """Draw the Spring Training header image at the top, centered with the team's background color"""
-        # Create a full-screen image with the team's background color
-        background = Image.new("RGB", (96, 48), self.TEAM_COLOR)
+        # Composite once: the countdown redraws the header every frame
+        if self._header_background is None:
+            # Create a full-screen image with the team's background color
+            background = Image.new("RGB", (96, 48), self.TEAM_COLOR)
 
-        if self._header_image:
-            # Center the header image horizontally
-            image_width = self._header_image.width
-            x_offset = (96 - image_width) // 2
-            x_offset = max(0, x_offset)
+            if self._header_image:
+                # Center the header image horizontally
+                image_width = self._header_image.width
+                x_offset = (96 - image_width) // 2
+                x_offset = max(0, x_offset)
 
-            # Paste the header image onto the blue background with transparency
-            background.paste(self._header_image, (x_offset, 0), self._header_image)
+                # Paste the header image onto the blue background with transparency
+                background.paste(self._header_image, (x_offset, 0), self._header_image)
+            self._header_background = background
 
         # Display the composite image
-        self.manager.set_image(background, 0, 0)
+        self.manager.set_image(self._header_background, 0, 0)
 
     def display_spring_training_countdown(self, duration: int = 180) -> None:
         """Display Spring Training countdown with scrolling message"""
@@ -200,8 +209,6 @@ class SpringTrainingDisplay:
 
         while time.time() - start_time < duration:
             try:
-                self.manager.clear_canvas()
-
                 # Update countdown every 60 seconds
                 current_time = time.time()
                 if cached_countdown is None or (current_time - last_countdown_update) >= 60:
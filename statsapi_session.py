@@ -0,0 +1,38 @@
+"""Keep-alive HTTP for MLB-StatsAPI calls.
+
+statsapi.get and statsapi.schedule call requests.get for every request,
+so each one opens a fresh TCP + TLS connection to statsapi.mlb.com - on
+a Pi the handshake is most of a small-JSON request's latency. They also
+pass no timeout, so a stalled host can hang the display loop. Route the
+library's requests.get through one pooled Session with a timeout.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import requests
+import statsapi
+
+STATSAPI_TIMEOUT = 15  # seconds
+
+_session = requests.Session()
+
+
+class _PooledRequests:
+    """Stands in for the requests module inside statsapi: get() goes
+    through the shared Session, everything else is plain requests"""
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault('timeout', STATSAPI_TIMEOUT)
+        return _session.get(url, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(requests, name)
+
+
+def install() -> None:
+    """Make statsapi reuse pooled connections (idempotent). Retries stay
+    with retry.retry_api_call, so the session adds none of its own."""
+    if not isinstance(statsapi.requests, _PooledRequests):
+        statsapi.requests = _PooledRequests()
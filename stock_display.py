@@ -59,6 +59,8 @@ class StockDisplay:
             color = (int(18 - 13 * t), int(90 - 68 * t), int(50 - 37 * t))
             for x in range(DisplayConfig.MATRIX_COLS):
                 pixels[x, y] = color
+        # Thin separator line below header
+        img.paste((50, 95, 65), (0, 13, DisplayConfig.MATRIX_COLS, 14))
         print("Stock header background cached")
         return img
 
@@ -205,12 +207,9 @@ class StockDisplay:
         """Gradient header: trend glyph, MARKETS title, market status dot"""
         if tick is None:
             tick = time.time()
+        # Cached gradient, separator line included
         self.manager.set_image(self._stock_header_bg, 0, 0)
 
-        # Thin separator line below header
-        for x in range(DisplayConfig.MATRIX_COLS):
-            self.manager.draw_pixel(x, 13, 50, 95, 65)
-
         # Rising trend line glyph, drawn left of the title
         trend = [(2, 10), (4, 8), (6, 9), (8, 6), (10, 7), (12, 4), (14, 2)]
         for (x1, y1), (x2, y2) in zip(trend, trend[1:]):
@@ -244,7 +243,6 @@ class StockDisplay:
         self, stocks: list[dict[str, Any]], tick: float | None = None
     ) -> None:
         """All indices at a glance: symbol, price, day change"""
-        self.manager.clear_canvas()
         self._draw_header(tick)
 
         for stock, baseline in zip(stocks[:4], (21, 29, 37, 45)):
@@ -268,7 +266,6 @@ class StockDisplay:
         self, stock: dict[str, Any], tick: float | None = None
     ) -> None:
         """One index in detail with its intraday chart"""
-        self.manager.clear_canvas()
         self._draw_header(tick)
 
         price_str = self._format_price(stock['price'])
@@ -306,7 +303,6 @@ class StockDisplay:
         self.manager.swap_canvas()
 
     def _draw_no_data_frame(self, tick: float | None = None) -> None:
-        self.manager.clear_canvas()
         self._draw_header(tick)
         self.manager.draw_text(
             'micro', 20, 32, self.STOCK_WHITE, 'NO MARKET DATA')
@@ -73,6 +73,15 @@ class TestAATextRenderer:
     def test_fit_zero_width_returns_empty(self) -> None:
         assert self._renderer().fit('United', 0) == ''
 
+    def test_fit_measures_without_rasterizing(self) -> None:
+        r = self._renderer()
+        fitted = r.fit('International Heavy Cargo', 68)
+
+        # No trimmed prefix was rendered and downsampled just to measure it
+        assert r._cache == {}
+        assert r.measure(fitted) == r.render(fitted).width
+        assert r.fit('International Heavy Cargo', 68) is fitted
+
     def test_cache_is_bounded(self) -> None:
         from aa_text import CACHE_MAX
 
@@ -137,6 +146,23 @@ class TestManagerAAText:
         for r, g, b in lit:  # alpha-scaled over the black frame
             assert r <= 200 and g <= 100 and b <= 50
 
+    def test_blit_matches_per_call_threshold(self) -> None:
+        from PIL import Image
+
+        m = _manager(ttf=None)
+        m._frame = Image.new('RGB', (96, 48), (14, 51, 134))
+        alpha = Image.linear_gradient('L').resize((40, 12))
+
+        m._blit_aa(70, 3, alpha, (255, 200, 0))
+
+        region, x, y = m.set_image.call_args.args
+        expected = m._frame.crop((70, 3, 96, 15))
+        mask = alpha.crop((0, 0, 26, 12)).point(lambda a: 0 if a < 8 else a)
+        expected.paste(Image.new('RGB', expected.size, (255, 200, 0)),
+                       (0, 0), mask)
+        assert (x, y) == (70, 3)
+        assert list(region.getdata()) == list(expected.getdata())
+
     def test_measure_uses_renderer_and_caches_it(self) -> None:
         from aa_text import AATextRenderer
 
@@ -24,6 +24,8 @@ def _display():
     display._derby_cached_at = 0.0
     display._derby_prev_hrs = {}
     display._derby_burst = None
+    display._league_tiles = None
+    display._diamond_frames = {}
     return display
 
 
@@ -280,6 +282,64 @@ class TestLiveScreen:
         # Cubs batter: either the flash banner or the name is up
         assert 'CUBS STAR AT BAT' in text or 'CROW-ARMSTRONG' in text
 
+    def test_live_frame_static_parts_are_one_blit(self, monkeypatch) -> None:
+        from PIL import Image
+        import allstar_display as ad
+
+        display = self._live_display(monkeypatch, FEED_FIXTURE)
+        state = display._extract_live_state(FEED_FIXTURE)
+        state['outs'] = 2
+        state['bases'] = {'first': True, 'second': False, 'third': True}
+        display._render_live_frame(state)
+
+        display.manager.draw_pixel.assert_not_called()
+        frame = display.manager.set_image.call_args_list[0].args[0]
+
+        # Same pixels the old per-pixel drawing produced
+        expected = Image.new('RGB', (96, 48))
+        px = expected.load()
+        for x in range(96):
+            for y in range(31):
+                if x < 16:
+                    px[x, y] = (ad.AL_RED if y < 15 else
+                                ad.NL_BLUE if y > 15 else (0, 0, 0))
+                elif 17 <= x < 32:
+                    px[x, y] = (0, 0, 0) if y == 15 else (255, 255, 255)
+                elif x >= 32:
+                    px[x, y] = ad.PANEL_BG
+        for sx, sy in ((13, 3), (13, 19)):
+            for dx, dy in ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)):
+                px[sx + dx, sy + dy] = ad.GOLD
+        for i in range(3):
+            color = (255, 60, 60) if i < 2 else (70, 70, 90)
+            for dx in range(3):
+                for dy in range(3):
+                    px[39 + i * 7 + dx, 22 + dy] = color
+        for name, (bx, by) in (('second', (80, 13)), ('first', (87, 20)),
+                               ('third', (73, 20))):
+            color = ad.Colors.YELLOW if state['bases'][name] else (70, 70, 90)
+            for dy in range(-3, 4):
+                half = 3 - abs(dy)
+                for dx in range(-half, half + 1):
+                    px[bx + dx, by + dy] = color
+        assert list(frame.getdata()) == list(expected.getdata())
+
+    def test_diamond_frame_reused_per_situation(self, monkeypatch) -> None:
+        display = self._live_display(monkeypatch, FEED_FIXTURE)
+        state = display._extract_live_state(FEED_FIXTURE)
+
+        display._render_live_frame(state)
+        display._render_live_frame(dict(state))
+        first, second = (c.args[0] for c in
+                         display.manager.set_image.call_args_list)
+        assert first is second
+
+        state['outs'] = 0
+        display._render_live_frame(state)
+        third = display.manager.set_image.call_args_list[-1].args[0]
+        assert third is not first
+        assert len(display._diamond_frames) == 2
+
     def test_live_frame_shows_warmup_before_first_pitch(
             self, monkeypatch) -> None:
         import copy
@@ -607,6 +667,31 @@ class TestDerbyTracker:
         assert 'CHAMPION' in text
         assert 'SCHWARBER' in text
 
+    def test_champion_screen_parses_each_payload_once(
+            self, monkeypatch) -> None:
+        import copy
+        import allstar_display as ad
+
+        monkeypatch.setattr(ad, 'time', _FakeTime())
+
+        data = copy.deepcopy(DERBY_FIXTURE)
+        data['status']['state'] = 'Final'
+        final = data['rounds'][1]['matchups'][0]
+        final['topSeed'] = _derby_seed('Kyle Schwarber', 15, True, True, True)
+        final['bottomSeed'] = _derby_seed('Bryce Harper', 13, True, True)
+
+        display = _display()
+        display.fetch_derby_data = Mock(return_value=data)
+        display._derby_scene_background = Mock(return_value=Mock())
+        display._draw_fireworks = Mock()
+        parse = Mock(wraps=display._parse_derby)
+        display._parse_derby = parse
+
+        display.display_derby_final(1)
+
+        assert display.manager.swap_canvas.call_count == 10
+        parse.assert_called_once_with(data)
+
 
 class TestDerbyFlair:
     def test_star_field_stays_in_bounds(self) -> None:
@@ -4,6 +4,7 @@ weather config reload, spring training rollover, and wpa_supplicant escaping"""
 from __future__ import annotations
 
 import logging
+import time
 from unittest.mock import Mock, patch
 
 import pendulum
@@ -21,6 +22,7 @@ def _make_scoreboard():
 
     sb = CubsScoreboard.__new__(CubsScoreboard)
     sb.current_game_index = 0
+    sb._error_streak = 0
     sb.manager = Mock()
     sb.state_handler = Mock()
     sb.live_handler = Mock()
@@ -124,6 +126,23 @@ class TestSuspendedCancelledRouting:
             game_data, 0, 12345
         )
 
+    @pytest.mark.parametrize('status,route', [
+        ('Scheduled', 'scheduled'),
+        ('Pre-Game', 'warmup'),
+        ('Delayed Start: Rain', 'delayed'),
+        ('Postponed', 'postponed'),
+        ('Final', 'final'),
+        ('Completed Early: Rain', 'final'),
+        ('Suspended: Rain', 'suspended'),
+        ('Cancelled', 'cancelled'),
+        ('Umpire review', 'live'),
+        ('Something New', None),
+    ])
+    def test_route_table(self, status, route) -> None:
+        from main import route_for_status
+
+        assert route_for_status(status) == route
+
 
 # ============================================================================
 # Logger fallback on read-only filesystem
@@ -677,7 +696,8 @@ class TestReviewBanner:
         handler._draw_review_banner('UMPIRE REVIEW')
 
         # Banner background fills the batter strip
-        assert handler.manager.draw_pixel.call_count > 0
+        handler.manager.fill_rect.assert_called_once_with(
+            0, 39, 96, 48, (180, 0, 0))
         # Text is drawn centered-ish with the banner content
         (font, x, y, color, text), _ = handler.manager.draw_text.call_args
         assert text == 'UMPIRE REVIEW'
@@ -706,7 +726,7 @@ PEOPLE_FIXTURE = {'people': [
 class TestLineupBatching:
     """get_lineup must fetch all players in one API call, not one per batter"""
 
-    def _get_lineup(self):
+    def _get_lineup(self, manager=None):
         from scoreboard_manager import ScoreboardManager
 
         calls = []
@@ -719,7 +739,12 @@ class TestLineupBatching:
                 return PEOPLE_FIXTURE
             raise AssertionError(f'unexpected endpoint {endpoint}')
 
-        manager = ScoreboardManager.__new__(ScoreboardManager)
+        if manager is None:
+            manager = ScoreboardManager.__new__(ScoreboardManager)
+            manager._game_cache = {}
+            manager._player_cache = {}
+            manager._lineup_cache = None
+        manager._lineup_cache = None
         with patch('scoreboard_manager.statsapi.get', side_effect=fake_get):
             lineup = manager.get_lineup(12345)
         return lineup, calls
@@ -733,6 +758,8 @@ class TestLineupBatching:
         # All four batter IDs batched into a single comma-separated request
         ids = str(people_calls[0][1]['personIds'])
         assert sorted(ids.split(',')) == ['1', '2', '3', '4']
+        # ...and trimmed to the fields the lineup actually shows
+        assert 'lastName' in people_calls[0][1]['fields']
 
     def test_lineup_preserves_batting_order_and_content(self) -> None:
         lineup, _ = self._get_lineup()
@@ -740,6 +767,118 @@ class TestLineupBatching:
         assert 'Chicago Cubs - LF:Happ SS:Swanson' in lineup
         assert 'Milwaukee Brewers - DH:Yelich CF:Chourio' in lineup
 
+    def test_rescroll_reuses_cached_players(self) -> None:
+        from scoreboard_manager import ScoreboardManager
+
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager._game_cache = {}
+        manager._player_cache = {}
+        manager._lineup_cache = None
+        first, _ = self._get_lineup(manager)
+        manager._game_cache.clear()  # isolate the player cache
+        second, calls = self._get_lineup(manager)
+
+        assert first == second
+        assert [c[0] for c in calls] == ['game']
+
+    def test_rescroll_accepts_a_minute_old_feed(self) -> None:
+        from scoreboard_manager import ScoreboardManager
+
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager._game_cache = {}
+        manager._player_cache = {}
+        manager._lineup_cache = None
+        self._get_lineup(manager)
+        fetched_at, feed = manager._game_cache[12345]
+        manager._game_cache[12345] = (fetched_at - 30, feed)
+
+        _, calls = self._get_lineup(manager)
+        assert calls == []
+
+    def test_text_rebuilt_only_for_a_new_feed(self) -> None:
+        from scoreboard_manager import ScoreboardManager
+
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager._player_cache = {1: None}  # any lookup would fail loudly
+        feed = {}
+        manager.get_game_info = Mock(return_value=feed)
+        manager._lineup_cache = (feed, 'CACHED LINEUP')
+
+        assert manager.get_lineup(12345) == 'CACHED LINEUP'
+
+        manager.get_game_info.return_value = {}  # refetched feed
+        assert manager.get_lineup(12345) == 'Lineup not available'
+
+    def test_players_in_the_feed_need_no_people_call(self) -> None:
+        from scoreboard_manager import ScoreboardManager
+
+        feed = {
+            'gameData': {'players': {
+                f"ID{p['id']}": p for p in PEOPLE_FIXTURE['people'][:3]
+            }},
+            **GAME_INFO_FIXTURE,
+        }
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager._player_cache = {}
+        manager._lineup_cache = None
+        manager.get_game_info = Mock(return_value=feed)
+
+        with patch('scoreboard_manager.statsapi.get',
+                   return_value={'people': PEOPLE_FIXTURE['people'][3:]}
+                   ) as get:
+            lineup = manager.get_lineup(12345)
+
+        # Only the batter missing from gameData.players is looked up
+        get.assert_called_once()
+        assert get.call_args[0][1]['personIds'] == '4'
+        assert 'Milwaukee Brewers - DH:Yelich CF:Chourio' in lineup
+
+    def test_feed_players_are_cached_trimmed(self) -> None:
+        from scoreboard_manager import ScoreboardManager
+
+        feed = {
+            'gameData': {'players': {
+                f"ID{p['id']}": {**p, 'fullName': 'x', 'stats': [0] * 50}
+                for p in PEOPLE_FIXTURE['people']
+            }},
+            **GAME_INFO_FIXTURE,
+        }
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager._player_cache = {}
+        manager._lineup_cache = None
+        manager.get_game_info = Mock(return_value=feed)
+
+        with patch('scoreboard_manager.statsapi.get') as get:
+            manager.get_lineup(12345)
+
+        get.assert_not_called()
+        assert manager._player_cache[1] == PEOPLE_FIXTURE['people'][0]
+
+    def test_cap_clear_keeps_this_calls_batters(self) -> None:
+        """A near-full cache must not drop feed players added earlier in
+        the same call when the people lookup pushes it over the cap"""
+        from scoreboard_manager import PLAYER_CACHE_MAX, ScoreboardManager
+
+        feed = {
+            'gameData': {'players': {
+                f"ID{p['id']}": p for p in PEOPLE_FIXTURE['people'][:3]
+            }},
+            **GAME_INFO_FIXTURE,
+        }
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager._player_cache = {
+            -n: PEOPLE_FIXTURE['people'][0] for n in range(1, PLAYER_CACHE_MAX)}
+        manager._lineup_cache = None
+        manager.get_game_info = Mock(return_value=feed)
+
+        with patch('scoreboard_manager.statsapi.get',
+                   return_value={'people': PEOPLE_FIXTURE['people'][3:]}):
+            lineup = manager.get_lineup(12345)
+
+        assert 'Chicago Cubs - LF:Happ SS:Swanson' in lineup
+        assert 'Milwaukee Brewers - DH:Yelich CF:Chourio' in lineup
+        assert sorted(manager._player_cache) == [1, 2, 3, 4]
+
 
 class TestLineupFetchScope:
     """Don't fetch the (expensive) lineup for statuses that never use it"""
@@ -756,6 +895,27 @@ class TestLineupFetchScope:
             sb.route_by_status([{'game_type': 'R'}], 12345, 'Warmup')
         sb.manager.get_lineup.assert_called_once_with(12345)
 
+    def test_display_returns_to_main_loop(self) -> None:
+        """Routing must not recurse into the next cycle (unbounded stack
+        growth over a day of status changes)"""
+        sb = _make_scoreboard()
+        for status in ('In Progress', 'Warmup', 'Game Over'):
+            sb.route_by_status([{'game_type': 'R'}], 12345, status)
+        sb.process_game_cycle.assert_not_called()
+
+    def test_early_cycle_return_is_paced(self) -> None:
+        from scoreboard_config import GameConfig
+
+        sb = _make_scoreboard()
+        with patch('main.time.monotonic', return_value=101.0), \
+                patch('main.time.sleep') as sleep:
+            sb._finish_cycle(100.0)
+            sleep.assert_called_once_with(GameConfig.MIN_GAME_CYCLE_TIME - 1.0)
+
+            sleep.reset_mock()
+            sb._finish_cycle(100.0 - GameConfig.MIN_GAME_CYCLE_TIME)
+            sleep.assert_not_called()
+
 
 # ============================================================================
 # Efficiency: ranged schedule lookahead with caching
@@ -770,6 +930,9 @@ class TestScheduleLookahead:
 
         manager = ScoreboardManager.__new__(ScoreboardManager)
         manager.team = get_active_team()
+        manager._schedule_cache = None
+        manager._schedule_cached_at = 0.0
+        manager._schedule_date = None
         manager._lookahead_cache = None
         manager._lookahead_cached_at = 0.0
         return manager
@@ -821,8 +984,221 @@ class TestScheduleLookahead:
             second = manager.get_schedule()
 
         assert first == second == future
-        # 2 calls for the first invocation, only the fresh today-check after
-        assert sched.call_count == 3
+        # 2 calls for the first invocation; the second is served from cache
+        assert sched.call_count == 2
+
+
+class TestGameInfoCache:
+    """Helpers that each need the game feed must share one request"""
+
+    def _manager(self):
+        from scoreboard_manager import ScoreboardManager
+        from teams import get_active_team
+
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager.team = get_active_team()
+        manager._game_cache = {}
+        manager._player_cache = {}
+        manager._lineup_cache = None
+        return manager
+
+    def test_pitchers_and_lineup_share_one_game_fetch(self) -> None:
+        manager = self._manager()
+        game_info = {
+            'gameData': {'teams': {'away': {'teamName': 'Brewers'}}},
+            **GAME_INFO_FIXTURE,
+        }
+        calls = []
+
+        def fake_get(endpoint, params):
+            calls.append(endpoint)
+            return game_info if endpoint == 'game' else PEOPLE_FIXTURE
+
+        sched = [{'home_probable_pitcher': 'Steele',
+                  'away_probable_pitcher': 'Peralta',
+                  'home_id': manager.team.mlb_team_id}]
+        with patch('scoreboard_manager.statsapi.get', side_effect=fake_get):
+            manager.get_pitchers(sched, 0, 12345)
+            manager.get_lineup(12345)
+
+        assert calls.count('game') == 1
+
+    def test_max_age_zero_forces_refetch(self) -> None:
+        manager = self._manager()
+
+        with patch('scoreboard_manager.statsapi.get',
+                   return_value={'gameData': {}}) as get:
+            manager.get_game_info(1)
+            manager.get_game_info(1)
+            manager.get_game_info(1, max_age=0)
+        assert get.call_count == 2
+
+    def test_concurrent_callers_share_one_fetch(self) -> None:
+        import threading
+
+        manager = self._manager()
+        started, release = threading.Event(), threading.Event()
+
+        def slow_get(endpoint, params):
+            started.set()
+            release.wait(5)
+            return {'fresh': True}
+
+        with patch('scoreboard_manager.statsapi.get',
+                   side_effect=slow_get) as get:
+            worker = threading.Thread(target=manager.get_game_info, args=(1,))
+            worker.start()
+            assert started.wait(5)
+            # The render thread asks while the worker's fetch is in flight
+            timer = threading.Timer(0.05, release.set)
+            timer.start()
+            assert manager.get_game_info(1) == {'fresh': True}
+            worker.join(5)
+        assert get.call_count == 1
+
+    def test_expired_feeds_are_dropped(self) -> None:
+        manager = self._manager()
+        manager._game_cache = {99: (0.0, {'stale': True})}
+
+        with patch('scoreboard_manager.statsapi.get', return_value={}):
+            manager.get_game_info(1)
+        assert set(manager._game_cache) == {1}
+
+    def test_api_failure_serves_recent_feed(self) -> None:
+        manager = self._manager()
+        manager._game_cache = {1: (time.time() - 60, {'cached': True})}
+
+        def fail_get(endpoint, params):
+            raise ConnectionError('MLB API down')
+
+        with patch('scoreboard_manager.statsapi.get', new=fail_get), \
+                patch('retry.time.sleep'):
+            assert manager.get_game_info(1) == {'cached': True}
+
+    def test_api_failure_with_too_old_feed_raises(self) -> None:
+        from scoreboard_config import GameConfig
+
+        manager = self._manager()
+        manager._game_cache = {
+            1: (time.time() - GameConfig.STALE_DATA_MAX_AGE - 1, {})}
+
+        def fail_get(endpoint, params):
+            raise ConnectionError('MLB API down')
+
+        with patch('scoreboard_manager.statsapi.get', new=fail_get), \
+                patch('retry.time.sleep'), \
+                pytest.raises(ConnectionError):
+            manager.get_game_info(1)
+
+    def test_get_opponent_picks_other_side(self) -> None:
+        manager = self._manager()
+        mine = {'abbreviation': manager.team.abbrev, 'name': 'Us'}
+        them = {'abbreviation': 'ZZZ', 'name': 'Them'}
+
+        home_game = {'gameData': {'teams': {'home': mine, 'away': them}}}
+        away_game = {'gameData': {'teams': {'home': them, 'away': mine}}}
+        assert manager.get_opponent(home_game) is them
+        assert manager.get_opponent(away_game) is them
+
+
+# ============================================================================
+# Efficiency: short-TTL cache of today's schedule
+# ============================================================================
+
+class TestScheduleCache:
+    """Back-to-back get_schedule calls must not each hit the MLB API"""
+
+    def _make_manager(self):
+        return TestScheduleLookahead()._make_manager()
+
+    def test_repeat_calls_within_ttl_use_cache(self) -> None:
+        manager = self._make_manager()
+        today_games = [{'game_date': '2026-07-08', 'status': 'Scheduled'}]
+
+        with patch(
+            'scoreboard_manager.statsapi.schedule', return_value=today_games
+        ) as sched:
+            for _ in range(5):
+                assert manager.get_schedule() == today_games
+        assert sched.call_count == 1
+
+    def test_live_game_uses_short_ttl(self) -> None:
+        from scoreboard_config import GameConfig
+
+        manager = self._make_manager()
+        manager._schedule_cache = [{'status': 'In Progress'}]
+        assert manager._schedule_ttl() == GameConfig.SCHEDULE_CACHE_TTL_LIVE
+        manager._schedule_cache = [{'status': 'Scheduled'}]
+        assert manager._schedule_ttl() == GameConfig.SCHEDULE_CACHE_TTL
+
+    def test_invalidate_forces_refetch(self) -> None:
+        manager = self._make_manager()
+        today_games = [{'game_date': '2026-07-08', 'status': 'Final'}]
+
+        with patch(
+            'scoreboard_manager.statsapi.schedule', return_value=today_games
+        ) as sched:
+            manager.get_schedule()
+            manager.invalidate_schedule()
+            manager.get_schedule()
+        assert sched.call_count == 2
+
+    def test_api_failure_serves_stale_schedule(self) -> None:
+        manager = self._make_manager()
+        today_games = [{'game_date': '2026-07-08', 'status': 'In Progress'}]
+        manager._schedule_cache = today_games
+        manager._schedule_cached_at = 0.0  # long expired
+        manager._schedule_date = pendulum.now().format('MM/DD/YYYY')
+
+        def fail_schedule(**kwargs):
+            raise requests.ConnectionError('dns down')
+
+        with patch('retry.time.sleep'), patch(
+            'scoreboard_manager.statsapi.schedule', new=fail_schedule
+        ):
+            assert manager.get_schedule() == today_games
+
+    def test_cached_schedule_skips_pendulum(self) -> None:
+        manager = self._make_manager()
+        today_games = [{'game_date': '2026-07-08', 'status': 'Final'}]
+        manager._schedule_cache = today_games
+        manager._schedule_cached_at = time.time()
+        manager._schedule_date = pendulum.now().format('MM/DD/YYYY')
+
+        with patch('scoreboard_manager.pendulum.now') as now, patch(
+            'scoreboard_manager.statsapi.schedule'
+        ) as sched:
+            assert manager.get_schedule() is today_games
+        now.assert_not_called()
+        sched.assert_not_called()
+
+    def test_api_failure_after_midnight_drops_yesterday(self) -> None:
+        manager = self._make_manager()
+        manager._schedule_cache = [
+            {'game_date': '2026-07-08', 'status': 'Final'}]
+        manager._schedule_cached_at = time.time()  # still "fresh"
+        manager._schedule_date = '01/01/2000'
+
+        def fail_schedule(**kwargs):
+            raise requests.ConnectionError('dns down')
+
+        with patch('retry.time.sleep'), patch(
+            'scoreboard_manager.statsapi.schedule', new=fail_schedule
+        ):
+            with pytest.raises(requests.ConnectionError):
+                manager.get_schedule()
+
+    def test_api_failure_without_cache_raises(self) -> None:
+        manager = self._make_manager()
+
+        def fail_schedule(**kwargs):
+            raise requests.ConnectionError('dns down')
+
+        with patch('retry.time.sleep'), patch(
+            'scoreboard_manager.statsapi.schedule', new=fail_schedule
+        ):
+            with pytest.raises(requests.ConnectionError):
+                manager.get_schedule()
 
 
 # ============================================================================
@@ -876,6 +1252,8 @@ class TestCachedConfigLoader:
         cfg = tmp_path / 'config.json'
         cfg.write_text(json.dumps({'brightness': 90}))
         monkeypatch.setattr(sc, 'CONFIG_FILE_PATH', str(cfg))
+        clock = {'now': 1000.0}
+        monkeypatch.setattr(sc.time, 'monotonic', lambda: clock['now'])
 
         assert sc.load_user_config()['brightness'] == 90
 
@@ -883,8 +1261,32 @@ class TestCachedConfigLoader:
         st = os.stat(cfg)
         os.utime(cfg, (st.st_atime, st.st_mtime + 2))  # force mtime change
 
+        # Picked up on the next check, at most a second later
+        clock['now'] += sc.USER_CONFIG_CHECK_INTERVAL
         assert sc.load_user_config()['brightness'] == 40
 
+    def test_file_stat_at_most_once_per_interval(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        import json
+        import scoreboard_config as sc
+
+        cfg = tmp_path / 'config.json'
+        cfg.write_text(json.dumps({'brightness': 90}))
+        monkeypatch.setattr(sc, 'CONFIG_FILE_PATH', str(cfg))
+        clock = {'now': 1000.0}
+        monkeypatch.setattr(sc.time, 'monotonic', lambda: clock['now'])
+        stats = []
+        real_getmtime = sc.os.path.getmtime
+        monkeypatch.setattr(
+            sc.os.path, 'getmtime',
+            lambda p: stats.append(p) or real_getmtime(p))
+
+        for _ in range(30):  # one second of frames
+            assert sc.load_user_config()['brightness'] == 90
+            clock['now'] += 0.03
+        assert len(stats) == 1
+
     def test_display_modules_use_shared_loader(
         self, tmp_path, monkeypatch
     ) -> None:
@@ -980,16 +1382,21 @@ class TestPregameLoopExitsOnStatusChange:
     time-compare exit was dead code (pendulum 'MM' is month, and it compared
     local time against a UTC slice)."""
 
-    MAX_FRAMES = 5000  # refresh_interval is 1000; well past several checks
+    MAX_FRAMES = 5000  # 150s of frames; well past several status checks
 
     def _handler(self, monkeypatch):
         import game_state_handler as gsh
         from game_state_handler import GameStateHandler
+        from scoreboard_config import GameConfig
 
         monkeypatch.setattr(gsh.time, 'sleep', lambda s: None)
+        # Each frame advances a fake clock by the pregame frame time
+        clock = {'now': 1000.0}
+        monkeypatch.setattr(gsh.time, 'monotonic', lambda: clock['now'])
         handler = GameStateHandler.__new__(GameStateHandler)
         handler.manager = Mock()
         handler.scroll_position = 96
+        handler._lineup_pool = None
         handler.manager.split_squad_indicator = None
         handler.manager.get_lineup.return_value = 'LINEUP'
 
@@ -997,6 +1404,7 @@ class TestPregameLoopExitsOnStatusChange:
 
         def swap() -> None:
             frames['n'] += 1
+            clock['now'] += GameConfig.PREGAME_FRAME_TIME
             if frames['n'] > self.MAX_FRAMES:
                 raise AssertionError(
                     'pregame loop did not exit after status change')
@@ -1028,6 +1436,236 @@ class TestPregameLoopExitsOnStatusChange:
             'WARM UP', (0, 255, 0), '7:05 PM', 'LINEUP',
             self._game('Warmup'), 0, 824654)
 
+    def test_status_checked_on_a_clock(self, monkeypatch) -> None:
+        from scoreboard_config import GameConfig
+
+        handler = self._handler(monkeypatch)
+        handler.manager.get_schedule.side_effect = (
+            [self._game('Warmup')] * 2 + [self._game('In Progress')])
+
+        handler._display_pregame_base(
+            'WARM UP', (0, 255, 0), '7:05 PM', 'LINEUP',
+            self._game('Warmup'), 0, 824654)
+
+        # Three checks, one per interval, however many frames that took
+        assert handler.manager.get_schedule.call_count == 3
+        frames = handler.manager.swap_canvas.call_count
+        per_check = (GameConfig.PREGAME_STATUS_CHECK_INTERVAL
+                     / GameConfig.PREGAME_FRAME_TIME)
+        assert abs(frames - 3 * per_check) <= 3
+
+
+class TestBackgroundLineupRefresh:
+    """A slow lineup fetch must not freeze the pregame scroll"""
+
+    def _handler(self):
+        from game_state_handler import GameStateHandler
+
+        handler = GameStateHandler.__new__(GameStateHandler)
+        handler.manager = Mock()
+        handler._lineup_pool = None
+        return handler
+
+    def test_wrap_does_not_wait_for_fetch(self) -> None:
+        import threading
+
+        handler = self._handler()
+        release = threading.Event()
+        handler.manager.get_lineup.side_effect = (
+            lambda gameid: release.wait(5) and 'NEW LINEUP')
+
+        lineup, pending = handler._next_lineup(1, 'OLD', None)
+        assert lineup == 'OLD' and pending is not None
+
+        # Still in flight at the next wrap: keep scrolling the old text
+        lineup, still = handler._next_lineup(1, lineup, pending)
+        assert lineup == 'OLD' and still is pending
+
+        release.set()
+        pending.result(timeout=5)
+        lineup, _ = handler._next_lineup(1, lineup, pending)
+        assert lineup == 'NEW LINEUP'
+
+    def test_failed_fetch_keeps_text(self) -> None:
+        handler = self._handler()
+        handler.manager.get_lineup.side_effect = requests.ConnectionError()
+
+        lineup, pending = handler._next_lineup(1, 'OLD', None)
+        pending.exception(timeout=5)
+        lineup, _ = handler._next_lineup(1, lineup, pending)
+        assert lineup == 'OLD'
+
+    def test_loop_exit_cancels_pending_refresh(self, monkeypatch) -> None:
+        handler = TestPregameLoopExitsOnStatusChange()._handler(monkeypatch)
+        game = TestPregameLoopExitsOnStatusChange()._game
+        handler.manager.get_schedule.return_value = game('In Progress')
+        handler.scroll_position = -1000  # wrap on the first frame
+        pending = Mock()
+        handler._next_lineup = Mock(return_value=('LINEUP', pending))
+
+        handler._display_pregame_base(
+            'WARM UP', (0, 255, 0), '7:05 PM', 'LINEUP',
+            game('Warmup'), 0, 824654)
+
+        handler._next_lineup.assert_called()
+        pending.cancel.assert_called_once()
+
+    def test_lineup_built_under_lock(self) -> None:
+        """A refresh still running after its screen exits must not
+        rebuild the player cache while the router reads it"""
+        import scoreboard_manager
+        from scoreboard_manager import ScoreboardManager
+
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager._player_cache = {}
+        manager._lineup_cache = None
+        manager.get_game_info = Mock(return_value=GAME_INFO_FIXTURE)
+        held = []
+
+        def fake_get(endpoint, params):
+            held.append(scoreboard_manager._lineup_lock.locked())
+            return PEOPLE_FIXTURE
+
+        with patch('scoreboard_manager.statsapi.get', side_effect=fake_get):
+            lineup = manager.get_lineup(12345)
+
+        assert held == [True]
+        assert 'Chicago Cubs - LF:Happ SS:Swanson' in lineup
+        assert not scoreboard_manager._lineup_lock.locked()
+
+
+class TestPregameStaticLayer:
+    """The WARM UP screen's fixed text is drawn once, not every frame"""
+
+    def test_static_text_rendered_once(self, monkeypatch) -> None:
+        handler = TestPregameLoopExitsOnStatusChange()._handler(monkeypatch)
+        game = TestPregameLoopExitsOnStatusChange()._game
+        handler.manager.get_schedule.return_value = game('In Progress')
+
+        handler._display_pregame_base(
+            'WARM UP', (0, 255, 0), '7:05 PM', 'LINEUP',
+            game('Warmup'), 0, 824654)
+
+        handler.manager.text_layer.assert_called_once()
+        texts = [item[4] for item in handler.manager.text_layer.call_args[0][0]]
+        assert texts == ['WARM UP', 'START TIME', '7:05 PM']
+        handler.manager.draw_text.assert_not_called()
+        # The lineup still scrolls every frame
+        strips = handler.manager.draw_text_strip.call_args_list
+        assert [c.args[4] for c in strips].count('LINEUP') == \
+            handler.manager.swap_canvas.call_count
+
+    def test_labels_redrawn_each_frame_without_pil_fonts(
+            self, monkeypatch) -> None:
+        """With no PIL fonts the snapshot holds no text, so blitting it
+        each frame must not wipe the labels"""
+        from PIL import Image
+
+        handler = TestPregameLoopExitsOnStatusChange()._handler(monkeypatch)
+        game = TestPregameLoopExitsOnStatusChange()._game
+        handler.manager.get_schedule.return_value = game('In Progress')
+        # What the real text_layer gives when the PIL fonts didn't load
+        manager = TestRunCaptionLayers()._real_manager()
+        manager._pil_fonts = {}
+        assert manager.text_layer([('small', 17, 24, (255, 255, 255),
+                                    'START TIME')]) is None
+        handler.manager.text_layer.return_value = None
+        handler.manager.get_frame_copy.return_value = Image.new('RGB', (96, 48))
+
+        handler._display_pregame_base(
+            'WARM UP', (0, 255, 0), '7:05 PM', 'LINEUP',
+            game('Warmup'), 0, 824654)
+
+        frames = handler.manager.swap_canvas.call_count
+        texts = [c.args[4] for c in handler.manager.draw_text.call_args_list]
+        for label in ('WARM UP', 'START TIME', '7:05 PM'):
+            assert texts.count(label) == frames
+        assert all(c.kwargs == {'smooth': False}
+                   for c in handler.manager.draw_text.call_args_list)
+
+    def test_divider_is_single_fill(self, monkeypatch) -> None:
+        handler = TestPregameLoopExitsOnStatusChange()._handler(monkeypatch)
+        game = TestPregameLoopExitsOnStatusChange()._game
+        handler.manager.get_schedule.return_value = game('In Progress')
+
+        handler._display_pregame_base(
+            'WARM UP', (0, 255, 0), '7:05 PM', 'LINEUP',
+            game('Warmup'), 0, 824654)
+
+        handler.manager.fill_rect.assert_called_once_with(
+            0, 14, 96, 15, (255, 255, 255))
+        handler.manager.draw_pixel.assert_not_called()
+
+    def test_delay_loop_skips_clear_and_pixel_divider(self, monkeypatch) -> None:
+        handler = TestPregameLoopExitsOnStatusChange()._handler(monkeypatch)
+        game = TestPregameLoopExitsOnStatusChange()._game
+        handler.rain_drops = []
+        handler._stormy_bg = None
+        handler.manager.text_layer.return_value = None  # no PIL fonts
+
+        handler._display_delay_animated(
+            'DELAYED', '7:05', '', game('Delayed'), 0, 824654,
+            single_pass=True, scroll_text_override='RAIN')
+
+        frames = handler.manager.swap_canvas.call_count
+        handler.manager.clear_canvas.assert_not_called()
+        assert handler.manager.fill_rect.call_count >= frames  # one per frame
+        # The rain streaks go into the frame image
+        handler.manager.draw_pixel.assert_not_called()
+
+    def test_delay_labels_composited_from_one_layer(self, monkeypatch) -> None:
+        handler = TestPregameLoopExitsOnStatusChange()._handler(monkeypatch)
+        game = TestPregameLoopExitsOnStatusChange()._game
+        manager = TestTextStrip()._manager()
+        handler.manager.text_layer.side_effect = manager.text_layer
+        handler.rain_drops = []
+        handler._stormy_bg = None
+
+        handler._display_delay_animated(
+            'DELAYED', '7:05', '', game('Delayed'), 0, 824654,
+            single_pass=True, scroll_text_override='RAIN')
+
+        handler.manager.text_layer.assert_called_once()
+        static = [c.args[4] for c in handler.manager.draw_text.call_args_list
+                  if c.args[4] in ('DELAYED', 'START TIME', '7:05')]
+        assert static == []
+        handler.manager.fill_rect.assert_not_called()
+        frame = handler.manager.set_image.call_args_list[0].args[0]
+        assert frame.getpixel((50, 14)) == (255, 255, 255)  # divider
+
+    def test_delay_frames_reuse_one_buffer(self, monkeypatch) -> None:
+        handler = TestPregameLoopExitsOnStatusChange()._handler(monkeypatch)
+        game = TestPregameLoopExitsOnStatusChange()._game
+        handler._init_rain_drops()
+        handler._stormy_bg = None
+        handler.manager.text_layer.return_value = None
+
+        handler._display_delay_animated(
+            'DELAYED', '7:05', '', game('Delayed'), 0, 824654,
+            single_pass=True, scroll_text_override='RAIN')
+
+        images = {id(c.args[0])
+                  for c in handler.manager.set_image.call_args_list}
+        assert len(images) == 1
+        # Rain goes into the buffer, never into the cached gradient
+        bg = handler._stormy_background()
+        assert all(bg.getpixel((x, y))[2] <= 60
+                   for x in range(96) for y in range(48))
+
+    def test_text_layer_matches_direct_text(self) -> None:
+        manager = TestTextStrip()._manager()
+        manager.fonts['small'] = Mock()
+        layer = manager.text_layer([('small', 17, 24, (255, 255, 255),
+                                     'START TIME')])
+        manager.draw_text('small', 17, 24, (255, 255, 255), 'START TIME',
+                          smooth=False)
+
+        lit = {(x, y) for x in range(96) for y in range(48)
+               if layer.getpixel((x, y))[3]}
+        drawn = {(x, y) for x in range(96) for y in range(48)
+                 if manager._frame.getpixel((x, y)) != (0, 0, 0)}
+        assert lit and lit == drawn
+
 
 class TestRotationInterludeOnlyAfterContent:
     """Skipped rotation segments must not fire the between-segment
@@ -1096,3 +1734,1397 @@ class TestRotationInterludeOnlyAfterContent:
             between_callback=lambda: calls.append(1) or True)
         assert len(calls) == 1
         assert handler.bible_display.display_bible_verse.call_count == 0
+
+
+# ============================================================================
+# Efficiency: bases composited from cached sprites
+# ============================================================================
+
+def _legacy_base_pixels(bag_x: int, bag_y: int, filled: bool):
+    """Pixels (and colors) the old per-pixel base drawing produced"""
+    white = (255, 255, 255)
+    pixels = {}
+    y = bag_y
+    for a in range(0, 5):
+        pixels[(bag_x + a, y)] = white
+        y -= 1
+    for b in range(5, 10):
+        pixels[(bag_x + b, y)] = white
+        y += 1
+    for c in range(10, 5, -1):
+        pixels[(bag_x + c, y)] = white
+        y += 1
+    for d in range(5, 0, -1):
+        pixels[(bag_x + d, y)] = white
+        y -= 1
+    for fill in range(1, 6):
+        for i in range(5):
+            pixels[(bag_x + i + fill, bag_y + i - (fill - 1))] = (
+                white if filled else None)
+    return pixels
+
+
+class TestBaseSprites:
+    """Pasted base sprites must match the old pixel-by-pixel drawing"""
+
+    def _handler(self):
+        from live_game_handler import LiveGameHandler
+        from teams import get_active_team
+
+        handler = LiveGameHandler.__new__(LiveGameHandler)
+        handler.team = get_active_team()
+        handler._base_tiles = {}
+        handler._base_layers = {}
+        return handler
+
+    def test_bases_match_legacy_drawing(self) -> None:
+        from PIL import Image
+
+        handler = self._handler()
+        primary = handler.team.primary_color
+        runners = {'first': {'id': 1}, 'third': {'id': 2}}
+        image = Image.new('RGB', (96, 48), primary)
+
+        handler._paste_bases(
+            image, {'liveData': {'linescore': {'offense': runners}}})
+
+        expected = {}
+        for name, x, y in handler.BASE_POSITIONS:
+            expected.update(_legacy_base_pixels(x, y, name in runners))
+        for (x, y), color in expected.items():
+            assert image.getpixel((x, y)) == (color or primary), (x, y)
+        # Nothing outside the diamonds changed
+        changed = {(x, y) for x in range(96) for y in range(48)
+                   if image.getpixel((x, y)) != primary}
+        assert changed == {p for p, c in expected.items() if c}
+
+    def test_missing_offense_draws_empty_bases(self) -> None:
+        from PIL import Image
+
+        handler = self._handler()
+        image = Image.new('RGB', (96, 48))
+        expected = image.copy()
+        for _, x, y in handler.BASE_POSITIONS:
+            tile = handler._base_tile(False)
+            expected.paste(tile, (x, y - 5), tile)
+
+        handler._paste_bases(image, {'liveData': {'linescore': {}}})
+
+        assert list(image.getdata()) == list(expected.getdata())
+
+    def test_tiles_built_once(self) -> None:
+        handler = self._handler()
+
+        assert handler._base_tile(True) is handler._base_tile(True)
+        assert handler._base_tile(False) is not handler._base_tile(True)
+
+    def test_one_layer_per_runner_combination(self) -> None:
+        from PIL import Image
+
+        handler = self._handler()
+        feed = {'liveData': {'linescore': {'offense': {'second': {'id': 3}}}}}
+        for _ in range(3):
+            handler._paste_bases(Image.new('RGB', (96, 48)), feed)
+
+        assert list(handler._base_layers) == [(False, True, False)]
+
+
+# ============================================================================
+# Efficiency: frame pacing counts render time toward the frame interval
+# ============================================================================
+
+class TestFramePacing:
+    """pace_frame sleeps only what is left of the interval"""
+
+    def _manager(self):
+        from scoreboard_manager import ScoreboardManager
+
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager._frame_deadline = 0.0
+        return manager
+
+    def test_sleeps_remaining_interval(self, monkeypatch) -> None:
+        import scoreboard_manager as sm
+
+        clock = {'now': 100.0}
+        sleeps = []
+        monkeypatch.setattr(sm.time, 'monotonic', lambda: clock['now'])
+        monkeypatch.setattr(sm.time, 'sleep', sleeps.append)
+
+        manager = self._manager()
+        manager.pace_frame(0.03)  # first frame: sets the baseline
+        clock['now'] += 0.01  # 10ms spent drawing
+        manager.pace_frame(0.03)
+
+        assert sleeps == [pytest.approx(0.02)]
+
+    def test_slow_frame_does_not_sleep_or_burst(self, monkeypatch) -> None:
+        import scoreboard_manager as sm
+
+        clock = {'now': 100.0}
+        sleeps = []
+        monkeypatch.setattr(sm.time, 'monotonic', lambda: clock['now'])
+        monkeypatch.setattr(sm.time, 'sleep', sleeps.append)
+
+        manager = self._manager()
+        manager.pace_frame(0.03)
+        clock['now'] += 0.1  # a very slow frame
+        manager.pace_frame(0.03)
+        clock['now'] += 0.01
+        manager.pace_frame(0.03)
+
+        # Nothing slept for the slow frame; the next gets a full interval
+        assert sleeps == [pytest.approx(0.02)]
+
+
+# ============================================================================
+# Efficiency: scrolling lineup blitted from a prerendered strip
+# ============================================================================
+
+class TestTextStrip:
+    """draw_text_strip must look exactly like bitmap draw_text"""
+
+    def _manager(self):
+        from scoreboard_manager import ScoreboardManager
+
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager.canvas = Mock()
+        manager.fonts = {'lineup': Mock()}
+        manager._graphics_colors = {}
+        manager._init_preview_mirror()
+        return manager
+
+    @pytest.mark.parametrize('x', [-20, 0, 50])
+    def test_matches_draw_text(self, x) -> None:
+        manager = self._manager()
+        bg = (14, 51, 134)
+        text = 'LINEUP: 1. Happ LF  2. Swanson SS'
+
+        manager.fill_canvas(*bg)
+        manager.draw_text('lineup', x, 45, (255, 255, 255), text,
+                          smooth=False)
+        expected = manager.get_frame_copy()
+
+        manager.fill_canvas(*bg)
+        manager.draw_text_strip('lineup', x, 45, (255, 255, 255), text, bg)
+
+        assert list(manager._frame.getdata()) == list(expected.getdata())
+
+    @pytest.mark.parametrize('x', [-20, 0, 50])
+    def test_mask_matches_draw_text_over_gradient(self, x) -> None:
+        from PIL import Image
+
+        manager = self._manager()
+        gradient = Image.linear_gradient('L').resize((96, 48)).convert('RGB')
+        text = 'NEXT GAME 07-10 at 1:20 vs Brewers'
+
+        manager.set_image(gradient, 0, 0)
+        manager.draw_text('lineup', x, 45, (255, 200, 0), text, smooth=False)
+        expected = manager.get_frame_copy()
+
+        manager.set_image(gradient, 0, 0)
+        manager.draw_text_strip('lineup', x, 45, (255, 200, 0), text)
+
+        assert list(manager._frame.getdata()) == list(expected.getdata())
+
+    def test_strip_is_rendered_once(self) -> None:
+        manager = self._manager()
+
+        for x in range(96, 80, -1):
+            manager.draw_text_strip(
+                'lineup', x, 45, (255, 255, 255), 'LINEUP', (0, 0, 0))
+
+        assert len(manager._text_strips) == 1
+
+    def test_off_screen_is_a_no_op(self) -> None:
+        manager = self._manager()
+
+        manager.draw_text_strip(
+            'lineup', 200, 45, (255, 255, 255), 'LINEUP', (0, 0, 0))
+
+        manager.canvas.SetImage.assert_not_called()
+
+
+# ============================================================================
+# Efficiency: live polling backs off while the game state sits still
+# ============================================================================
+
+class TestAdaptiveLivePolling:
+    """Quiet stretches poll slower; any change snaps back to the base rate"""
+
+    def _delays(self, changes, inning_state='Top'):
+        from live_game_handler import LiveGameHandler
+        from scoreboard_config import GameConfig
+
+        delay, unchanged = float(GameConfig.GAME_CHECK_DELAY), 0
+        delays = []
+        for changed in changes:
+            delay, unchanged = LiveGameHandler._next_poll_delay(
+                changed, unchanged, delay, inning_state)
+            delays.append(delay)
+        return delays
+
+    def test_backs_off_after_quiet_polls(self) -> None:
+        assert self._delays([False] * 6) == [5, 5, 10, 10, 10, 15]
+
+    def test_change_resets_to_base_rate(self) -> None:
+        assert self._delays([False] * 3 + [True]) == [5, 5, 10, 5]
+
+    def test_longer_cap_between_half_innings(self) -> None:
+        delays = self._delays([False] * 12, inning_state='Mid')
+        assert max(delays) == 30
+
+    def test_foul_ball_counts_as_a_change(self) -> None:
+        from live_game_handler import LiveGameHandler
+
+        game_info = {'liveData': {'linescore': {
+            'balls': 1, 'strikes': 2, 'outs': 0, 'offense': {}}}}
+        before = {'currentPlay': {'about': {'atBatIndex': 7},
+                                  'playEvents': [{}, {}, {}]}}
+        after = {'currentPlay': {'about': {'atBatIndex': 7},
+                                 'playEvents': [{}, {}, {}, {}]}}
+
+        assert (LiveGameHandler._play_state(game_info, before)
+                != LiveGameHandler._play_state(game_info, after))
+
+
+class TestLiveFrameSkip:
+    """An unchanged game state must not redraw and swap the live frame"""
+
+    def _run(self, monkeypatch, keep_alive=False, polls=3):
+        import live_game_handler as lgh
+        from live_game_handler import LiveGameHandler
+        from teams import get_active_team
+
+        handler = LiveGameHandler.__new__(LiveGameHandler)
+        handler.team = get_active_team()
+        handler.manager = Mock()
+        handler.manager.split_squad_indicator = ''
+        handler.manager.keep_alive.return_value = keep_alive
+        handler._last_inning_state = 'Top'
+        handler._scoreboard_logo_rows = Mock(return_value=[])
+        handler._render_live_frame = Mock(return_value=False)
+        handler._maybe_scroll_last_play = Mock(return_value=False)
+        handler.display_game_over = Mock()
+
+        game = {'home_id': handler.team.mlb_team_id, 'home_score': 1,
+                'away_score': 0, 'status': 'In Progress'}
+        handler.manager.get_schedule.side_effect = (
+            [[game]] * polls + [[dict(game, status='Final')]])
+        handler.manager.get_game_info.return_value = {'liveData': {
+            'linescore': {'inningState': 'Top', 'balls': 1, 'strikes': 1},
+            'plays': {'currentPlay': {'about': {'atBatIndex': 3}}}}}
+        monkeypatch.setattr(lgh.time, 'sleep', lambda s: None)
+
+        handler.display_game_on([game], 0, 1)
+        return handler
+
+    def test_unchanged_state_renders_once(self, monkeypatch) -> None:
+        handler = self._run(monkeypatch)
+        assert handler._render_live_frame.call_count == 1
+        # Heartbeat/brightness still serviced on skipped frames
+        assert handler.manager.keep_alive.call_count == 2
+
+    def test_brightness_change_forces_redraw(self, monkeypatch) -> None:
+        handler = self._run(monkeypatch, keep_alive=True)
+        assert handler._render_live_frame.call_count == 3
+
+    def test_play_by_play_comes_from_the_game_feed(self, monkeypatch) -> None:
+        handler = self._run(monkeypatch, polls=1)
+
+        game_info = handler.manager.get_game_info.return_value
+        play_data = handler._render_live_frame.call_args.args[3]
+        assert play_data is game_info['liveData']['plays']
+
+    def test_static_background_built_once_per_game(
+            self, monkeypatch) -> None:
+        handler = self._run(monkeypatch, keep_alive=True)
+
+        backgrounds = {id(c.args[4])
+                       for c in handler._render_live_frame.call_args_list}
+        assert len(backgrounds) == 1
+        handler._scoreboard_logo_rows.assert_called_once()
+
+    def test_score_keys_resolved_once_per_game(self, monkeypatch) -> None:
+        handler = self._run(monkeypatch, polls=1)
+
+        assert handler._score_keys == ('home_score', 'away_score')
+        assert handler._team_scores(
+            {'home_score': 4, 'away_score': 2}) == (4, 2)
+
+
+# ============================================================================
+# Efficiency: standings abbreviations from one cached team-list request
+# ============================================================================
+
+class TestTeamAbbreviations:
+    """The standings screen must not fetch each team separately"""
+
+    TEAMS = {'teams': [{'id': 112, 'abbreviation': 'CHC'},
+                       {'id': 158, 'abbreviation': 'MIL'}]}
+
+    def _manager(self):
+        from scoreboard_manager import ScoreboardManager
+
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager._team_abbrevs = {}
+        manager._team_abbrevs_at = 0.0
+        return manager
+
+    def test_fetched_once_and_cached(self) -> None:
+        manager = self._manager()
+
+        with patch('scoreboard_manager.statsapi.get',
+                   return_value=self.TEAMS) as get:
+            assert manager.get_team_abbreviations() == {112: 'CHC', 158: 'MIL'}
+            manager.get_team_abbreviations()
+        get.assert_called_once_with(
+            'teams', {'sportId': 1, 'fields': 'teams,id,abbreviation'})
+
+    def test_standings_use_team_list(self, monkeypatch) -> None:
+        import game_state_handler as gsh
+        from game_state_handler import GameStateHandler
+
+        handler = GameStateHandler.__new__(GameStateHandler)
+        handler.manager = Mock()
+        handler._standings_cache = None
+        handler._standings_cached_at = 0.0
+        handler._standings_frame = None
+        handler.manager.get_team_abbreviations.return_value = {
+            112: 'CHC', 158: 'MIL'}
+        records = [
+            {'team': {'id': tid}, 'gamesBack': '-',
+             'leagueRecord': {'wins': 1, 'losses': 0, 'pct': '1.000'}}
+            for tid in (158, 112)]
+        endpoints = []
+
+        def fake_get(endpoint, params):
+            endpoints.append(endpoint)
+            return {'records': [{}, {'teamRecords': records}]}
+
+        monkeypatch.setattr(gsh.statsapi, 'get', fake_get)
+        monkeypatch.setattr(gsh.time, 'sleep', lambda s: None)
+        handler._display_standings()
+
+        assert endpoints == ['standings']
+        drawn = [c.args[4] for c in handler.manager.draw_text.call_args_list]
+        assert 'MIL' in drawn and 'CHC' in drawn
+
+        # The next marquee pass reuses the cached standings
+        handler._display_standings()
+        assert endpoints == ['standings']
+
+    def test_missing_abbreviation_fetched_once(self, monkeypatch) -> None:
+        import game_state_handler as gsh
+        from game_state_handler import GameStateHandler
+
+        handler = GameStateHandler.__new__(GameStateHandler)
+        handler.manager = Mock()
+        handler._standings_cache = [
+            {'team': {'id': 999}, 'gamesBack': '-',
+             'leagueRecord': {'wins': 1, 'losses': 0, 'pct': '1.000'}}]
+        handler._standings_cached_at = time.time()
+        handler._standings_frame = None
+        handler.manager.get_team_abbreviations.return_value = {112: 'CHC'}
+        endpoints = []
+
+        def fake_get(endpoint, params):
+            endpoints.append(endpoint)
+            return {'teams': [{'abbreviation': 'NEW'}]}
+
+        monkeypatch.setattr(gsh.statsapi, 'get', fake_get)
+        monkeypatch.setattr(gsh.time, 'sleep', lambda s: None)
+        handler._display_standings()
+        handler._display_standings()
+
+        assert endpoints == ['team']
+        drawn = [c.args[4] for c in handler.manager.draw_text.call_args_list]
+        # The second pass blits the table rendered by the first
+        assert drawn.count('NEW') == 1
+        handler.manager.set_image.assert_called_once_with(
+            handler.manager.get_frame_copy.return_value, 0, 0)
+
+    def test_table_redrawn_after_refresh(self, monkeypatch) -> None:
+        import game_state_handler as gsh
+        from game_state_handler import GameStateHandler
+
+        handler = GameStateHandler.__new__(GameStateHandler)
+        handler.manager = Mock()
+        handler.manager.get_team_abbreviations.return_value = {112: 'CHC'}
+        handler._standings_frame = None
+        monkeypatch.setattr(gsh.time, 'sleep', lambda s: None)
+        handler._division_standings = Mock(side_effect=[
+            [{'team': {'id': 112}, 'gamesBack': '-',
+              'leagueRecord': {'wins': w, 'losses': 0, 'pct': '1.000'}}]
+            for w in (1, 2)])
+
+        handler._display_standings()
+        handler._display_standings()
+
+        drawn = [c.args[4] for c in handler.manager.draw_text.call_args_list]
+        assert '1-0 1.000' in drawn and '2-0 1.000' in drawn
+        handler.manager.set_image.assert_not_called()
+
+
+# ============================================================================
+# Efficiency: game logos resized once per size, not on every draw
+# ============================================================================
+
+class TestSizedLogos:
+    def _handler(self):
+        from PIL import Image
+        from live_game_handler import LiveGameHandler
+
+        handler = LiveGameHandler.__new__(LiveGameHandler)
+        handler.manager = Mock()
+        handler.manager.game_images = {'team': Image.new('RGBA', (28, 28))}
+        handler._sized_logos = {}
+        return handler
+
+    def test_resized_once(self) -> None:
+        handler = self._handler()
+
+        first = handler._sized_logo('team', (26, 26))
+        assert handler._sized_logo('team', (26, 26)) is first
+        assert first.size == (26, 26) and first.mode == 'RGBA'
+
+    def test_new_game_logos_invalidate(self) -> None:
+        from PIL import Image
+
+        handler = self._handler()
+        first = handler._sized_logo('team', (26, 26))
+        handler.manager.game_images = {'team': Image.new('RGBA', (28, 28))}
+
+        assert handler._sized_logo('team', (26, 26)) is not first
+
+    def test_nearest_keeps_source_colors(self) -> None:
+        from PIL import Image
+
+        handler = self._handler()
+        logo = Image.new('RGBA', (28, 28), (14, 51, 134, 255))
+        logo.paste((204, 52, 51, 255), (0, 0, 14, 28))
+        handler.manager.game_images = {'team': logo}
+
+        nearest = handler._sized_logo('team', (26, 26), Image.NEAREST)
+        assert {c for _, c in nearest.getcolors()} == {
+            (14, 51, 134, 255), (204, 52, 51, 255)}
+        # Cached separately from the filtered size
+        assert handler._sized_logo('team', (26, 26)) is not nearest
+
+
+# ============================================================================
+# Efficiency: batting indicator blitted as a masked sprite
+# ============================================================================
+
+class TestBattingSprite:
+    """The sprite blit must light exactly what the per-pixel draw did"""
+
+    def _handler(self, sprite):
+        from live_game_handler import LiveGameHandler
+
+        manager = TestTextStrip()._manager()
+        manager.game_images = {'batting': sprite}
+        handler = LiveGameHandler.__new__(LiveGameHandler)
+        handler.manager = manager
+        handler._batting_sprite_cache = None
+        return handler
+
+    @staticmethod
+    def _legacy(frame, sprite, pos):
+        px = sprite.load()
+        for y in range(sprite.height):
+            for x in range(sprite.width):
+                p = px[x, y]
+                if (p[3] > 0) if len(p) == 4 else (p != (0, 0, 0)):
+                    frame.putpixel((pos[0] + x, pos[1] + y), p[:3])
+
+    @pytest.mark.parametrize('mode', ['RGBA', 'RGB'])
+    def test_matches_per_pixel_draw(self, mode) -> None:
+        from PIL import Image
+
+        sprite = Image.open('./baseball.png').convert(mode)
+        handler = self._handler(sprite)
+        handler.manager.fill_canvas(10, 20, 30)
+        expected = handler.manager.get_frame_copy()
+        self._legacy(expected, sprite, (30, 21))
+
+        handler._draw_batting_indicator_overlay('Bot')
+
+        assert list(handler.manager._frame.getdata()) == \
+            list(expected.getdata())
+
+    def test_sprite_built_once(self) -> None:
+        from PIL import Image
+
+        handler = self._handler(Image.open('./baseball.png').convert('RGBA'))
+        first = handler._batting_sprite()
+        assert handler._batting_sprite() == first
+
+    @pytest.mark.parametrize('state,y', [
+        ('Top', 5), ('End', 5), ('Bot', 21), ('Mid', 21), ('', 21)])
+    def test_row_by_inning_state(self, state, y) -> None:
+        from PIL import Image
+
+        handler = self._handler(Image.open('./baseball.png').convert('RGBA'))
+        handler.manager.overlay_image = Mock()
+
+        handler._draw_batting_indicator_overlay(state)
+
+        assert handler.manager.overlay_image.call_args.args[1:3] == (30, y)
+
+
+# ============================================================================
+# Efficiency: live scoreboard background painted with rectangle fills
+# ============================================================================
+
+def _legacy_live_background(primary, inning_state):
+    """The original per-pixel paint of the live scoreboard background"""
+    from PIL import Image
+
+    image = Image.new('RGB', (96, 48))
+    px = image.load()
+    for x in range(17, 32):
+        for y in range(0, 31):
+            px[x, y] = (0, 0, 0) if y == 15 else (255, 255, 255)
+    for x in range(32, 96):
+        for y in range(0, 31):
+            px[x, y] = primary
+    for x in range(0, 16):
+        px[x, 15] = (0, 0, 0)
+    for x in range(32, 96):
+        px[x, 22] = (255, 255, 255)
+    for y in range(0, 31):
+        px[70, y] = (255, 255, 255)
+    rows = range(6, 8) if inning_state in ('Top', 'End') else range(22, 24)
+    for y in rows:
+        for x in range(30, 34):
+            px[x, y] = (255, 0, 0)
+    for top in (31, 39):
+        m = 0
+        for y in range(top, top + 8):
+            for x in range(0, 96):
+                px[x, y] = (255 + m, 255 + m, 255 + m)
+            m -= 20
+    return image
+
+
+class TestLiveBackgroundFills:
+    @pytest.mark.parametrize('inning_state', ['Top', 'Bot'])
+    def test_matches_per_pixel_paint(self, inning_state) -> None:
+        from live_game_handler import LiveGameHandler
+        from teams import get_active_team
+
+        handler = LiveGameHandler.__new__(LiveGameHandler)
+        handler.team = get_active_team()
+        handler.manager = Mock()
+        for name in ('_paste_bases', '_draw_scores', '_draw_game_info_improved',
+                     '_draw_batting_indicator_overlay'):
+            setattr(handler, name, Mock())
+        handler._check_score_changes = Mock(return_value=False)
+        handler._live_frame = None
+
+        handler._render_live_frame(
+            [{}], 0, {}, {}, handler._live_background([]), inning_state, None)
+
+        frame = handler.manager.set_image.call_args_list[0].args[0]
+        expected = _legacy_live_background(
+            handler.team.primary_color, inning_state)
+        assert list(frame.getdata()) == list(expected.getdata())
+        handler.manager.draw_pixel.assert_not_called()
+
+    def test_frames_share_one_buffer_without_leftovers(self) -> None:
+        from live_game_handler import LiveGameHandler
+        from teams import get_active_team
+
+        handler = LiveGameHandler.__new__(LiveGameHandler)
+        handler.team = get_active_team()
+        handler.manager = Mock()
+        for name in ('_paste_bases', '_draw_scores', '_draw_game_info_improved',
+                     '_draw_batting_indicator_overlay'):
+            setattr(handler, name, Mock())
+        handler._check_score_changes = Mock(return_value=False)
+        handler._live_frame = None
+        background = handler._live_background([])
+
+        handler._render_live_frame([{}], 0, {}, {}, background, 'Top', None)
+        handler._render_live_frame([{}], 0, {}, {}, background, 'Bot', None)
+
+        first, second = (c.args[0] for c in handler.manager.set_image.call_args_list)
+        assert first is second is handler._live_frame
+        # The top-of-inning box from the first frame is gone
+        expected = _legacy_live_background(handler.team.primary_color, 'Bot')
+        assert list(second.getdata()) == list(expected.getdata())
+
+    def test_fill_rect_blits_once(self) -> None:
+        manager = TestTextStrip()._manager()
+
+        manager.fill_rect(0, 39, 96, 48, (180, 0, 0))
+
+        manager.canvas.SetImage.assert_called_once()
+        assert manager._frame.getpixel((50, 40)) == (180, 0, 0)
+        assert manager._frame.getpixel((50, 38)) == (0, 0, 0)
+
+    def test_fill_rect_reuses_block(self) -> None:
+        manager = TestTextStrip()._manager()
+
+        manager.fill_rect(0, 11, 96, 12, (255, 255, 255))
+        manager.fill_rect(0, 30, 96, 31, (255, 255, 255))
+        manager.fill_rect(0, 30, 96, 31, (255, 0, 0))
+
+        first, second, third = (
+            c.args[0] for c in manager.canvas.SetImage.call_args_list)
+        assert first is second
+        assert third is not first
+        assert manager._frame.getpixel((5, 11)) == (255, 255, 255)
+        assert manager._frame.getpixel((5, 30)) == (255, 0, 0)
+
+
+# ============================================================================
+# Efficiency: off-season marquee background composed once
+# ============================================================================
+
+class TestMarqueeBackground:
+    """The news/message screens blit one pre-composed RGB background"""
+
+    def test_composed_once_as_rgb(self) -> None:
+        from unittest.mock import MagicMock
+        import off_season_handler as osh
+
+        handler = osh.OffSeasonHandler(MagicMock())
+        bg = handler._marquee_bg
+
+        assert bg.mode == 'RGB' and bg.size == (96, 48)
+        expected = handler._cubs_gradient_bg.copy()
+        expected.paste(handler._marquee_image, (0, 0))
+        assert list(bg.getdata()) == list(expected.convert('RGB').getdata())
+
+        handler._display_cubs_loading()
+        handler.manager.set_image.assert_called_once_with(bg, 0, 0)
+        handler.manager.clear_canvas.assert_not_called()
+
+
+# ============================================================================
+# Efficiency: pooled keep-alive session for MLB Stats API calls
+# ============================================================================
+
+class TestStatsapiSession:
+    """statsapi requests reuse one Session and always carry a timeout"""
+
+    def test_get_goes_through_shared_session(self, monkeypatch) -> None:
+        import statsapi
+        import statsapi_session
+
+        monkeypatch.setattr(statsapi, 'requests', statsapi.requests)
+        calls = []
+
+        def fake_session_get(url, **kwargs):
+            calls.append((url, kwargs))
+            resp = Mock(status_code=200)
+            resp.json.return_value = {'teams': []}
+            return resp
+
+        monkeypatch.setattr(statsapi_session._session, 'get', fake_session_get)
+        statsapi_session.install()
+        statsapi_session.install()  # idempotent
+
+        assert statsapi.get('teams', {'sportId': 1}) == {'teams': []}
+        assert statsapi.get('teams', {'sportId': 1}) == {'teams': []}
+        assert len(calls) == 2
+        assert all(kw['timeout'] == statsapi_session.STATSAPI_TIMEOUT
+                   for _, kw in calls)
+        # Everything but get() is still the real requests module
+        assert statsapi.requests.RequestException is requests.RequestException
+
+
+# ============================================================================
+# Efficiency: run-scored captions rasterized once per animation
+# ============================================================================
+
+class TestRunCaptionLayers:
+    """The RUN SCORED / SCORES text is composited from one prerendered
+    layer instead of DrawText calls every frame"""
+
+    def _handler(self, monkeypatch):
+        from PIL import Image
+        import live_game_handler
+        from live_game_handler import LiveGameHandler
+
+        monkeypatch.setattr(live_game_handler.time, 'sleep', lambda s: None)
+        handler = LiveGameHandler.__new__(LiveGameHandler)
+        handler.manager = Mock()
+        layer = Image.new('RGBA', (96, 48), (0, 0, 0, 0))
+        layer.putpixel((40, 12), (255, 255, 0, 255))
+        handler.manager.text_layer.return_value = layer
+        handler._sized_logos = {}
+        handler.manager.game_images = {
+            'opponent': Image.new('RGBA', (20, 20))}
+        handler._run_scene = ('x', Image.new('RGB', (96, 48)),
+                              Image.new('RGBA', (4, 4)))
+        handler._caption_layers = {}
+        handler.team = Mock(run_scored_path='x')
+        return handler
+
+    def test_run_scored_banner(self, monkeypatch) -> None:
+        handler = self._handler(monkeypatch)
+        handler.animate_cubs_run()
+
+        # One AA layer per label, flattened in draw order
+        calls = handler.manager.text_layer.call_args_list
+        assert len(calls) == 4
+        assert all(c.kwargs == {'smooth': True} for c in calls)
+        handler.manager.draw_text.assert_not_called()
+        banners = [c.args[0] for c in handler.manager.set_image.call_args_list
+                   if c.args[0].getpixel((40, 12)) == (255, 255, 0)]
+        assert len(banners) == 3
+
+    def _real_manager(self):
+        from aa_text import find_ttf
+        from scoreboard_config import Fonts
+        from scoreboard_manager import ScoreboardManager
+
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager.canvas = Mock()
+        manager.fonts = {}
+        manager._graphics_colors = {}
+        manager._mono_ttf_bold = find_ttf(Fonts.AA_MONO_BOLD_CANDIDATES)
+        manager._mono_ttf_regular = find_ttf(Fonts.AA_MONO_REGULAR_CANDIDATES)
+        manager._mono_renderers = {}
+        manager._init_preview_mirror()
+        assert manager._mono_renderer('medium_bold') is not None
+        return manager
+
+    def test_banner_matches_smooth_draw_text(self, monkeypatch) -> None:
+        """Prerendering must not swap the AA captions for bitmap glyphs"""
+        from scoreboard_config import Colors
+
+        handler = self._handler(monkeypatch)
+        manager = self._real_manager()
+        handler.manager = manager
+        flashes = []
+        manager.set_image = lambda image, x=0, y=0: flashes.append(image)
+        manager.swap_canvas = Mock()
+        handler.animate_cubs_run()
+
+        reference = self._real_manager()
+        for label in (('medium_bold', 35, 19, Colors.WHITE, 'RUN'),
+                      ('medium_bold', 21, 35, Colors.WHITE, 'SCORED'),
+                      ('medium_bold', 36, 20, Colors.BRIGHT_YELLOW, 'RUN'),
+                      ('medium_bold', 22, 36, Colors.BRIGHT_YELLOW, 'SCORED')):
+            reference.draw_text(*label)
+        assert flashes[-1].tobytes() == reference.get_frame_copy().tobytes()
+
+    def test_scores_caption_matches_smooth_draw_text(self) -> None:
+        from PIL import Image
+
+        manager = self._real_manager()
+        gradient = Image.linear_gradient('L').resize((96, 48)).convert('RGB')
+        label = ('medium_bold', 21, 42, (185, 185, 195), 'SCORES')
+
+        manager.set_image(gradient, 0, 0)
+        manager.draw_text(*label)
+        layer = manager.text_layer([label], smooth=True)
+        frame = gradient.copy()
+        frame.paste(layer, (0, 0), layer)
+
+        assert frame.tobytes() == manager.get_frame_copy().tobytes()
+
+    def test_captions_rasterized_once_per_process(self, monkeypatch) -> None:
+        handler = self._handler(monkeypatch)
+        handler.animate_cubs_run()
+        handler.animate_cubs_run()
+        banner = handler._caption_layers['run_scored']
+        handler.animate_opponent_run()
+        handler.animate_opponent_run()
+
+        # Four banner labels and two SCORES colors, all AA, built once
+        calls = handler.manager.text_layer.call_args_list
+        assert len(calls) == 6
+        assert all(c.kwargs == {'smooth': True} for c in calls)
+        assert handler._caption_layers['run_scored'] is banner
+
+    def test_opponent_caption(self, monkeypatch) -> None:
+        handler = self._handler(monkeypatch)
+        handler.animate_opponent_run()
+
+        assert handler.manager.text_layer.call_count == 2
+        handler.manager.draw_text.assert_not_called()
+        frame = handler.manager.set_image.call_args_list[0].args[0]
+        assert frame.getpixel((40, 12)) == (255, 255, 0)
+
+    def test_storm_frames_match_full_redraw(self, monkeypatch) -> None:
+        """The parked-scene shortcut renders the same frames as drawing
+        sky, cloud, bolt and logo every time"""
+        import random
+        from PIL import Image, ImageDraw
+
+        handler = self._handler(monkeypatch)
+        handler.manager.text_layer.return_value = None
+        handler.manager.game_images = {
+            'opponent': Image.open('./logos/CHC.png')}
+        frames = []
+        handler.manager.set_image.side_effect = (
+            lambda image, x, y: frames.append(image.copy()))
+        random.seed(7)
+        handler.animate_opponent_run()
+
+        logo = handler._sized_logo('opponent', (20, 20))
+        sky = Image.new('RGB', (96, 48))
+        for y in range(48):
+            shade = 10 + y // 4
+            sky.paste((shade, shade, shade + 8), (0, y, 96, y + 1))
+        cloud = Image.new('RGBA', (56, 14), (0, 0, 0, 0))
+        for cx, cy, w, h, shade in ((2, 5, 20, 8, 70), (14, 1, 26, 11, 85),
+                                    (30, 4, 22, 9, 75), (10, 7, 38, 6, 60)):
+            ImageDraw.Draw(cloud).ellipse(
+                (cx, cy, cx + w, cy + h), fill=(shade, shade, shade + 10, 255))
+        random.seed(7)
+        for frame, got in enumerate(frames):
+            bolt_on = frame in {36, 37, 56, 57}
+            want = sky.copy()
+            if bolt_on:
+                want = Image.eval(want, lambda v: min(255, v + 45))
+            cloud_x = -56 + int(76 * frame / 20) if frame < 20 else 20
+            want.paste(cloud, (cloud_x, 0), cloud)
+            if bolt_on:
+                x, y = (30 if frame < 50 else 63), 11
+                for _ in range(5):
+                    nx, ny = x + random.choice((-3, -2, 2, 3)), y + 5
+                    ImageDraw.Draw(want).line((x, y, nx, ny),
+                                              fill=(255, 245, 180))
+                    x, y = nx, ny
+            want.paste(logo, (38, 14), logo)
+            assert got.tobytes() == want.tobytes(), frame
+        assert len(frames) == 72
+
+    def test_storm_assets_drawn_once(self, monkeypatch) -> None:
+        import live_game_handler as lgh
+
+        monkeypatch.setattr(lgh, '_storm_scene', None)
+        handler = self._handler(monkeypatch)
+        handler.animate_opponent_run()
+        scene = lgh._storm_scene
+        assert scene is not None
+
+        handler.animate_opponent_run()
+        assert lgh._storm_scene is scene
+        assert lgh._storm_scene_images() is scene
+
+    def test_ball_flight_matches_full_redraw(self, monkeypatch) -> None:
+        """Restoring only the ball's last spot gives the same frames as
+        repainting the whole backdrop each time"""
+        from PIL import Image
+
+        handler = self._handler(monkeypatch)
+        handler.manager.text_layer.return_value = None
+        handler._run_scene = None
+        handler.team = Mock(run_scored_path='./logos/CHC.png')
+        frames = []
+        handler.manager.set_image.side_effect = (
+            lambda image, x, y: frames.append(image.copy()))
+        handler.animate_cubs_run()
+
+        backdrop, ball = handler._run_scene_images()
+        assert ball.mode == 'RGB'
+        raw_ball = Image.open('./logos/baseball.png')
+        for position, got in zip(handler.RUN_BALL_PATH, frames):
+            want = backdrop.copy()
+            want.paste(raw_ball, position)
+            assert got.tobytes() == want.tobytes(), position
+
+    def test_frames_share_one_buffer(self, monkeypatch) -> None:
+        handler = self._handler(monkeypatch)
+        handler.animate_opponent_run()
+
+        frames = {id(c.args[0])
+                  for c in handler.manager.set_image.call_args_list}
+        assert len(frames) == 1
+
+
+# ============================================================================
+# Efficiency: win-flag GIF decoded and resized once
+# ============================================================================
+
+class TestCelebrationFrames:
+    def test_decoded_once(self, monkeypatch) -> None:
+        import live_game_handler
+        from live_game_handler import LiveGameHandler
+        from teams import TEAMS
+
+        opened = []
+        real_open = live_game_handler.Image.open
+
+        def spy_open(path, *args, **kwargs):
+            opened.append(path)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(live_game_handler.Image, 'open', spy_open)
+        handler = LiveGameHandler.__new__(LiveGameHandler)
+        handler.team = TEAMS['cubs']
+        handler._celebration = None
+
+        frames, duration = handler._celebration_frames()
+        assert handler._celebration_frames()[0] is frames
+        assert opened == ['./W.gif']
+        assert frames and all(f.size == (96, 48) and f.mode == 'RGB'
+                              for f in frames)
+        assert duration > 0
+
+
+# ============================================================================
+# Efficiency: game logos decoded once per opponent
+# ============================================================================
+
+class TestGameImagesReuse:
+    def _manager(self):
+        from scoreboard_manager import ScoreboardManager
+        from teams import get_active_team
+
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager.team = get_active_team()
+        manager.game_images = {}
+        manager._game_images_key = None
+        manager.get_game_info = Mock()
+        return manager
+
+    def test_reloaded_only_when_opponent_changes(self, monkeypatch) -> None:
+        import scoreboard_manager
+
+        opened = []
+        real_open = scoreboard_manager.Image.open
+
+        def spy_open(path, *args, **kwargs):
+            opened.append(path)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(scoreboard_manager.Image, 'open', spy_open)
+        manager = self._manager()
+        opponent = {'abbreviation': 'MIL'}
+        manager.get_opponent = lambda info: opponent
+        games = [{'game_id': 1}]
+
+        first = manager.load_game_images(games)
+        assert manager.load_game_images(games) is first
+        assert opened.count('./logos/MIL.png') == 1
+
+        opponent = {'abbreviation': 'STL'}
+        manager.load_game_images(games)
+        assert opened.count('./logos/STL.png') == 1
+        assert len(opened) == 8
+
+
+# ============================================================================
+# Efficiency: run-scored flight positions computed once
+# ============================================================================
+
+class TestBallFlightPath:
+    def test_path(self) -> None:
+        from live_game_handler import LiveGameHandler
+
+        path = LiveGameHandler.RUN_BALL_PATH
+        assert len(path) == 72
+        assert path[0] == (25, 15) and path[-1] == (96, 1)
+        # Rises one row at a time, never falls
+        assert all(0 <= y0 - y1 <= 1 for (_, y0), (_, y1) in zip(path, path[1:]))
+
+
+# ============================================================================
+# Efficiency: Bible icon baked into the cached background
+# ============================================================================
+
+class TestBibleBackground:
+    def _display(self, icon):
+        from bible_display import BibleDisplay
+
+        display = BibleDisplay.__new__(BibleDisplay)
+        display.manager = Mock()
+        display.BIBLE_NAVY = (20, 20, 60)
+        display.BIBLE_GOLD = (255, 215, 0)
+        display.bible_icon = icon
+        display._bible_bg = display._create_bible_background()
+        return display
+
+    def test_icon_and_separator_are_baked_in(self) -> None:
+        from PIL import Image
+
+        icon = Image.new('RGBA', (4, 4), (200, 10, 10, 255))
+        icon.putpixel((0, 0), (0, 255, 0, 100))  # mostly transparent
+        display = self._display(icon)
+        bg = display._bible_bg
+
+        assert bg.getpixel((11, 3)) == (200, 10, 10)
+        assert bg.getpixel((10, 2)) == (20, 20, 60)
+        assert bg.getpixel((50, 27)) == (60, 60, 100)
+
+    def test_header_draws_no_pixels(self) -> None:
+        from PIL import Image
+
+        display = self._display(Image.new('RGBA', (4, 4), (200, 10, 10, 255)))
+        display._draw_bible_header()
+
+        display.manager.set_image.assert_called_once_with(
+            display._bible_bg, 0, 0)
+        display.manager.draw_pixel.assert_not_called()
+        display.manager.fill_rect.assert_not_called()
+
+    def test_loading_screen_skips_clear(self) -> None:
+        from PIL import Image
+
+        display = self._display(Image.new('RGBA', (4, 4), (200, 10, 10, 255)))
+        display.BIBLE_CREAM = (255, 248, 220)
+        display.display_bible_loading()
+
+        # The header's full-panel blit replaces the clear
+        display.manager.clear_canvas.assert_not_called()
+        display.manager.set_image.assert_called_once_with(
+            display._bible_bg, 0, 0)
+
+
+# ============================================================================
+# Efficiency: forecast icons and rows built once
+# ============================================================================
+
+class TestForecastIcons:
+    def test_icon_loaded_and_resized_once(self) -> None:
+        import weather_display as wd
+        from PIL import Image
+
+        display = wd.WeatherDisplay.__new__(wd.WeatherDisplay)
+        display._forecast_icons = {}
+        display._load_weather_icon = Mock(
+            return_value=Image.new('RGBA', (32, 32), (255, 255, 0, 255)))
+
+        first = display._forecast_icon('Clear')
+        assert display._forecast_icon('Clear') is first
+        assert first.size == (10, 10)
+        display._load_weather_icon.assert_called_once_with('Clear')
+
+    def test_missing_icon_is_remembered(self) -> None:
+        import weather_display as wd
+
+        display = wd.WeatherDisplay.__new__(wd.WeatherDisplay)
+        display._forecast_icons = {}
+        display._load_weather_icon = Mock(return_value=None)
+
+        assert display._forecast_icon('Smoke') is None
+        assert display._forecast_icon('Smoke') is None
+        display._load_weather_icon.assert_called_once()
+
+    def test_forecast_rows_built_once_per_data_and_day(
+        self, monkeypatch
+    ) -> None:
+        import weather_display as wd
+
+        frozen = pendulum.datetime(2026, 7, 8, 20, 0, tz='America/Chicago')
+        monkeypatch.setattr(wd.pendulum, 'now', lambda tz=None: frozen)
+        display = wd.WeatherDisplay.__new__(wd.WeatherDisplay)
+        display._forecast_rows = None
+        display.forecast_data = {'list': []}
+        display._build_daily_forecasts = Mock(return_value=[])
+
+        display._daily_forecasts()
+        display._daily_forecasts()
+        assert display._build_daily_forecasts.call_count == 1
+
+        display.forecast_data = {'list': []}  # refreshed forecast
+        display._daily_forecasts()
+        assert display._build_daily_forecasts.call_count == 2
+
+        frozen = frozen.add(days=1)  # "today" must move on at midnight
+        display._daily_forecasts()
+        assert display._build_daily_forecasts.call_count == 3
+
+
+# ============================================================================
+# Efficiency: weather gradient cached as an image
+# ============================================================================
+
+class TestWeatherBackgroundImage:
+    def test_gradient_blitted_in_one_call(self) -> None:
+        import weather_display as wd
+
+        display = wd.WeatherDisplay.__new__(wd.WeatherDisplay)
+        display.manager = Mock()
+        display._get_gradient_colors = Mock(
+            return_value=((0, 0, 0), (96, 48, 192)))
+
+        display._background_cache = display._generate_background_cache(
+            12, 'Clear', 'day')
+        display._draw_cached_background()
+
+        bg = display._background_cache
+        assert bg.size == (96, 48)
+        assert bg.getpixel((0, 0)) == (0, 0, 0)
+        # Same per-row color as the old per-pixel cache: int(r2 * y / 48)
+        assert bg.getpixel((95, 24)) == (48, 24, 96)
+        display.manager.set_image.assert_called_once_with(bg, 0, 0)
+        display.manager.draw_pixel.assert_not_called()
+
+
+# ============================================================================
+# Efficiency: full-width rules drawn as one fill
+# ============================================================================
+
+class TestFullWidthRules:
+    def test_pga_separator_baked_into_header(self) -> None:
+        import pga_display as pd
+
+        display = pd.PGADisplay.__new__(pd.PGADisplay)
+        display.PGA_NAVY = pd.Colors.PGA_NAVY
+        display.PGA_GOLD = pd.Colors.PGA_GOLD
+        bg = display._create_pga_header_background()
+        assert bg.getpixel((0, 11)) == (100, 100, 100)
+        assert bg.getpixel((95, 11)) == (100, 100, 100)
+
+    def test_forecast_gradient_matches_per_pixel_colors(self) -> None:
+        import weather_display as wd
+
+        bg = wd.WeatherDisplay._forecast_gradient()
+        assert bg.size == (96, 48)
+        assert bg.getpixel((0, 0)) == (10, 40, 80)
+        ratio = 24 / 48
+        assert bg.getpixel((95, 24)) == (
+            int(10 + 30 * ratio), int(40 + 80 * ratio), int(80 + 120 * ratio))
+
+
+# ============================================================================
+# Efficiency: sky gradients looked up from a table
+# ============================================================================
+
+class TestSkyGradientTable:
+    def _display(self):
+        import weather_display as wd
+        return wd.WeatherDisplay.__new__(wd.WeatherDisplay)
+
+    def test_condition_and_period_lookup(self) -> None:
+        display = self._display()
+        assert display._get_gradient_colors(12, 'Clear', 'day') == (
+            (100, 180, 255), (150, 220, 255))
+        assert display._get_gradient_colors(6, 'Snow', 'dawn') == (
+            (80, 90, 110), (100, 110, 130))
+
+    def test_aliases_and_fallbacks(self) -> None:
+        display = self._display()
+        assert (display._get_gradient_colors(18, 'Drizzle', 'dusk')
+                == display._get_gradient_colors(18, 'Rain', 'dusk'))
+        assert (display._get_gradient_colors(12, 'Haze', 'day')
+                == display._get_gradient_colors(12, 'Mist', 'day'))
+        # Unknown conditions use Clear; unknown periods use night
+        assert (display._get_gradient_colors(23, 'Tornado', 'night')
+                == ((20, 30, 80), (10, 15, 40)))
+        assert (display._get_gradient_colors(2, 'Clouds', 'late')
+                == ((50, 55, 60), (30, 35, 40)))
+
+
+# ============================================================================
+# Efficiency: error recovery backs off instead of a flat 10s sleep
+# ============================================================================
+
+class TestErrorBackoff:
+    def test_backoff_doubles_up_to_retry_delay(self) -> None:
+        from scoreboard_config import GameConfig
+
+        sb = _make_scoreboard()
+        with patch('main.time.sleep') as sleep:
+            for _ in range(6):
+                sb.handle_error()
+        # Every recovery clears the display, then sleeps just the backoff
+        backoff = [c.args[0] for c in sleep.call_args_list]
+        assert backoff == [1, 2, 4, 8, GameConfig.ERROR_RETRY_DELAY,
+                           GameConfig.ERROR_RETRY_DELAY]
+
+    def test_failed_cycles_retry_on_the_backoff_alone(self) -> None:
+        """run() must not pad a failed cycle up to MIN_GAME_CYCLE_TIME
+        on top of the backoff handle_error already slept"""
+        from main import CubsScoreboard
+
+        sb = _make_scoreboard()
+        sb.process_game_cycle = CubsScoreboard.process_game_cycle.__get__(sb)
+        sb.is_off_season = Mock(return_value=False)
+        sb.allstar_display.asg_is_live.return_value = False
+        sb.allstar_display.derby_is_live.return_value = False
+        sb.manager.get_schedule.return_value = [
+            {'game_id': 1, 'status': 'Warmup', 'game_date': '2026-04-01',
+             'doubleheader': 'N', 'game_type': 'R'}]
+        sb.detect_split_squad_games = Mock(return_value=(False, []))
+        sb.get_split_squad_indicator = Mock(return_value=None)
+        sb.split_squad_active = False
+        sb.split_squad_last_switch = 0.0
+        sb.determine_game_index = Mock(return_value=0)
+        sb.route_by_status = Mock(side_effect=RuntimeError('feed down'))
+
+        with patch('main.needs_setup', return_value=False), \
+                patch('main.is_shutdown_requested',
+                      side_effect=lambda: sb.route_by_status.call_count >= 4), \
+                patch('main.time.sleep') as sleep:
+            sb.run()
+
+        # Startup settle, then one sleep per retry: exactly the backoff
+        assert [c.args[0] for c in sleep.call_args_list] == [2, 1, 2, 4, 8]
+
+    def test_successful_cycle_resets_backoff(self) -> None:
+        from main import CubsScoreboard
+
+        sb = _make_scoreboard()
+        sb._error_streak = 3
+        sb.process_game_cycle = CubsScoreboard.process_game_cycle.__get__(sb)
+        sb.manager.get_schedule.return_value = [
+            {'game_id': 1, 'status': 'Scheduled', 'game_date': '2026-04-01',
+             'doubleheader': 'N', 'game_type': 'R'}]
+        sb.allstar_display.asg_is_live.return_value = False
+        sb.allstar_display.derby_is_live.return_value = False
+        sb.route_by_status = Mock()
+        sb.detect_split_squad_games = Mock(return_value=(False, []))
+        sb.get_split_squad_indicator = Mock(return_value=None)
+        sb.split_squad_active = False
+        sb.split_squad_last_switch = 0.0
+        sb.determine_game_index = Mock(return_value=0)
+
+        sb.process_game_cycle()
+
+        sb.route_by_status.assert_called_once()
+        assert sb._error_streak == 0
+
+
+# ============================================================================
+# Next-game screen hands off on delays that carry a reason
+# ============================================================================
+
+class TestNextGameTransition:
+    def _transitions(self, status: str) -> bool:
+        from game_state_handler import GameStateHandler
+
+        handler = GameStateHandler.__new__(GameStateHandler)
+        return handler._should_transition_state([{'status': status}], 0)
+
+    def test_game_day_statuses_transition(self) -> None:
+        for status in ('Warmup', 'Pre-Game', 'In Progress', 'Postponed',
+                       'Delayed', 'Delayed Start: Rain', 'Delayed: Rain'):
+            assert self._transitions(status), status
+
+    def test_scheduled_stays(self) -> None:
+        assert not self._transitions('Scheduled')
+
+
+# ============================================================================
+# Efficiency: weather sun times converted once per update
+# ============================================================================
+
+class TestWeatherSunHours:
+    def _display(self, data):
+        import weather_display as wd
+
+        display = wd.WeatherDisplay.__new__(wd.WeatherDisplay)
+        display.weather_data = data
+        display._sun_hours = None
+        return display
+
+    def test_converted_once_per_weather_data(self, monkeypatch) -> None:
+        import weather_display as wd
+
+        # 12:00 and 00:30 UTC -> 07:00 and 19:30 Central (CDT)
+        data = {'sys': {'sunrise': 1784808000, 'sunset': 1784853000}}
+        display = self._display(data)
+        conversions = []
+        real = wd.pendulum.from_timestamp
+        monkeypatch.setattr(
+            wd.pendulum, 'from_timestamp',
+            lambda ts, tz=None: conversions.append(ts) or real(ts, tz=tz))
+
+        noon = pendulum.datetime(2026, 7, 23, 12, 0, tz='America/Chicago')
+        dusk = pendulum.datetime(2026, 7, 23, 19, 45, tz='America/Chicago')
+        assert display._get_time_period(12, noon) == 'day'
+        assert display._get_time_period(19, dusk) == 'dusk'
+        assert len(conversions) == 2
+
+        display.weather_data = {'sys': {}}
+        assert display._get_time_period(21, dusk.add(hours=2)) == 'night'
+        assert display._sun_hours == (display.weather_data, None)
+
+
+# ============================================================================
+# Efficiency: no-game marquee text rebuilt only on the schedule refresh
+# ============================================================================
+
+class TestNoGameMarqueeText:
+    def test_pitchers_picked_up_at_schedule_refresh(self, monkeypatch) -> None:
+        import game_state_handler as gsh
+        from game_state_handler import GameStateHandler
+        from PIL import Image
+        from teams import TEAMS
+
+        monkeypatch.setattr(gsh, 'load_user_config', lambda: {})
+        handler = GameStateHandler.__new__(GameStateHandler)
+        handler.manager = Mock()
+        handler.team = TEAMS['cubs']
+        handler.manager.game_images = {'marquee': Image.new('RGB', (96, 20))}
+        handler.manager.split_squad_indicator = None
+        handler.manager.format_game_time.return_value = '7:05'
+        handler.manager.get_opponent.return_value = {'name': 'Brewers'}
+        handler.manager.get_pitchers.side_effect = (
+            lambda data, index, gameid: data[index]['pitchers'])
+        handler._display_playoff_info = Mock()
+        handler.scroll_position = -10_000
+
+        def game(status, pitchers):
+            return [{'game_id': 1, 'game_date': '2026-10-18', 'game_type': 'F',
+                     'status': status, 'pitchers': pitchers}]
+
+        handler.manager.get_schedule.side_effect = [
+            game('Scheduled', 'Imanaga'), game('Warmup', 'Imanaga')]
+
+        handler.display_no_game(game('Scheduled', 'TBD'), 0)
+
+        texts = [c.args[4]
+                 for c in handler.manager.draw_text_strip.call_args_list]
+        assert texts[0].endswith('Imanaga')
+        assert all(t == texts[0] for t in texts)
+        # Built once up front and once per refresh, never per frame
+        assert handler.manager.get_pitchers.call_count == 2
+        assert len(texts) == handler.manager.swap_canvas.call_count > 2
+
+
+# ============================================================================
+# Efficiency: Spring Training header composited once, not every frame
+# ============================================================================
+
+class TestSpringTrainingHeader:
+    def test_header_composited_once(self) -> None:
+        from PIL import Image
+        import spring_training_display as std
+
+        display = std.SpringTrainingDisplay.__new__(std.SpringTrainingDisplay)
+        display.manager = Mock()
+        display.TEAM_COLOR = (14, 51, 134)
+        display._header_image = Image.new('RGBA', (40, 20), (255, 0, 0, 255))
+        display._header_background = None
+
+        display._draw_header()
+        display._draw_header()
+
+        first, second = display.manager.set_image.call_args_list
+        assert first.args[0] is second.args[0]
+        frame = first.args[0]
+        assert frame.getpixel((48, 10)) == (255, 0, 0)
+        assert frame.getpixel((48, 30)) == (14, 51, 134)
+
+
+# ============================================================================
+# Precise exception handling: config reads only swallow I/O and JSON errors
+# ============================================================================
+
+class TestWeatherConfigErrors:
+    def _display(self):
+        import weather_display as wd
+
+        return wd.WeatherDisplay.__new__(wd.WeatherDisplay)
+
+    def test_corrupt_config_reads_as_empty(self) -> None:
+        from unittest.mock import mock_open
+
+        with patch('builtins.open', mock_open(read_data='{not json')):
+            assert self._display()._load_config() == {}
+
+    def test_interrupt_is_not_swallowed(self) -> None:
+        with patch('builtins.open', side_effect=KeyboardInterrupt), \
+                pytest.raises(KeyboardInterrupt):
+            self._display()._load_config()
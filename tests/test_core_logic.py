@@ -292,6 +292,58 @@ class TestTimeFormatting:
         assert game_time == '01:10:00'
 
 
+class TestFormatGameTime:
+    """ScoreboardManager.format_game_time converts UTC to Chicago time"""
+
+    def _manager(self):
+        from scoreboard_manager import ScoreboardManager
+
+        manager = ScoreboardManager.__new__(ScoreboardManager)
+        manager._start_time_cache = {}
+        manager._game_time_cache = {}
+        return manager
+
+    def test_summer_game_uses_cdt(self) -> None:
+        manager = self._manager()
+        game_data = [{'game_datetime': '2024-07-15T00:05:00Z'}]
+
+        assert manager.format_game_time(game_data, 0) == '7:05'
+
+    def test_spring_game_uses_cst(self) -> None:
+        manager = self._manager()
+        game_data = [{'game_datetime': '2024-03-01T20:05:00Z'}]
+
+        assert manager.format_game_time(game_data, 0) == '2:05'
+
+    def test_noon_and_result_cached(self) -> None:
+        manager = self._manager()
+        game_data = [{'game_datetime': '2024-07-15T17:20:00Z'}]
+
+        assert manager.format_game_time(game_data, 0) == '12:20'
+        assert manager._game_time_cache == {'2024-07-15T17:20:00Z': '12:20'}
+
+    def test_missing_datetime_returns_tbd(self) -> None:
+        manager = self._manager()
+
+        assert manager.format_game_time([{}], 0) == 'TBD'
+
+    def test_unparseable_datetime_falls_back_to_raw_time(self) -> None:
+        manager = self._manager()
+
+        assert manager.format_game_time(
+            [{'game_datetime': '2024-07-15T19:05:00 CDT'}], 0) == '19:05'
+        assert manager.format_game_time([{'game_datetime': None}], 0) == 'TBD'
+        assert manager._game_time_cache == {}
+
+    def test_start_datetime_parsed_once(self) -> None:
+        manager = self._manager()
+        game = {'game_datetime': '2024-07-15T00:05:00Z'}
+
+        start = manager.get_start_datetime(game)
+        assert (start.hour, start.minute) == (19, 5)
+        assert manager.get_start_datetime(game) is start
+
+
 # ============================================================================
 # Bears Score Parsing Tests
 # ============================================================================
@@ -288,6 +288,47 @@ class TestCountdownMilestones:
         display._get_opening_day()
         assert schedule.call_count == 1
 
+    def test_get_opening_day_caches_unpublished_schedule(
+        self, monkeypatch
+    ) -> None:
+        import spring_training_display as std
+        from teams import TEAMS
+
+        frozen = pendulum.datetime(2026, 3, 1, tz='America/Chicago')
+        monkeypatch.setattr(std.pendulum, 'now', lambda tz=None: frozen)
+        schedule = Mock(return_value=[
+            {'game_type': 'S', 'game_datetime': '2026-03-24T20:05:00Z'},
+        ])
+        monkeypatch.setattr(std.statsapi, 'schedule', schedule)
+
+        display = std.SpringTrainingDisplay.__new__(std.SpringTrainingDisplay)
+        display.team = TEAMS['cubs']
+        display._opening_day_cache = None
+        display._opening_day_cached_on = None
+
+        assert display._get_opening_day() is None
+        assert display._get_opening_day() is None
+        assert schedule.call_count == 1
+
+    def test_get_opening_day_retries_after_api_failure(
+        self, monkeypatch
+    ) -> None:
+        import spring_training_display as std
+        from teams import TEAMS
+
+        frozen = pendulum.datetime(2026, 3, 1, tz='America/Chicago')
+        monkeypatch.setattr(std.pendulum, 'now', lambda tz=None: frozen)
+        monkeypatch.setattr(std, 'retry_api_call',
+                            Mock(side_effect=ConnectionError('down')))
+
+        display = std.SpringTrainingDisplay.__new__(std.SpringTrainingDisplay)
+        display.team = TEAMS['cubs']
+        display._opening_day_cache = None
+        display._opening_day_cached_on = None
+
+        assert display._get_opening_day() is None
+        assert display._opening_day_cached_on is None
+
 
 # ============================================================================
 # Playoff race display
@@ -404,25 +445,21 @@ class TestPlayoffRace:
         assert in_position({'div_rank': 3, 'wc_rank': 4}) is False
         assert in_position({'div_rank': 4, 'wc_rank': None}) is False
 
-    def test_leader_abbreviation_fetched_once(self, monkeypatch) -> None:
+    def test_leader_abbreviation_from_shared_team_map(self, monkeypatch) -> None:
         import playoff_race_display as prd
 
         display = self._display()
-        display._abbr_cache = {}
-        get = Mock(return_value={'teams': [{'abbreviation': 'MIL'}]})
+        display.manager.get_team_abbreviations.return_value = {158: 'MIL'}
+        get = Mock()
         monkeypatch.setattr(prd.statsapi, 'get', get)
 
         assert display._leader_abbr(158) == 'MIL'
-        assert display._leader_abbr(158) == 'MIL'
-        assert get.call_count == 1
-
-    def test_leader_abbreviation_none_on_api_failure(self, monkeypatch) -> None:
-        import playoff_race_display as prd
+        assert display._leader_abbr(999) is None
+        get.assert_not_called()
 
+    def test_leader_abbreviation_none_on_api_failure(self) -> None:
         display = self._display()
-        display._abbr_cache = {}
-        monkeypatch.setattr(
-            prd, 'retry_api_call', Mock(side_effect=Exception('down')))
+        display.manager.get_team_abbreviations.side_effect = Exception('down')
 
         assert display._leader_abbr(158) is None
 
@@ -872,6 +909,7 @@ class TestPreviewMirror:
         manager._mono_ttf_bold = None
         manager._mono_ttf_regular = None
         manager._mono_renderers = {}
+        manager._graphics_colors = {}
         manager._init_preview_mirror()
         return manager
 
@@ -908,6 +946,22 @@ class TestPreviewMirror:
         assert manager._frame.getpixel((12, 13)) == (0, 128, 0)
         manager.canvas.SetImage.assert_called_once()
 
+    def test_set_image_passes_rgb_through(self) -> None:
+        """An RGB frame reaches the canvas as-is; only other modes are
+        converted (a convert('RGB') on RGB is still a full copy)"""
+        from PIL import Image
+
+        manager = self._manager()
+        rgb = Image.new('RGB', (96, 48), (1, 2, 3))
+        manager.set_image(rgb, 0, 0)
+        assert manager.canvas.SetImage.call_args.args[0] is rgb
+
+        rgba = Image.new('RGBA', (4, 4), (9, 8, 7, 255))
+        manager.set_image(rgba, 0, 0)
+        converted = manager.canvas.SetImage.call_args.args[0]
+        assert converted.mode == 'RGB'
+        assert converted.getpixel((0, 0)) == (9, 8, 7)
+
     def test_draw_text_mirrors_glyphs(self) -> None:
         manager = self._manager()
 
@@ -918,6 +972,19 @@ class TestPreviewMirror:
         lit = [p for p in region.getdata() if p != (0, 0, 0)]
         assert lit, 'expected the mirrored W glyph to light pixels'
 
+    def test_draw_text_reuses_color_objects(self) -> None:
+        manager = self._manager()
+
+        with patch('scoreboard_manager.graphics.Color') as color:
+            manager.draw_text('tiny_bold', 2, 10, (255, 255, 255), 'A',
+                              smooth=False)
+            manager.draw_text('tiny_bold', 8, 10, (255, 255, 255), 'B',
+                              smooth=False)
+            manager.draw_text('tiny_bold', 14, 10, (255, 0, 0), 'C',
+                              smooth=False)
+        assert [c.args for c in color.call_args_list] == [
+            (255, 255, 255), (255, 0, 0)]
+
     def test_swap_canvas_saves_preview_png(
         self, tmp_path, monkeypatch
     ) -> None:
@@ -1099,8 +1166,8 @@ class _FakeTime:
         self.now += seconds
 
 
-class _FakePendulum:
-    """pendulum.now() stand-in with a mutable date for loop-exit control"""
+class _FakeClock:
+    """datetime.now() stand-in with a mutable date for loop-exit control"""
 
     def __init__(self, date: str = '2026-07-09', hhmm: str = '20:00') -> None:
         self.date = date
@@ -1109,8 +1176,8 @@ class _FakePendulum:
     def now(self, *args, **kwargs):
         return self
 
-    def format(self, fmt: str) -> str:
-        return self.date if 'YYYY' in fmt else self.hhmm
+    def strftime(self, fmt: str) -> str:
+        return self.date if '%Y' in fmt else self.hhmm
 
 
 class TestGameOverInterleave:
@@ -1133,32 +1200,32 @@ class TestGameOverInterleave:
             'gameData': {'teams': {'home': {'id': 110}}},
         }
 
-    def _handler(self, monkeypatch, fake_pendulum):
+    def _handler(self, monkeypatch, fake_clock):
         from PIL import Image
         import live_game_handler as lgh
         from live_game_handler import LiveGameHandler
         from teams import get_active_team
 
         monkeypatch.setattr(lgh, 'time', _FakeTime())
-        monkeypatch.setattr(lgh, 'pendulum', fake_pendulum)
-        monkeypatch.setattr(
-            lgh, 'retry_api_call', lambda *a, **k: self._game_info())
+        monkeypatch.setattr(lgh, 'datetime', fake_clock)
 
         handler = LiveGameHandler.__new__(LiveGameHandler)
         handler.manager = Mock()
+        handler.manager.get_game_info.return_value = self._game_info()
         handler.team = get_active_team()
         handler.manager.game_images = {
             'team': Image.new('RGBA', (26, 26)),
             'opponent': Image.new('RGBA', (26, 26)),
         }
+        handler._sized_logos = {}
         handler.off_season_handler = Mock()
         return handler
 
     def _run_one_cycle(self, monkeypatch):
         """Run display_game_over through one rotation, capturing the
         callback it hands to the rotation cycle."""
-        fake_pendulum = _FakePendulum()
-        handler = self._handler(monkeypatch, fake_pendulum)
+        fake_clock = _FakeClock()
+        handler = self._handler(monkeypatch, fake_clock)
         captured = {}
 
         def fake_rotation(between_callback=None):
@@ -1166,11 +1233,11 @@ class TestGameOverInterleave:
             captured['final_drawn_before_rotation'] = any(
                 'FINAL' in str(c)
                 for c in handler.manager.draw_text.call_args_list)
-            fake_pendulum.date = '2026-07-10'  # exit the game-over loop
+            fake_clock.date = '2026-07-10'  # exit the game-over loop
 
         handler.off_season_handler._display_rotation_cycle = fake_rotation
         handler.display_game_over([{'doubleheader': 'N'}], 0, 12345)
-        return handler, captured, fake_pendulum
+        return handler, captured, fake_clock
 
     def test_interlude_duration_configured(self) -> None:
         from scoreboard_config import GameConfig
@@ -1188,18 +1255,78 @@ class TestGameOverInterleave:
         assert captured['final_drawn_before_rotation'] is True
 
     def test_callback_redraws_final_between_segments(self, monkeypatch) -> None:
-        handler, captured, fake_pendulum = self._run_one_cycle(monkeypatch)
+        handler, captured, fake_clock = self._run_one_cycle(monkeypatch)
 
-        fake_pendulum.date = '2026-07-09'  # back to game day
+        fake_clock.date = '2026-07-09'  # back to game day
         handler.manager.draw_text.reset_mock()
         assert captured['callback']() is False
         assert any('FINAL' in str(c)
                    for c in handler.manager.draw_text.call_args_list)
 
+    def test_final_scores_left_and_right(self, monkeypatch) -> None:
+        handler, _, _ = self._run_one_cycle(monkeypatch)
+
+        scores = [c.args[1:] for c in handler.manager.draw_text.call_args_list
+                  if c.args[0] == 'large_bold']
+        assert scores[:2] == [(9, 45, (255, 255, 255), '2'),
+                              (75, 45, (255, 255, 255), '3')]
+
+    def test_stat_lines(self, monkeypatch) -> None:
+        handler, _, _ = self._run_one_cycle(monkeypatch)
+
+        stats = [c.args[1:3] + c.args[4:]
+                 for c in handler.manager.draw_text.call_args_list
+                 if c.args[0] == 'micro']
+        assert stats[:4] == [(29, 29, 'INNINGS:9'), (29, 35, 'HITS:   5'),
+                             (29, 41, 'RUNS:   2'), (29, 47, 'ERRORS: 1')]
+
+    def test_interlude_draws_screen_once(self, monkeypatch) -> None:
+        handler, captured, fake_clock = self._run_one_cycle(monkeypatch)
+
+        fake_clock.date = '2026-07-09'
+        handler.manager.swap_canvas.reset_mock()
+        assert captured['callback']() is False
+        handler.manager.swap_canvas.assert_called_once()
+
+    def test_interlude_sleeps_once(self, monkeypatch) -> None:
+        import live_game_handler as lgh
+        from scoreboard_config import GameConfig
+
+        _, captured, fake_clock = self._run_one_cycle(monkeypatch)
+        fake_clock.date = '2026-07-09'
+        sleeps = []
+        monkeypatch.setattr(lgh.time, 'sleep', sleeps.append)
+
+        assert captured['callback']() is False
+        assert sleeps == [GameConfig.GAME_OVER_INTERLUDE_TIME]
+
+    def test_after_midnight_game_exits_past_four(self, monkeypatch) -> None:
+        fake_clock = _FakeClock(date='2026-07-10', hhmm='00:40')
+        handler = self._handler(monkeypatch, fake_clock)
+        cycles = []
+
+        def fake_rotation(between_callback=None):
+            cycles.append(fake_clock.hhmm)
+            # A long segment skips straight past the 04:00 minute
+            fake_clock.hhmm = '04:07' if fake_clock.hhmm >= '03:00' else '03:30'
+
+        handler.off_season_handler._display_rotation_cycle = fake_rotation
+        handler.display_game_over([{'doubleheader': 'N'}], 0, 12345)
+
+        assert cycles == ['00:40', '03:30']
+
+    def test_doubleheader_hands_back_after_wait(self, monkeypatch) -> None:
+        handler = self._handler(monkeypatch, _FakeClock())
+
+        handler.display_game_over([{'doubleheader': 'S'}], 0, 12345)
+
+        handler.manager.swap_canvas.assert_called_once()
+        handler.off_season_handler._display_rotation_cycle.assert_not_called()
+
     def test_callback_signals_exit_when_day_rolls_over(self, monkeypatch) -> None:
-        handler, captured, fake_pendulum = self._run_one_cycle(monkeypatch)
+        handler, captured, fake_clock = self._run_one_cycle(monkeypatch)
 
-        fake_pendulum.date = '2026-07-10'
+        fake_clock.date = '2026-07-10'
         assert captured['callback']() is True
 
 
@@ -1435,6 +1562,33 @@ class TestSkyDisplay:
         assert sun(500, 1000, 2000) is None    # before sunrise
         assert sun(1000, 1000, 2000) == pytest.approx(0.0)
 
+    @pytest.mark.parametrize('sunset', [5000.0, 900.0])
+    def test_display_converts_times_once(self, monkeypatch, sunset) -> None:
+        import sky_display
+
+        display = self._display()
+        display.weather_display = Mock(
+            weather_data={'sys': {'sunrise': 500, 'sunset': sunset}})
+        display.clouds = [object()]
+        display._draw_day_frame = Mock()
+        display._draw_night_frame = Mock()
+        monkeypatch.setattr(sky_display, 'time', _FakeTime())
+        conversions = []
+        real = pendulum.from_timestamp
+
+        def spy(ts, tz=None):
+            conversions.append(ts)
+            return real(ts, tz=tz)
+
+        monkeypatch.setattr(pendulum, 'from_timestamp', spy)
+        display.display_sky(duration=10)
+
+        frames = (display._draw_day_frame.call_count
+                  + display._draw_night_frame.call_count)
+        assert frames > 50
+        # sunrise + sunset, plus one moon-phase clock at night
+        assert len(conversions) == (2 if sunset > 1000 else 3)
+
 
 class TestISSDisplay:
     def _display(self):
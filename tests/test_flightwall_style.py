@@ -51,6 +51,25 @@ class TestAirlineLogos:
         b = d._monogram_badge('XYZ999')
         assert list(a.getdata()) == list(b.getdata())
 
+    def test_badge_font_is_parsed_once(self, monkeypatch) -> None:
+        import flight_display
+
+        d = self._display()
+        monkeypatch.setattr(flight_display, '_badge_fonts', {})
+        real_truetype = flight_display.ImageFont.truetype
+        loads = []
+
+        def counting_truetype(*args, **kwargs):
+            loads.append(args)
+            return real_truetype(*args, **kwargs)
+
+        monkeypatch.setattr(
+            flight_display.ImageFont, 'truetype', counting_truetype)
+
+        d._monogram_badge('XYZ999')
+        d._monogram_badge('QQQ111')
+        assert len(loads) == 1
+
     def test_iata_callsign_conversion_still_works(self) -> None:
         from flight_display import FlightDisplay
 
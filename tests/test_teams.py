@@ -342,7 +342,9 @@ class TestLiveGameRunAnimations:
         import live_game_handler
         monkeypatch.setattr(teams, 'load_user_config', lambda: {'team': slug})
         monkeypatch.setattr(live_game_handler.time, 'sleep', lambda s: None)
-        return live_game_handler.LiveGameHandler(MagicMock())
+        manager = MagicMock()
+        manager.text_layer.return_value = None  # no PIL fonts: DrawText path
+        return live_game_handler.LiveGameHandler(manager)
 
     def test_team_run_animation_uses_pack_sprite(self, monkeypatch):
         import live_game_handler
@@ -373,6 +375,28 @@ class TestLiveGameRunAnimations:
         handler.animate_cubs_run()
         assert './logos/run_scored.png' in opened
 
+    def test_run_sprites_decoded_once(self, monkeypatch):
+        import live_game_handler
+        opened = []
+        real_open = live_game_handler.Image.open
+
+        def spy_open(path, *args, **kwargs):
+            opened.append(str(path))
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(live_game_handler.Image, 'open', spy_open)
+        handler = self._make_handler(monkeypatch, 'cubs')
+        # The animation reuses one framebuffer, so keep what each blit saw
+        blitted = []
+        handler.manager.set_image.side_effect = (
+            lambda image, x, y: blitted.append(image.copy()))
+        handler.animate_cubs_run()
+        handler.animate_cubs_run()
+        assert opened.count('./logos/run_scored.png') == 1
+        assert opened.count('./logos/baseball.png') == 1
+        handler.manager.clear_canvas.assert_called()  # only the flash
+        assert blitted[0].getpixel((28, 18)) != (0, 0, 0)  # baseball in flight
+
     def test_opponent_run_animation_with_non_cubs_team(self, monkeypatch):
         from PIL import Image as PILImage
         handler = self._make_handler(monkeypatch, 'cardinals')
@@ -151,8 +151,8 @@ class UsaTodayDisplay:
 
         if not self.usatoday_logo:
             self.manager.draw_text('small_bold', 18, 16, self.USATODAY_NAVY, 'USA TODAY')
-            for x in range(DisplayConfig.MATRIX_COLS):
-                self.manager.draw_pixel(x, 20, *self.USATODAY_BLUE)
+            self.manager.fill_rect(
+                0, 20, DisplayConfig.MATRIX_COLS, 21, self.USATODAY_BLUE)
 
     def _load_scroll_config(self) -> dict:
         """Load scroll speed settings from config file"""
@@ -177,8 +177,6 @@ class UsaTodayDisplay:
 
         while time.time() - start_time < duration:
             try:
-                self.manager.clear_canvas()
-
                 self._draw_usatoday_header()
 
                 self.scroll_position -= 1  # 1px/frame, same as Cubs facts scroll
@@ -89,9 +89,19 @@ class WeatherDisplay:
         self._last_condition: str | None = None
         self._last_mode: str | None = None  # Track which display mode we're in
         self._last_time_period: str | None = None  # Track time period for animation resets
+        # Local sunrise/sunset as decimal hours with the weather data they
+        # came from (None when the data has no sun times)
+        self._sun_hours: tuple[dict, tuple[float, float] | None] | None = None
 
         # Cache the current background for efficient redraws
-        self._background_cache: list[list[tuple[int, int, int]]] | None = None
+        self._background_cache: Image.Image | None = None
+        # Forecast screen gradient, built on first use
+        self._forecast_bg: Image.Image | None = None
+        # Daily forecast rows with the forecast data and local date they
+        # were built from
+        self._forecast_rows: tuple[dict, str, list[dict]] | None = None
+        # Forecast icons by condition, loaded and sized once (None = missing)
+        self._forecast_icons: dict[str, Image.Image | None] = {}
 
         # Geocoded home location: (zip_code, lat, lon, city). Cached per
         # process so the geocoder is hit once per boot, not per refresh.
@@ -103,7 +113,7 @@ class WeatherDisplay:
         try:
             with open(config_path, 'r') as f:
                 return json.load(f)
-        except:
+        except (OSError, ValueError):
             return {}
 
     def _geocode_zip(self, zip_code):
@@ -247,17 +257,18 @@ class WeatherDisplay:
 
         print(f"Weather display completed after {frame_count} frames")
 
-    def _get_time_period(self, hour):
-        """Determine the time period (dawn/day/dusk/night) for current conditions"""
+    def _sun_hour_decimals(self):
+        """(sunrise, sunset) as local decimal hours, converted once per
+        weather update instead of every animation frame; None when the
+        data has no sun times"""
+        cached = self._sun_hours
+        if cached is not None and cached[0] is self.weather_data:
+            return cached[1]
+
         # Get sunrise and sunset times from weather data
         sunrise_timestamp = self.weather_data.get('sys', {}).get('sunrise', 0)
         sunset_timestamp = self.weather_data.get('sys', {}).get('sunset', 0)
-
-        # Convert to local hour with minutes as decimal for accurate comparison
-        current_time = pendulum.now()
-        current_hour_decimal = current_time.hour + (current_time.minute / 60.0)
-
-        # Determine time period based on actual sun position
+        hours = None
         if sunrise_timestamp and sunset_timestamp:
             # Convert UTC timestamps to local timezone
             local_tz = 'America/Chicago'  # Rochester, IL is in Central Time
@@ -265,11 +276,22 @@ class WeatherDisplay:
                 sunrise_timestamp, tz=local_tz)
             sunset_time = pendulum.from_timestamp(
                 sunset_timestamp, tz=local_tz)
+            hours = (sunrise_time.hour + (sunrise_time.minute / 60.0),
+                     sunset_time.hour + (sunset_time.minute / 60.0))
+        self._sun_hours = (self.weather_data, hours)
+        return hours
 
-            sunrise_hour_decimal = sunrise_time.hour + \
-                (sunrise_time.minute / 60.0)
-            sunset_hour_decimal = sunset_time.hour + \
-                (sunset_time.minute / 60.0)
+    def _get_time_period(self, hour, current_time=None):
+        """Determine the time period (dawn/day/dusk/night) for current conditions"""
+        # Convert to local hour with minutes as decimal for accurate comparison
+        if current_time is None:
+            current_time = pendulum.now()
+        current_hour_decimal = current_time.hour + (current_time.minute / 60.0)
+
+        # Determine time period based on actual sun position
+        sun_hours = self._sun_hour_decimals()
+        if sun_hours is not None:
+            sunrise_hour_decimal, sunset_hour_decimal = sun_hours
 
             # Dawn: 1 hour before sunrise to 30 minutes after sunrise
             dawn_start = sunrise_hour_decimal - 1
@@ -301,9 +323,10 @@ class WeatherDisplay:
 
     def _draw_current_weather_animated(self):
         """Draw current weather with animations (called each frame)"""
-        current_hour = pendulum.now().hour
+        now = pendulum.now()
+        current_hour = now.hour
         condition = self.weather_data['weather'][0]['main']
-        time_period = self._get_time_period(current_hour)
+        time_period = self._get_time_period(current_hour, now)
 
         # Check if we need to regenerate the background
         needs_background_redraw = (
@@ -342,33 +365,27 @@ class WeatherDisplay:
         self._draw_weather_text()
 
     def _generate_background_cache(self, hour, condition, time_period):
-        """Generate and cache the background gradient as a pixel array"""
+        """Generate and cache the background gradient as an image, one
+        full-width row fill per line"""
         top_color, bottom_color = self._get_gradient_colors(
             hour, condition, time_period)
         r1, g1, b1 = top_color
         r2, g2, b2 = bottom_color
 
-        # Create a 2D array to store the background
-        background = []
+        background = Image.new('RGB', (96, 48))
         for y in range(48):
-            row = []
             ratio = y / 48
             r = int(r1 + (r2 - r1) * ratio)
             g = int(g1 + (g2 - g1) * ratio)
             b = int(b1 + (b2 - b1) * ratio)
-            for x in range(96):
-                row.append((r, g, b))
-            background.append(row)
+            background.paste((r, g, b), (0, y, 96, y + 1))
 
         return background
 
     def _draw_cached_background(self):
-        """Draw the cached background to canvas"""
-        if self._background_cache:
-            for y in range(48):
-                for x in range(96):
-                    r, g, b = self._background_cache[y][x]
-                    self.manager.draw_pixel(x, y, r, g, b)
+        """Draw the cached background to canvas in one blit"""
+        if self._background_cache is not None:
+            self.manager.set_image(self._background_cache, 0, 0)
 
     def _draw_weather_text(self):
         """Draw all weather text elements"""
@@ -409,74 +426,58 @@ class WeatherDisplay:
         self.manager.draw_text(
             'micro', 64, 47, Colors.WHITE, f'HUM:{humidity}%')
 
+    # Sky gradients as (top_color, bottom_color) by condition and time
+    # period; any period other than dawn/day/dusk uses 'night'
+    SKY_GRADIENTS: dict[str, dict[str, tuple[RGBColor, RGBColor]]] = {
+        'Clear': {
+            'dawn': ((255, 180, 120), (255, 220, 180)),
+            'day': ((100, 180, 255), (150, 220, 255)),
+            'dusk': ((255, 120, 80), (120, 80, 150)),
+            'night': ((20, 30, 80), (10, 15, 40)),
+        },
+        'Clouds': {
+            'dawn': ((180, 170, 160), (200, 190, 180)),
+            'day': ((150, 160, 170), (180, 190, 200)),
+            'dusk': ((120, 100, 120), (90, 80, 100)),
+            'night': ((50, 55, 60), (30, 35, 40)),
+        },
+        'Rain': {
+            'dawn': ((90, 100, 110), (110, 120, 130)),
+            'day': ((80, 90, 105), (100, 110, 125)),
+            'dusk': ((70, 70, 90), (50, 50, 70)),
+            'night': ((40, 45, 55), (25, 30, 40)),
+        },
+        'Thunderstorm': {
+            'dawn': ((60, 60, 80), (50, 50, 70)),
+            'day': ((50, 55, 70), (60, 65, 80)),
+            'dusk': ((45, 40, 60), (35, 30, 50)),
+            'night': ((30, 30, 45), (15, 15, 30)),
+        },
+        # Darker backgrounds so white text and snowflakes are visible
+        'Snow': {
+            'dawn': ((80, 90, 110), (100, 110, 130)),
+            'day': ((60, 80, 120), (80, 100, 140)),
+            'dusk': ((50, 55, 80), (70, 75, 100)),
+            'night': ((25, 30, 50), (40, 45, 65)),
+        },
+        'Mist': {
+            'dawn': ((190, 190, 190), (210, 210, 210)),
+            'day': ((200, 200, 200), (220, 220, 220)),
+            'dusk': ((130, 135, 140), (150, 155, 160)),
+            'night': ((60, 65, 70), (45, 50, 55)),
+        },
+    }
+    # Conditions that share another condition's gradients
+    SKY_GRADIENT_ALIASES: dict[str, str] = {
+        'Drizzle': 'Rain', 'Fog': 'Mist', 'Haze': 'Mist', 'Smoke': 'Mist',
+    }
+
     def _get_gradient_colors(self, hour, condition, time_period):
         """Get the gradient colors for current time and condition"""
-        # Return tuple of (top_color, bottom_color)
-        if condition == 'Clear':
-            if time_period == 'dawn':
-                return ((255, 180, 120), (255, 220, 180))
-            elif time_period == 'day':
-                return ((100, 180, 255), (150, 220, 255))
-            elif time_period == 'dusk':
-                return ((255, 120, 80), (120, 80, 150))
-            else:
-                return ((20, 30, 80), (10, 15, 40))
-        elif condition == 'Clouds':
-            if time_period == 'dawn':
-                return ((180, 170, 160), (200, 190, 180))
-            elif time_period == 'day':
-                return ((150, 160, 170), (180, 190, 200))
-            elif time_period == 'dusk':
-                return ((120, 100, 120), (90, 80, 100))
-            else:
-                return ((50, 55, 60), (30, 35, 40))
-        elif condition in ['Rain', 'Drizzle']:
-            if time_period == 'dawn':
-                return ((90, 100, 110), (110, 120, 130))
-            elif time_period == 'day':
-                return ((80, 90, 105), (100, 110, 125))
-            elif time_period == 'dusk':
-                return ((70, 70, 90), (50, 50, 70))
-            else:
-                return ((40, 45, 55), (25, 30, 40))
-        elif condition == 'Thunderstorm':
-            if time_period == 'dawn':
-                return ((60, 60, 80), (50, 50, 70))
-            elif time_period == 'day':
-                return ((50, 55, 70), (60, 65, 80))
-            elif time_period == 'dusk':
-                return ((45, 40, 60), (35, 30, 50))
-            else:
-                return ((30, 30, 45), (15, 15, 30))
-        elif condition == 'Snow':
-            # Darker backgrounds so white text and snowflakes are visible
-            if time_period == 'dawn':
-                return ((80, 90, 110), (100, 110, 130))
-            elif time_period == 'day':
-                return ((60, 80, 120), (80, 100, 140))
-            elif time_period == 'dusk':
-                return ((50, 55, 80), (70, 75, 100))
-            else:
-                return ((25, 30, 50), (40, 45, 65))
-        elif condition in ['Mist', 'Fog', 'Haze', 'Smoke']:
-            if time_period == 'dawn':
-                return ((190, 190, 190), (210, 210, 210))
-            elif time_period == 'day':
-                return ((200, 200, 200), (220, 220, 220))
-            elif time_period == 'dusk':
-                return ((130, 135, 140), (150, 155, 160))
-            else:
-                return ((60, 65, 70), (45, 50, 55))
-        else:
-            # Fallback to Clear
-            if time_period == 'dawn':
-                return ((255, 180, 120), (255, 220, 180))
-            elif time_period == 'day':
-                return ((100, 180, 255), (150, 220, 255))
-            elif time_period == 'dusk':
-                return ((255, 120, 80), (120, 80, 150))
-            else:
-                return ((20, 30, 80), (10, 15, 40))
+        condition = self.SKY_GRADIENT_ALIASES.get(condition, condition)
+        # Unknown conditions fall back to Clear
+        periods = self.SKY_GRADIENTS.get(condition, self.SKY_GRADIENTS['Clear'])
+        return periods.get(time_period, periods['night'])
 
     def _get_weather_icon_filename(self, condition):
         """Get the filename for weather icon PNG"""
@@ -514,6 +515,30 @@ class WeatherDisplay:
             print(f"Error loading weather icon {icon_path}: {e}")
             return None
 
+    def _forecast_icon(self, condition):
+        """Weather icon for a forecast row, at most 10x10. The forecast
+        redraws every frame, so each icon is read and resized once."""
+        if condition not in self._forecast_icons:
+            icon = self._load_weather_icon(condition)
+            # Resize icon if it's too large (max 10x10 for the forecast display)
+            max_size = 10
+            if icon and (icon.width > max_size or icon.height > max_size):
+                icon = icon.resize((max_size, max_size), Image.LANCZOS)
+            self._forecast_icons[condition] = icon
+        return self._forecast_icons[condition]
+
+    def _daily_forecasts(self):
+        """The forecast rows, rebuilt only when the forecast data or the
+        local date changes rather than re-parsing every reading's
+        timestamp on each redraw"""
+        today = pendulum.now().format('YYYY-MM-DD')
+        cached = self._forecast_rows
+        if (cached is None or cached[0] is not self.forecast_data
+                or cached[1] != today):
+            cached = self._forecast_rows = (
+                self.forecast_data, today, self._build_daily_forecasts())
+        return cached[2]
+
     def _build_daily_forecasts(self):
         """Bucket hourly forecast readings into the next 3 local-time days"""
         local_tz = pendulum.now().timezone
@@ -573,21 +598,26 @@ class WeatherDisplay:
 
         return forecasts
 
-    def _draw_forecast(self):
-        """Draw professional forecast information"""
-        import traceback
-
-        # Clear canvas
-        self.manager.clear_canvas()
-
-        # Create gradient background (darker blue at top, lighter at bottom)
+    @staticmethod
+    def _forecast_gradient():
+        """The forecast screen's fixed blue gradient, one row fill per line"""
+        img = Image.new('RGB', (96, 48))
         for y in range(48):
             ratio = y / 48
             r = int(10 + (30 * ratio))
             g = int(40 + (80 * ratio))
             b = int(80 + (120 * ratio))
-            for x in range(96):
-                self.manager.draw_pixel(x, y, r, g, b)
+            img.paste((r, g, b), (0, y, 96, y + 1))
+        return img
+
+    def _draw_forecast(self):
+        """Draw professional forecast information"""
+        import traceback
+
+        # Gradient background (darker blue at top, lighter at bottom)
+        if self._forecast_bg is None:
+            self._forecast_bg = self._forecast_gradient()
+        self.manager.set_image(self._forecast_bg, 0, 0)
 
         # Mark that we're in forecast mode
         self._last_mode = 'forecast'
@@ -598,14 +628,13 @@ class WeatherDisplay:
             'tiny_bold', 14, 6, Colors.WHITE, '3-DAY FORECAST')
 
         # Draw title underline
-        for x in range(0, 96):
-            self.manager.draw_pixel(x, 7, 80, 130, 180)
+        self.manager.fill_rect(0, 7, 96, 8, (80, 130, 180))
 
         if not self.forecast_data:
             return
 
         try:
-            forecasts = self._build_daily_forecasts()
+            forecasts = self._daily_forecasts()
 
             # Draw column headers
             self.manager.draw_text('micro', 4, 15, Colors.BRIGHT_YELLOW, 'DAY')
@@ -617,8 +646,7 @@ class WeatherDisplay:
                 'micro', 72, 15, Colors.BRIGHT_YELLOW, 'COND')
 
             # Draw divider line under headers
-            for x in range(0, 96):
-                self.manager.draw_pixel(x, 16, 100, 150, 200)
+            self.manager.fill_rect(0, 16, 96, 17, (100, 150, 200))
 
             # Draw forecasts with alternating subtle backgrounds
             y_pos = 25
@@ -634,15 +662,14 @@ class WeatherDisplay:
                         r = int(10 + (30 * ratio) + 15)  # Slightly lighter
                         g = int(40 + (80 * ratio) + 15)
                         b = int(80 + (120 * ratio) + 15)
-                        for x in range(2, 94):
-                            self.manager.draw_pixel(x, y, r, g, b)
+                        self.manager.fill_rect(2, y, 94, y + 1, (r, g, b))
 
                 # Day name (bold white)
                 self.manager.draw_text(
                     'tiny_bold', 4, y_pos, Colors.WHITE, forecast['day'])
 
                 # Weather icon PNG (if available)
-                weather_icon = self._load_weather_icon(forecast['condition'])
+                weather_icon = self._forecast_icon(forecast['condition'])
                 if weather_icon:
                     # Position the icon (adjust size if needed - assuming 10x10 or smaller)
                     icon_x = 19
@@ -667,13 +694,6 @@ class WeatherDisplay:
                         icon_x += 1
                         icon_y -= 1
 
-                    # Resize icon if it's too large (max 10x10 for the forecast display)
-                    icon_width, icon_height = weather_icon.size
-                    max_size = 10
-                    if icon_width > max_size or icon_height > max_size:
-                        weather_icon = weather_icon.resize(
-                            (max_size, max_size), Image.LANCZOS)
-
                     # Draw the icon pixel by pixel with transparency support
                     try:
                         # Get the background color at this position
@@ -754,8 +774,7 @@ class WeatherDisplay:
                 y_pos += 10
 
             # Draw bottom accent line
-            for x in range(2, 94):
-                self.manager.draw_pixel(x, 47, 80, 130, 180)
+            self.manager.fill_rect(2, 47, 94, 48, (80, 130, 180))
 
         except Exception as e:
             print(f"Error drawing forecast: {e}")
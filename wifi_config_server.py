@@ -31,7 +31,7 @@ def get_connection_mode():
         if result.stdout.strip():
             return 'Connected to WiFi'
         return 'Access Point Mode'
-    except:
+    except (OSError, subprocess.SubprocessError):
         return 'Unknown'
 
 
@@ -125,7 +125,7 @@ def get_current_network():
         result = subprocess.run(
             ['iwgetid', '-r'], capture_output=True, text=True, timeout=10)
         return result.stdout.strip() or 'Not connected'
-    except:
+    except (OSError, subprocess.SubprocessError):
         return 'Unknown'
 
 
@@ -135,7 +135,7 @@ def get_ip_address():
         result = subprocess.run(
             ['hostname', '-I'], capture_output=True, text=True, timeout=10)
         return result.stdout.strip().split()[0] if result.stdout.strip() else 'No IP'
-    except:
+    except (OSError, subprocess.SubprocessError):
         return 'Unknown'
 
 
@@ -1830,7 +1830,7 @@ def _parse_iwlist(output):
                 signal_strength = int((int(num) / int(den)) * 100)
                 bars = '█' * (signal_strength // 20)
                 current_network['signal'] = f"{bars} {signal_strength}%"
-            except:
+            except (IndexError, ValueError, ZeroDivisionError):
                 current_network['signal'] = 'Unknown'
 
     # Remove duplicates